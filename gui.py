@@ -9,8 +9,10 @@ import threading
 import queue
 import sys
 import os
+import shutil
 from pathlib import Path
 import configparser
+from concurrent.futures import ThreadPoolExecutor
 
 # Import bot modules
 import discord
@@ -75,6 +77,10 @@ class BotGUI:
         self.bot_thread = None
         self.bot_running = False
         self.config = None
+        self.reczone_manager = None  # Owns the shared StatsManager while the bot runs
+        self.stats_executor = None  # Worker for offline stats rebuilds (bot stopped)
+        self.recalc_future = None  # In-flight stats rebuild
+        self.stats_changed = threading.Event()  # Set by the StatsManager change listener
         
         # Queue for console output
         self.console_queue = queue.Queue()
@@ -467,47 +473,36 @@ class BotGUI:
     def refresh_ocr_stats(self):
         """Refresh OCR stats display"""
         try:
-            # Get path to stats file
-            if getattr(sys, 'frozen', False):
-                application_path = Path(sys.executable).parent
+            if self.reczone_manager:
+                # Bot running - render from the live in-memory snapshot (no disk I/O)
+                stats_manager = self.reczone_manager.stats_manager
+                snapshot = stats_manager.snapshot()
+                if snapshot is None or snapshot.version != stats_manager.data_version:
+                    # A rebuild holds the lock, so this is the previous snapshot (or none yet) -
+                    # retry on the next tick until the current version can be read
+                    self.stats_changed.set()
+                if snapshot is None:
+                    return
+                players = snapshot.overall
             else:
-                application_path = Path(__file__).parent
-            
-            stats_file = application_path / "ocr" / "stats_data.json"
-            
-            if stats_file.exists():
-                import json
-                with open(stats_file, 'r') as f:
-                    stats = json.load(f)
-                
-                # Calculate summary
-                total_players = len(stats)
-                total_games = sum(p['games_played'] for p in stats.values())
-                total_wins = sum(p['wins'] for p in stats.values())
-                
-                # Get top player by wins
-                if stats:
-                    top_player = max(stats.items(), key=lambda x: x[1]['wins'])
-                    top_name = top_player[1]['display_name']
-                    top_wins = top_player[1]['wins']
+                # Bot offline - fall back to the last stats snapshot on disk
+                if getattr(sys, 'frozen', False):
+                    application_path = Path(sys.executable).parent
                 else:
-                    top_name = "N/A"
-                    top_wins = 0
+                    application_path = Path(__file__).parent
                 
-                # Format stats text
-                stats_text = f"Players Tracked: {total_players}\n"
-                stats_text += f"Total Games: {total_games}\n"
-                stats_text += f"Total Victories: {total_wins}\n"
-                stats_text += f"Top Player: {top_name} ({top_wins} wins)\n"
-                stats_text += f"\nUse buttons below to view leaderboards"
-                
-                # Update display
-                self.stats_text.config(state=tk.NORMAL)
-                self.stats_text.delete(1.0, tk.END)
-                self.stats_text.insert(1.0, stats_text)
-                self.stats_text.config(state=tk.DISABLED)
-                
-                self.log_message("✓ OCR stats refreshed", self.success_color)
+                stats_file = application_path / "ocr" / "stats_data.json"
+                if not stats_file.exists():
+                    players = None
+                else:
+                    import json
+                    with open(stats_file, 'r') as f:
+                        data = json.load(f)
+                    # Players are nested under overall/duos/squads (old files kept them at the top level)
+                    players = data.get('overall', {}) if 'overall' in data else data
+            
+            if players is not None:
+                self._render_ocr_stats(players)
             else:
                 # No stats yet
                 self.stats_text.config(state=tk.NORMAL)
@@ -522,6 +517,42 @@ class BotGUI:
             self.stats_text.config(state=tk.DISABLED)
             self.log_message(f"✗ Error refreshing stats: {e}", self.error_color)
     
+    def _render_ocr_stats(self, players):
+        """
+        Render the stats summary box
+        
+        Args:
+            players: Overall stats per player ({name_key: stats_dict})
+        """
+        total_games = sum(p['games_played'] for p in players.values())
+        total_wins = sum(p['wins'] for p in players.values())
+        
+        # Get top player by wins
+        if players:
+            top_player = max(players.values(), key=lambda p: p['wins'])
+            top_name = top_player['display_name']
+            top_wins = top_player['wins']
+        else:
+            top_name = "N/A"
+            top_wins = 0
+        
+        # Format stats text
+        stats_text = f"Players Tracked: {len(players)}\n"
+        stats_text += f"Total Games: {total_games}\n"
+        stats_text += f"Total Victories: {total_wins}\n"
+        stats_text += f"Top Player: {top_name} ({top_wins} wins)\n"
+        stats_text += f"\nUse buttons below to view leaderboards"
+        
+        # Update display
+        self.stats_text.config(state=tk.NORMAL)
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(1.0, stats_text)
+        self.stats_text.config(state=tk.DISABLED)
+    
+    def _on_stats_changed(self, version):
+        """StatsManager change listener - runs on the bot/worker thread, so only flag the change"""
+        self.stats_changed.set()
+    
     def log_message(self, message, color=None):
         """Add message to console"""
         self.console.config(state=tk.NORMAL)
@@ -555,6 +586,11 @@ class BotGUI:
         except queue.Empty:
             pass
         
+        # Re-render the stats box when the live StatsManager reported a change
+        if self.stats_changed.is_set():
+            self.stats_changed.clear()
+            self.refresh_ocr_stats()
+        
         # Schedule next update
         self.root.after(100, self.update_console)
     
@@ -623,6 +659,9 @@ class BotGUI:
             # Initialize RecZone manager for OCR
             from ocr.reczone import RecZoneManager
             reczone_manager = RecZoneManager(self.bot, config_path=str(config_path))
+            self.reczone_manager = reczone_manager
+            reczone_manager.stats_manager.add_change_listener(self._on_stats_changed)
+            self.stats_changed.set()
             
             # Initialize Music Bot manager
             import musicbot
@@ -776,6 +815,7 @@ class BotGUI:
                 asyncio.run_coroutine_threadsafe(self.bot.close(), self.bot.loop)
             
             self.bot_running = False
+            self.reczone_manager = None
             self.start_button.config(state=tk.NORMAL)
             self.stop_button.config(state=tk.DISABLED)
             self.status_label.config(text="● Offline", fg=self.error_color)
@@ -1022,20 +1062,51 @@ class BotGUI:
             self.log_message("Stats recalculation cancelled", self.accent_color)
             return
         
+        if self.recalc_future is not None and not self.recalc_future.done():
+            self.log_message("⚠ Stats recalculation already in progress", self.error_color)
+            return
+        
         try:
-            # Get path to files
-            if getattr(sys, 'frozen', False):
-                application_path = Path(sys.executable).parent
+            self.log_message("🔧 Recalculating stats from screenshot log...", self.admin_color)
+            
+            if self.bot_running and self.bot and self.reczone_manager:
+                # Rebuild the bot's own StatsManager on the bot loop, so it can't be clobbered
+                import asyncio
+                self.recalc_future = asyncio.run_coroutine_threadsafe(
+                    self.reczone_manager.recalculate_stats(), self.bot.loop
+                )
             else:
-                application_path = Path(__file__).parent
+                # Bot offline - nothing else holds the stats, rebuild from disk on a worker thread
+                if self.stats_executor is None:
+                    self.stats_executor = ThreadPoolExecutor(max_workers=1)
+                self.recalc_future = self.stats_executor.submit(self._recalculate_offline)
             
-            # Import and create StatsManager
-            from ocr.stats_manager import StatsManager
-            stats_manager = StatsManager(data_file=str(application_path / "ocr" / "stats_data.json"))
+            self.root.after(200, self._check_recalculation)
             
-            # Recalculate
-            self.log_message("🔧 Recalculating stats from screenshot log...", self.admin_color)
-            success, message, player_count = stats_manager.recalculate_all_stats_from_log()
+        except Exception as e:
+            self.log_message(f"✗ Error recalculating stats: {e}", self.error_color)
+            messagebox.showerror("Error", f"Failed to recalculate stats:\n{str(e)}")
+    
+    def _recalculate_offline(self):
+        """Rebuild stats from the files on disk (runs on the stats worker thread)"""
+        # Get path to files
+        if getattr(sys, 'frozen', False):
+            application_path = Path(sys.executable).parent
+        else:
+            application_path = Path(__file__).parent
+        
+        from ocr.stats_manager import StatsManager
+        stats_manager = StatsManager(data_file=str(application_path / "ocr" / "stats_data.json"))
+        return stats_manager.recalculate_all_stats_from_log()
+    
+    def _check_recalculation(self):
+        """Poll the in-flight rebuild from the Tk thread and report the result when done"""
+        if not self.recalc_future.done():
+            self.root.after(200, self._check_recalculation)
+            return
+        
+        try:
+            success, message, player_count = self.recalc_future.result()
             
             if success:
                 self.log_message(f"✓ {message}", self.success_color)
@@ -1070,40 +1141,99 @@ class BotGUI:
             self.log_message("Database rebuild cancelled", self.accent_color)
             return
         
+        if self.recalc_future is not None and not self.recalc_future.done():
+            self.log_message("⚠ Stats rebuild already in progress", self.error_color)
+            return
+        
         try:
-            # Get path to stats file
-            if getattr(sys, 'frozen', False):
-                application_path = Path(sys.executable).parent
-            else:
-                application_path = Path(__file__).parent
-            
-            stats_file = application_path / "ocr" / "stats_data.json"
-            
-            # Delete existing stats file
-            if stats_file.exists():
-                stats_file.unlink()
-                self.log_message("✓ Deleted existing stats database", self.success_color)
-            
-            # Delete screenshot log as well
-            screenshot_log_file = application_path / "ocr" / "screenshot_log.json"
-            if screenshot_log_file.exists():
-                screenshot_log_file.unlink()
-                self.log_message("✓ Deleted screenshot log", self.success_color)
-            
-            # Update display
-            self.stats_text.config(state=tk.NORMAL)
-            self.stats_text.delete(1.0, tk.END)
-            self.stats_text.insert(1.0, "Database cleared!\n\nPost new victory screenshots\nto the RecZone channel.\n\nThe bot will automatically\nprocess them and rebuild stats.")
-            self.stats_text.config(state=tk.DISABLED)
-            
-            self.log_message("✓ Database rebuild complete - ready for new screenshots", self.success_color)
+            if self.bot_running and self.bot and self.reczone_manager:
+                # The bot holds the stats in memory: reset them on the bot loop under its
+                # stats lock, or its next save would write the deleted data back
+                import asyncio
+                self.recalc_future = asyncio.run_coroutine_threadsafe(
+                    self.reczone_manager.reset_stats(), self.bot.loop
+                )
+                self.root.after(200, self._check_database_reset)
+                return
             
-            # Refresh stats display
-            self.refresh_ocr_stats()
+            # Bot offline - nothing else holds the stats, delete the files directly
+            self._delete_stats_files()
+            self._finish_database_reset()
+        
+        except Exception as e:
+            self.log_message(f"✗ Error rebuilding database: {e}", self.error_color)
+            messagebox.showerror("Error", f"Failed to rebuild database:\n{str(e)}")
+    
+    def _delete_stats_files(self):
+        """Delete the stats files on disk (only while the bot is stopped)"""
+        # Get path to stats file
+        if getattr(sys, 'frozen', False):
+            application_path = Path(sys.executable).parent
+        else:
+            application_path = Path(__file__).parent
+        
+        stats_file = application_path / "ocr" / "stats_data.json"
+        
+        # Delete existing stats file
+        if stats_file.exists():
+            stats_file.unlink()
+            self.log_message("✓ Deleted existing stats database", self.success_color)
+        
+        # Delete screenshot log as well
+        screenshot_log_file = application_path / "ocr" / "screenshot_log.json"
+        if screenshot_log_file.exists():
+            screenshot_log_file.unlink()
+            self.log_message("✓ Deleted screenshot log", self.success_color)
+        
+        # And the match event log, or its tail would be replayed on next startup
+        match_events_file = application_path / "ocr" / "match_events.jsonl"
+        if match_events_file.exists():
+            match_events_file.unlink()
+        
+        # Archived matches would otherwise still count as already processed
+        archive_dir = application_path / "ocr" / "archive"
+        if archive_dir.exists():
+            shutil.rmtree(archive_dir)
+            self.log_message("✓ Deleted match archive", self.success_color)
+        
+        # Learned name merges belong to the deleted history too
+        aliases_file = application_path / "ocr" / "name_aliases.json"
+        if aliases_file.exists():
+            aliases_file.unlink()
+            self.log_message("✓ Deleted player name aliases", self.success_color)
+    
+    def _check_database_reset(self):
+        """Poll the bot's in-flight stats reset from the Tk thread and report the result when done"""
+        if not self.recalc_future.done():
+            self.root.after(200, self._check_database_reset)
+            return
+        
+        try:
+            success, message = self.recalc_future.result()
+            if not success:
+                self.log_message(f"✗ {message}", self.error_color)
+                messagebox.showerror("Rebuild Failed", message)
+                return
             
+            self.log_message(f"✓ {message}", self.success_color)
+            self._finish_database_reset()
+        
         except Exception as e:
             self.log_message(f"✗ Error rebuilding database: {e}", self.error_color)
             messagebox.showerror("Error", f"Failed to rebuild database:\n{str(e)}")
+    
+    def _finish_database_reset(self):
+        """Show the cleared database in the stats panel"""
+        # Update display
+        self.stats_text.config(state=tk.NORMAL)
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(1.0, "Database cleared!\n\nPost new victory screenshots\nto the RecZone channel.\n\nThe bot will automatically\nprocess them and rebuild stats.")
+        self.stats_text.config(state=tk.DISABLED)
+        
+        self.log_message("✓ Database rebuild complete - ready for new screenshots", self.success_color)
+        
+        # Refresh stats display
+        self.refresh_ocr_stats()
 
 
 def main():
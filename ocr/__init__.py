@@ -1,9 +1,19 @@
 """
 OCR module for parsing Battle Royale Squads victory screenshots
 and tracking player statistics.
-"""
 
-from .parser import OCRParser
-from .stats_manager import StatsManager
+OCRParser and StatsManager are imported on first use, so dependency-free modules
+(e.g. ocr.number_tokenizer) can be imported without EasyOCR/OpenCV installed.
+"""
 
 __all__ = ['OCRParser', 'StatsManager']
+
+
+def __getattr__(name):
+    if name == 'OCRParser':
+        from .parser import OCRParser
+        return OCRParser
+    if name == 'StatsManager':
+        from .stats_manager import StatsManager
+        return StatsManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
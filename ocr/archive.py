@@ -0,0 +1,160 @@
+"""
+Compressed archival segments for old screenshot log entries
+Matches older than the retention age are moved out of screenshot_log.json into
+immutable gzipped segment files. A small index keeps the archived keys so duplicate
+screenshots are still recognised; the segments themselves are only read during
+full stats recalculations and when an archived screenshot is deleted (its key is
+then listed as removed in the index, so the segments never change).
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+
+
+class ScreenshotArchive:
+    """Immutable gzipped JSON segments of archived screenshot log entries"""
+
+    def __init__(self, archive_dir='ocr/archive'):
+        """
+        Initialize the archive
+
+        Args:
+            archive_dir: Directory holding the segment files and index.json
+        """
+        self.archive_dir = archive_dir
+        self.index_file = os.path.join(archive_dir, 'index.json')
+        self.segments = []          # [{'file', 'count', 'first_day', 'last_day', 'created_at'}]
+        self.archived_keys = set()  # Screenshot log keys stored in any segment
+        self.removed_keys = set()   # Keys still in a segment whose screenshot was deleted
+        self.load_index()
+
+    def load_index(self):
+        """Load the segment index from JSON file"""
+        if not os.path.exists(self.index_file):
+            return
+
+        try:
+            with open(self.index_file, 'r') as f:
+                index = json.load(f)
+            self.segments = index.get('segments', [])
+            self.archived_keys = set(index.get('archived_keys', []))
+            self.removed_keys = set(index.get('removed_keys', []))
+            print(f"Loaded archive index: {len(self.archived_keys)} matches in {len(self.segments)} segment(s)")
+        except Exception as e:
+            print(f"Error loading archive index: {e}")
+            self.segments = []
+            self.archived_keys = set()
+            self.removed_keys = set()
+
+    def _save_index(self):
+        """Write the index atomically (temp file + replace)"""
+        index = {
+            'segments': self.segments,
+            'archived_keys': sorted(self.archived_keys),
+            'removed_keys': sorted(self.removed_keys)
+        }
+        temp_path = self.index_file + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(index, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.index_file)
+
+    def __contains__(self, log_key):
+        return log_key in self.archived_keys
+
+    def __len__(self):
+        return len(self.archived_keys)
+
+    def write_segment(self, entries, first_day=None, last_day=None):
+        """
+        Store entries as a new immutable segment and add it to the index
+
+        Args:
+            entries: {log_key: log_entry} to archive
+            first_day: Earliest match day in the segment (date ordinal, informational)
+            last_day: Latest match day in the segment (date ordinal, informational)
+
+        Returns:
+            str: Segment filename
+        """
+        os.makedirs(self.archive_dir, exist_ok=True)
+
+        created_at = datetime.now()
+        filename = f"segment_{created_at.strftime('%Y%m%d_%H%M%S_%f')}.json.gz"
+        path = os.path.join(self.archive_dir, filename)
+
+        # Segment is complete on disk before the index references it
+        with gzip.open(path + '.tmp', 'wt', encoding='utf-8') as f:
+            json.dump(entries, f, separators=(',', ':'))
+        os.replace(path + '.tmp', path)
+
+        self.segments.append({
+            'file': filename,
+            'count': len(entries),
+            'first_day': first_day,
+            'last_day': last_day,
+            'created_at': created_at.isoformat()
+        })
+        self.archived_keys.update(entries)
+        self._save_index()
+        return filename
+
+    def clear(self):
+        """Delete every segment and the index (database reset)"""
+        for segment in self.segments:
+            path = os.path.join(self.archive_dir, segment['file'])
+            if os.path.exists(path):
+                os.remove(path)
+        if os.path.exists(self.index_file):
+            os.remove(self.index_file)
+        self.segments = []
+        self.archived_keys = set()
+        self.removed_keys = set()
+
+    def keys_for_message(self, message_id):
+        """Archived keys of a Discord message's screenshots ("<message_id>_<attachment_id>")"""
+        prefix = f"{message_id}_"
+        return sorted(key for key in self.archived_keys if key.startswith(prefix))
+
+    def get(self, log_key):
+        """
+        Read one archived entry (scans the segments, so only for rare lookups)
+
+        Returns:
+            dict: The log entry, or None if the key isn't archived
+        """
+        if log_key not in self.archived_keys:
+            return None
+        for key, log_entry in self.iter_entries():
+            if key == log_key:
+                return log_entry
+        return None
+
+    def remove(self, log_key):
+        """Mark an archived entry as deleted; it is skipped from then on"""
+        self.archived_keys.discard(log_key)
+        self.removed_keys.add(log_key)
+        self._save_index()
+
+    def iter_entries(self):
+        """
+        Iterate over every archived entry, one segment in memory at a time
+        (entries removed with remove() are skipped)
+
+        Yields:
+            tuple: (log_key, log_entry)
+        """
+        for segment in self.segments:
+            path = os.path.join(self.archive_dir, segment['file'])
+            try:
+                with gzip.open(path, 'rt', encoding='utf-8') as f:
+                    entries = json.load(f)
+            except Exception as e:
+                print(f"Error reading archive segment {segment['file']}: {e}")
+                continue
+            for log_key, log_entry in entries.items():
+                if log_key not in self.removed_keys:
+                    yield log_key, log_entry
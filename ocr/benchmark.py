@@ -0,0 +1,290 @@
+"""
+OCR benchmark harness
+Runs OCRParser over a directory of labeled screenshots and reports per-stage
+latency percentiles, throughput, peak RSS and field-level accuracy, and writes a
+JSON report so parser changes can be compared run over run.
+
+Corpus layout: each screenshot has a ground-truth sidecar with the same stem
+(e.g. match_001.png + match_001.json), or the directory holds a single
+ground_truth.json mapping filenames to ground truth. Ground truth uses the
+parser's output format; fields that are left out are not scored:
+
+    {
+      "victory": true,
+      "game_mode": "squads",
+      "match_time": 21.08,
+      "players": [{"name": "Dill", "score": 14425, "kills": 12, "deaths": 0, "assists": 0}]
+    }
+
+Usage (from the project root):
+    python -m ocr.benchmark path/to/corpus --output report.json --baseline last_report.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp')
+PLAYER_FIELDS = ('name', 'score', 'kills', 'deaths', 'assists')
+MATCH_TIME_TOLERANCE = 0.02  # Minutes (rounding of seconds)
+PERCENTILES = (50, 90, 95, 99)
+
+
+def load_corpus(corpus_dir):
+    """
+    Find labeled screenshots in a corpus directory
+
+    Returns:
+        list: (image path, ground truth dict) tuples sorted by filename
+    """
+    corpus = Path(corpus_dir)
+    shared = {}
+    shared_file = corpus / 'ground_truth.json'
+    if shared_file.exists():
+        with open(shared_file, 'r', encoding='utf-8') as f:
+            shared = json.load(f)
+
+    samples = []
+    for image_path in sorted(corpus.iterdir()):
+        if image_path.suffix.lower() not in IMAGE_EXTENSIONS:
+            continue
+        truth = shared.get(image_path.name)
+        sidecar = image_path.with_suffix('.json')
+        if truth is None and sidecar.exists():
+            with open(sidecar, 'r', encoding='utf-8') as f:
+                truth = json.load(f)
+        # Other JSON next to images (e.g. a zone schema) isn't ground truth
+        if isinstance(truth, dict) and ('players' in truth or 'victory' in truth):
+            samples.append((image_path, truth))
+    return samples
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize_ns(samples_ns):
+    """Latency summary in milliseconds (mean, percentiles, max)"""
+    values = sorted(samples_ns)
+    if not values:
+        return {}
+    summary = {'count': len(values), 'mean': sum(values) / len(values) / 1e6}
+    for q in PERCENTILES:
+        summary[f'p{q}'] = percentile(values, q) / 1e6
+    summary['max'] = values[-1] / 1e6
+    return summary
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None if it can't be measured)"""
+    if sys.platform == 'win32':
+        # No resource module on Windows; psutil reports the peak working set there
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+        except ImportError:
+            return None
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def score_result(result, truth):
+    """
+    Compare one parse result with its ground truth
+
+    Returns:
+        dict: field -> [correct, total] counts for this image
+    """
+    counts = {}
+
+    def check(field, correct):
+        entry = counts.setdefault(field, [0, 0])
+        entry[0] += int(bool(correct))
+        entry[1] += 1
+
+    if 'victory' in truth:
+        check('victory', (result is not None) == bool(truth['victory']))
+    if result is None:
+        result = {'players': []}
+
+    if 'game_mode' in truth:
+        check('game_mode', result.get('game_mode') == truth['game_mode'])
+    if 'match_time' in truth:
+        check('match_time', abs(result.get('match_time', 0) - truth['match_time']) <= MATCH_TIME_TOLERANCE)
+
+    parsed_players = result.get('players', [])
+    for slot, expected in enumerate(truth.get('players', [])):
+        parsed = parsed_players[slot] if slot < len(parsed_players) else {}
+        for field in PLAYER_FIELDS:
+            if field not in expected:
+                continue
+            if field == 'name':
+                check(field, str(parsed.get('name', '')).lower() == str(expected['name']).lower())
+            else:
+                check(field, parsed.get(field) == expected[field])
+        if 'playtime_minutes' in expected:
+            check('playtime_minutes', parsed.get('playtime_minutes') == expected['playtime_minutes'])
+    return counts
+
+
+async def run_benchmark(parser, samples, warmup=1, verbose=False):
+    """
+    Parse every sample and collect timings and accuracy
+
+    Args:
+        parser: OCRParser instance
+        samples: (image path, ground truth) tuples
+        warmup: Samples parsed first and left out of the statistics (model warm-up)
+        verbose: Show the parser's console output
+
+    Returns:
+        dict: Benchmark report
+    """
+    for image_path, _ in samples[:warmup]:
+        with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+            await parser.parse_screenshot(image_path.read_bytes())
+
+    stage_samples = {}
+    field_counts = {}
+    per_image = []
+    wall_start = time.perf_counter()
+
+    for image_path, truth in samples:
+        image_bytes = image_path.read_bytes()
+        with contextlib.redirect_stdout(sys.stdout if verbose else io.StringIO()):
+            result = await parser.parse_screenshot(image_bytes)
+        timings = dict(getattr(parser, 'last_timings', {}))
+
+        for stage, ns in timings.items():
+            stage_samples.setdefault(stage, []).append(ns)
+
+        counts = score_result(result, truth)
+        for field, (correct, total) in counts.items():
+            entry = field_counts.setdefault(field, [0, 0])
+            entry[0] += correct
+            entry[1] += total
+
+        correct = sum(c for c, _ in counts.values())
+        total = sum(t for _, t in counts.values())
+        per_image.append({
+            'image': image_path.name,
+            'parsed': result is not None,
+            'total_ms': timings.get('total', 0) / 1e6,
+            'correct_fields': correct,
+            'total_fields': total,
+        })
+        print(f"  {image_path.name}: {timings.get('total', 0) / 1e6:8.1f} ms  {correct}/{total} fields")
+
+    wall_seconds = time.perf_counter() - wall_start
+    correct = sum(c for c, _ in field_counts.values())
+    total = sum(t for _, t in field_counts.values())
+
+    return {
+        'images': len(samples),
+        'wall_seconds': wall_seconds,
+        'throughput_images_per_sec': len(samples) / wall_seconds if wall_seconds else None,
+        'latency_ms': {stage: summarize_ns(values) for stage, values in stage_samples.items()},
+        'peak_rss_mb': peak_rss_mb(),
+        'accuracy': {
+            field: {'correct': c, 'total': t, 'rate': c / t if t else None}
+            for field, (c, t) in sorted(field_counts.items())
+        },
+        'field_accuracy': correct / total if total else None,
+        'per_image': per_image,
+    }
+
+
+def compare_reports(report, baseline):
+    """Print headline metric changes against a previous report"""
+    def delta(label, new, old, unit='', lower_is_better=False):
+        if new is None or old is None:
+            return
+        change = new - old
+        better = change < 0 if lower_is_better else change > 0
+        marker = '✓' if better else ('✗' if change else '=')
+        print(f"  {marker} {label}: {old:.3f}{unit} -> {new:.3f}{unit} ({change:+.3f}{unit})")
+
+    print("\nCompared with baseline:")
+    delta('field accuracy', report.get('field_accuracy'), baseline.get('field_accuracy'))
+    delta('throughput', report.get('throughput_images_per_sec'), baseline.get('throughput_images_per_sec'), ' img/s')
+    for stage, summary in report.get('latency_ms', {}).items():
+        old = baseline.get('latency_ms', {}).get(stage, {})
+        delta(f'{stage} p50', summary.get('p50'), old.get('p50'), ' ms', lower_is_better=True)
+        delta(f'{stage} p95', summary.get('p95'), old.get('p95'), ' ms', lower_is_better=True)
+    delta('peak RSS', report.get('peak_rss_mb'), baseline.get('peak_rss_mb'), ' MB', lower_is_better=True)
+
+
+def main(argv=None):
+    """Command line entry point"""
+    arg_parser = argparse.ArgumentParser(prog='python -m ocr.benchmark', description='Benchmark OCRParser on a labeled screenshot corpus')
+    arg_parser.add_argument('corpus', help='Directory of screenshots with ground-truth JSON')
+    arg_parser.add_argument('--output', default='ocr_benchmark_report.json', help='Where to write the JSON report')
+    arg_parser.add_argument('--baseline', help='Previous report to compare against')
+    arg_parser.add_argument('--mask', default='ocr/zones.png', help='Zone mask passed to OCRParser')
+    arg_parser.add_argument('--limit', type=int, help='Only use the first N samples')
+    arg_parser.add_argument('--warmup', type=int, default=1, help='Untimed warm-up parses (default 1)')
+    arg_parser.add_argument('--verbose', action='store_true', help="Show the parser's console output")
+    args = arg_parser.parse_args(argv)
+
+    samples = load_corpus(args.corpus)
+    if args.limit:
+        samples = samples[:args.limit]
+    if not samples:
+        print(f"❌ No labeled screenshots found in {args.corpus}")
+        return 1
+
+    from ocr.parser import OCRParser
+    parser = OCRParser(debug_output=False, mask_path=args.mask, zone_cache_size=0)
+
+    print(f"🧪 Benchmarking {len(samples)} screenshot(s) from {args.corpus}")
+    report = asyncio.run(run_benchmark(parser, samples, warmup=args.warmup, verbose=args.verbose))
+    report.update({
+        'created_at': datetime.now().isoformat(),
+        'corpus': os.path.abspath(args.corpus),
+        'mask': args.mask,
+        'warmup': args.warmup,
+    })
+
+    total = report['latency_ms'].get('total', {})
+    print("\n" + "=" * 60)
+    print(f"Images:          {report['images']}")
+    print(f"Throughput:      {report['throughput_images_per_sec']:.2f} images/sec")
+    if total:
+        print(f"Latency (total): p50 {total['p50']:.1f} ms, p95 {total['p95']:.1f} ms, max {total['max']:.1f} ms")
+    for stage, summary in report['latency_ms'].items():
+        if stage != 'total':
+            print(f"  {stage:<12} p50 {summary['p50']:.1f} ms, p95 {summary['p95']:.1f} ms")
+    if report['peak_rss_mb'] is not None:
+        print(f"Peak RSS:        {report['peak_rss_mb']:.0f} MB")
+    if report['field_accuracy'] is not None:
+        print(f"Field accuracy:  {report['field_accuracy']:.1%}")
+    for field, entry in report['accuracy'].items():
+        print(f"  {field:<16} {entry['correct']}/{entry['total']}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            compare_reports(report, json.load(f))
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Report saved: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
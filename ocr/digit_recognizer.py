@@ -0,0 +1,275 @@
+"""
+Digit recognizer for stat zones
+Score/kills/deaths/assists/playtime zones only hold digits and commas in the game's
+own font, so they are read by segmenting the glyphs and matching them against
+templates cut from labeled screenshots (nearest neighbour, one NumPy pass for all
+stat zones of a screenshot). Zones it isn't confident about, or with a glyph unlike
+every template (other fonts, sizes, digits without a template), go through EasyOCR.
+
+Build the templates from a labeled corpus (ocr.benchmark layout, real screenshots
+work best):
+    python -m ocr.digit_recognizer ocr/labeled_corpus --output ocr/digit_templates.npz
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+
+GLYPH_W = 12
+GLYPH_H = 20
+COMMA_HEIGHT_RATIO = 0.5  # Components shorter than this share of the tallest glyph are commas
+# Glyphs farther than this (euclidean, GLYPH_W x GLYPH_H vectors in 0-1) from every template
+# aren't read. On test_scoreboard.webp same-size digits match within 2.2 (JPEG q60), while
+# different digits are >= 5.6 and letters >= 4.9 apart
+MAX_GLYPH_DISTANCE = 4.0
+
+
+def _binarize(zone_image):
+    """Otsu threshold with the text as white foreground"""
+    _, binary = cv2.threshold(zone_image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    # Text covers less of the zone than the background
+    if np.count_nonzero(binary) > binary.size / 2:
+        binary = cv2.bitwise_not(binary)
+    return binary
+
+
+def segment_glyphs(zone_image):
+    """
+    Split a grayscale stat zone into characters
+
+    Args:
+        zone_image: Grayscale zone crop
+
+    Returns:
+        list: ('digit', normalized glyph vector) or (',', None) items left to right
+    """
+    binary = _binarize(zone_image)
+    count, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+
+    zone_h = binary.shape[0]
+    boxes = []
+    for label in range(1, count):
+        x, y, w, h, area = stats[label]
+        # Specks and zone-edge artefacts aren't glyphs
+        if area < 4 or h < zone_h * 0.2:
+            continue
+        boxes.append([x, y, x + w, y + h])
+    if not boxes:
+        return []
+
+    # Pieces of one broken glyph overlap horizontally - merge them
+    boxes.sort()
+    merged = [boxes[0]]
+    for box in boxes[1:]:
+        last = merged[-1]
+        if box[0] < last[2] - 1:
+            merged[-1] = [min(last[0], box[0]), min(last[1], box[1]), max(last[2], box[2]), max(last[3], box[3])]
+        else:
+            merged.append(box)
+
+    tallest = max(b[3] - b[1] for b in merged)
+    glyphs = []
+    for x0, y0, x1, y1 in merged:
+        if y1 - y0 < tallest * COMMA_HEIGHT_RATIO:
+            glyphs.append((',', None))
+            continue
+        crop = binary[y0:y1, x0:x1]
+        # Pad to the template aspect ratio so narrow glyphs like "1" keep their shape
+        h, w = crop.shape
+        target_w = max(w, int(round(h * GLYPH_W / GLYPH_H)))
+        pad = target_w - w
+        crop = cv2.copyMakeBorder(crop, 0, 0, pad // 2, pad - pad // 2, cv2.BORDER_CONSTANT, value=0)
+        glyph = cv2.resize(crop, (GLYPH_W, GLYPH_H), interpolation=cv2.INTER_AREA)
+        glyphs.append(('digit', glyph.astype(np.float32).ravel() / 255.0))
+    return glyphs
+
+
+class DigitRecognizer:
+    """Nearest-neighbour digit classifier over templates cut from labeled screenshots"""
+
+    def __init__(self, templates, labels, max_distance=MAX_GLYPH_DISTANCE):
+        """
+        Initialize the recognizer
+
+        Args:
+            templates: (n, GLYPH_W * GLYPH_H) float32 glyph vectors
+            labels: (n,) digit characters
+            max_distance: Glyphs farther than this from every template get confidence 0
+        """
+        self.templates = np.asarray(templates, dtype=np.float32)
+        self.labels = np.asarray(labels)
+        self.max_distance = max_distance
+        self._template_norms = (self.templates ** 2).sum(axis=1)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load templates saved by train()
+
+        Returns:
+            DigitRecognizer: Recognizer, or None if the file is missing or unreadable
+        """
+        if not Path(path).exists():
+            return None
+        try:
+            data = np.load(path)
+            recognizer = cls(data['templates'], data['labels'])
+            print(f"✓ Loaded {len(recognizer.labels)} digit templates from {path}")
+            return recognizer
+        except Exception as e:
+            print(f"Error loading digit templates {path}: {e}")
+            return None
+
+    def save(self, path):
+        """Write the templates as a compressed .npz file"""
+        np.savez_compressed(path, templates=self.templates, labels=self.labels)
+
+    def recognize_batch(self, zone_images):
+        """
+        Read several stat zones with a single nearest-neighbour pass
+
+        Confidence of a glyph is how much closer its best template is than the
+        nearest template of any other digit (0 = tie, 1 = exact match), or 0 when
+        even the best template is farther than max_distance; a zone's confidence
+        is that of its least certain glyph
+
+        Args:
+            zone_images: Grayscale zone crops
+
+        Returns:
+            list: (text, confidence) per zone; confidence 0.0 when nothing was segmented
+        """
+        segmented = [segment_glyphs(zone) for zone in zone_images]
+        vectors = [vector for glyphs in segmented for kind, vector in glyphs if kind == 'digit']
+        if not vectors:
+            return [('', 0.0) for _ in zone_images]
+
+        glyphs = np.stack(vectors)
+        # Squared euclidean distances of every glyph to every template
+        distances = (glyphs ** 2).sum(axis=1)[:, None] + self._template_norms[None, :] - 2.0 * glyphs @ self.templates.T
+        np.maximum(distances, 0, out=distances)
+
+        best = distances.argmin(axis=1)
+        best_labels = self.labels[best]
+        best_dist = distances[np.arange(len(best)), best]
+        other = np.where(self.labels[None, :] == best_labels[:, None], np.inf, distances).min(axis=1)
+        confidence = np.where(np.isfinite(other), 1.0 - np.sqrt(best_dist) / np.maximum(np.sqrt(other), 1e-6), 1.0)
+        # A glyph unlike every template (e.g. a digit with no template) is left to EasyOCR
+        confidence[np.sqrt(best_dist) > self.max_distance] = 0.0
+
+        results = []
+        position = 0
+        for glyphs_in_zone in segmented:
+            text = ''
+            zone_conf = 1.0
+            digits = 0
+            for kind, _ in glyphs_in_zone:
+                if kind == ',':
+                    text += ','
+                    continue
+                text += str(best_labels[position])
+                zone_conf = min(zone_conf, float(confidence[position]))
+                position += 1
+                digits += 1
+            results.append((text, zone_conf if digits else 0.0))
+        return results
+
+
+def train(samples, schema, output_path):
+    """
+    Cut digit templates from labeled screenshots
+
+    Only zones whose segmented digit count matches the ground-truth value are used,
+    so a bad segmentation can't mislabel templates
+
+    Args:
+        samples: (image path, ground truth) tuples from ocr.benchmark.load_corpus
+        schema: Zone schema of the mask the screenshots match
+        output_path: Where to save the templates
+
+    Returns:
+        int: Number of templates saved
+    """
+    from ocr.zone_schema import STAT_ROLES, scale_zones
+
+    field_for_role = {'score': 'score', 'kills': 'kills', 'deaths': 'deaths',
+                      'assists': 'assists', 'playtime': 'playtime_minutes'}
+    templates, labels = [], []
+    used_zones = skipped_zones = 0
+
+    for image_path, truth in samples:
+        gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            print(f"  ⚠ Could not read {image_path.name}")
+            continue
+        height, width = gray.shape
+        players = truth.get('players', [])
+        for zone in scale_zones(schema, width, height):
+            if zone['role'] not in STAT_ROLES or zone['slot'] is None or zone['slot'] >= len(players):
+                continue
+            value = players[zone['slot']].get(field_for_role[zone['role']])
+            if value is None:
+                continue
+            crop = gray[zone['y']:zone['y'] + zone['height'], zone['x']:zone['x'] + zone['width']]
+            vectors = [vector for kind, vector in segment_glyphs(crop) if kind == 'digit']
+            digits = str(int(value))
+            if len(vectors) != len(digits):
+                skipped_zones += 1
+                continue
+            templates.extend(vectors)
+            labels.extend(digits)
+            used_zones += 1
+
+    if not templates:
+        print("❌ No usable stat zones found - check the corpus and zone schema")
+        return 0
+
+    recognizer = DigitRecognizer(np.stack(templates), np.array(labels))
+    recognizer.save(output_path)
+    counts = {d: labels.count(d) for d in '0123456789'}
+    print(f"✓ Used {used_zones} stat zones ({skipped_zones} skipped: digit count mismatch)")
+    print(f"  Templates per digit: {', '.join(f'{d}:{n}' for d, n in counts.items())}")
+    missing = [d for d, n in counts.items() if n == 0]
+    if missing:
+        print(f"  ⚠ No templates for {', '.join(missing)} - these glyphs match no template within "
+              f"{MAX_GLYPH_DISTANCE}, so their zones fall back to EasyOCR (add screenshots that show them)")
+    return len(templates)
+
+
+def main(argv=None):
+    """Command line entry point"""
+    arg_parser = argparse.ArgumentParser(prog='python -m ocr.digit_recognizer', description='Build digit templates from a labeled corpus')
+    arg_parser.add_argument('corpus', help='Directory of screenshots with ground-truth JSON')
+    arg_parser.add_argument('--output', default='ocr/digit_templates.npz')
+    arg_parser.add_argument('--mask', default='ocr/zones.png', help='Mask whose zone schema the screenshots match')
+    args = arg_parser.parse_args(argv)
+
+    from ocr.benchmark import load_corpus
+    from ocr.zone_schema import build_zone_schema, load_zone_schema
+
+    samples = load_corpus(args.corpus)
+    if not samples:
+        print(f"❌ No labeled screenshots found in {args.corpus}")
+        return 1
+
+    schema = load_zone_schema(args.mask)
+    if schema is None:
+        mask = cv2.imread(str(args.mask), cv2.IMREAD_GRAYSCALE)
+        schema = build_zone_schema(mask) if mask is not None else None
+    if schema is None:
+        print(f"❌ No zone schema for {args.mask}")
+        return 1
+
+    count = train(samples, schema, args.output)
+    if not count:
+        return 1
+    print(f"✅ Saved {count} digit templates to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
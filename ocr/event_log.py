@@ -0,0 +1,129 @@
+"""
+Append-only match event log
+Every added/removed match is appended as one JSON line and fsynced, so recording
+a match costs O(1) instead of rewriting the whole screenshot log. StatsManager
+periodically compacts the log into snapshots (stats_data.json / screenshot_log.json)
+and only replays the events written after the last snapshot on startup.
+"""
+
+import json
+import os
+
+
+MATCH_ADDED = 'match_added'
+MATCH_REMOVED = 'match_removed'
+
+
+class MatchEventLog:
+    """JSONL log of match_added / match_removed events with increasing sequence numbers"""
+
+    def __init__(self, log_file='ocr/match_events.jsonl'):
+        """
+        Initialize the event log
+
+        Args:
+            log_file: Path to the JSONL event file
+        """
+        self.log_file = log_file
+        self.last_seq = 0   # Sequence number of the newest event ever written
+        self.pending = 0    # Events in the file (written since the last compaction)
+        self._repair_tail()
+        for event in self.read():
+            self.last_seq = max(self.last_seq, event['seq'])
+            self.pending += 1
+
+    def _repair_tail(self):
+        """
+        Cut off a torn last line left by a crash mid-append
+        Otherwise the next append would be glued onto it and lost as well
+        """
+        if not os.path.exists(self.log_file):
+            return
+
+        with open(self.log_file, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                print(f"Discarding incomplete last match event in {self.log_file}")
+                f.truncate(data.rfind(b'\n') + 1)
+
+    def read(self, after_seq=0):
+        """
+        Iterate over logged events in order
+
+        Args:
+            after_seq: Only yield events with a sequence number above this
+
+        Yields:
+            dict: Event with 'seq', 'type', 'key' and 'entry'
+        """
+        if not os.path.exists(self.log_file):
+            return
+
+        with open(self.log_file, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append can leave a torn last line - nothing after it was acknowledged
+                    print(f"Skipping unreadable match event on line {line_number} of {self.log_file}")
+                    continue
+                if event.get('seq', 0) > after_seq:
+                    yield event
+
+    def append(self, event_type, key, entry):
+        """
+        Durably append one event (flushed and fsynced before returning)
+
+        Args:
+            event_type: MATCH_ADDED or MATCH_REMOVED
+            key: Screenshot log key ("<message_id>_<attachment_id>")
+            entry: Full screenshot log entry (removals carry the entry so they can be replayed)
+
+        Returns:
+            int: Sequence number of the new event
+        """
+        self.last_seq += 1
+        event = {'seq': self.last_seq, 'type': event_type, 'key': key, 'entry': entry}
+
+        os.makedirs(os.path.dirname(self.log_file) or '.', exist_ok=True)
+        with open(self.log_file, 'a') as f:
+            f.write(json.dumps(event, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.pending += 1
+        return self.last_seq
+
+    def extend(self, events):
+        """
+        Append many events with a single fsync at the end (bulk imports)
+
+        Args:
+            events: Iterable of (event_type, key, entry) tuples
+
+        Returns:
+            int: Number of events appended
+        """
+        count = 0
+        os.makedirs(os.path.dirname(self.log_file) or '.', exist_ok=True)
+        with open(self.log_file, 'a') as f:
+            for event_type, key, entry in events:
+                self.last_seq += 1
+                event = {'seq': self.last_seq, 'type': event_type, 'key': key, 'entry': entry}
+                f.write(json.dumps(event, separators=(',', ':')) + '\n')
+                count += 1
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.pending += count
+        return count
+
+    def truncate(self):
+        """Drop all logged events (called once they are covered by a snapshot)"""
+        with open(self.log_file, 'w') as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self.pending = 0
@@ -0,0 +1,205 @@
+"""
+Layout registry for scoreboard masks
+Screenshots come in different aspect ratios (16:9, ultrawide, 4:3, cropped) and
+game UI versions, and one mask stretched to all of them puts the zones in the
+wrong places. layouts.json (next to the default mask) lists one mask per layout:
+
+    {
+      "layouts": [
+        {"name": "16:9", "mask": "zones.png", "ui_version": 1},
+        {"name": "21:9", "mask": "zones_21x9.png", "ui_version": 1}
+      ]
+    }
+
+Each mask has its own zone schema sidecar (python -m ocr.zone_schema <mask>). A
+layout's aspect ratio is that of its mask unless "aspect" is given. The VICTORY
+banner template shared by all layouts (victory_template.png next to the default
+mask) is loaded with them, see scoreboard_filter.py. For every
+screenshot the layouts within ASPECT_TOLERANCE of its aspect ratio are candidates,
+and when several fit (e.g. two UI versions) the one whose text zones line up best
+with the image's edges is used.
+
+Show which layout each image gets:
+    python -m ocr.layouts path/to/screenshots
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import cv2
+
+from ocr.scoreboard_filter import edge_map, layout_alignment
+from ocr.zone_schema import build_zone_schema, load_zone_schema
+
+
+ASPECT_TOLERANCE = 0.04  # Relative aspect ratio difference a layout still fits
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp')
+
+
+def load_layout(name, mask_path, aspect=None, ui_version=None):
+    """
+    Load one layout's mask and zone schema
+
+    Returns:
+        dict: Layout with name, mask_path, mask, schema, aspect and ui_version,
+              or None if the mask can't be read
+    """
+    mask = cv2.imread(str(mask_path), cv2.IMREAD_GRAYSCALE)
+    if mask is None:
+        print(f"⚠ Layout '{name}': mask not found or unreadable: {mask_path}")
+        return None
+    height, width = mask.shape[:2]
+    return {
+        'name': name,
+        'mask_path': str(mask_path),
+        'mask': mask,
+        'schema': load_zone_schema(mask_path) or build_zone_schema(mask),
+        'aspect': float(aspect) if aspect else width / height,
+        'ui_version': ui_version,
+    }
+
+
+class LayoutRegistry:
+    """Scoreboard layouts and the selection of one per screenshot"""
+
+    def __init__(self, layouts, banner_template_path=None):
+        """
+        Initialize the registry
+
+        Args:
+            layouts: Layout dicts from load_layout (the first is the default)
+            banner_template_path: Grayscale VICTORY banner template (None = no banner check)
+        """
+        self.layouts = layouts
+        self.banner_template_path = str(banner_template_path) if banner_template_path else None
+        self.banner_template = None
+        if self.banner_template_path and Path(self.banner_template_path).exists():
+            self.banner_template = cv2.imread(self.banner_template_path, cv2.IMREAD_GRAYSCALE)
+            if self.banner_template is None:
+                print(f"⚠ VICTORY banner template unreadable: {self.banner_template_path}")
+
+    @classmethod
+    def load(cls, mask_path):
+        """
+        Registry for a mask: layouts.json next to it if present, else the mask alone
+
+        Args:
+            mask_path: Default mask (zones.png)
+
+        Returns:
+            LayoutRegistry: Registry with at least the default mask, or None if no mask could be read
+        """
+        registry_file = Path(mask_path).with_name('layouts.json')
+        layouts = []
+        if registry_file.exists():
+            try:
+                with open(registry_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f).get('layouts', [])
+                for entry in entries:
+                    layout = load_layout(
+                        entry.get('name', entry['mask']), registry_file.parent / entry['mask'],
+                        entry.get('aspect'), entry.get('ui_version')
+                    )
+                    if layout:
+                        layouts.append(layout)
+            except Exception as e:
+                print(f"Error loading layout registry {registry_file}: {e}")
+                layouts = []
+
+        # The given mask is the default layout, listed or not
+        listed = [layout for layout in layouts if Path(layout['mask_path']).resolve() == Path(mask_path).resolve()]
+        default = listed[0] if listed else load_layout(Path(mask_path).stem, mask_path)
+        if default:
+            layouts = [default] + [layout for layout in layouts if layout is not default]
+        if not layouts:
+            return None
+        return cls(layouts, Path(mask_path).with_name('victory_template.png'))
+
+    @property
+    def default(self):
+        """Layout of the default mask"""
+        return self.layouts[0]
+
+    def __len__(self):
+        return len(self.layouts)
+
+    @staticmethod
+    def fits(layout, width, height):
+        """True if a layout's aspect ratio is within ASPECT_TOLERANCE of an image's"""
+        return abs(layout['aspect'] - width / height) <= ASPECT_TOLERANCE * layout['aspect']
+
+    def candidates(self, width, height):
+        """
+        Layouts whose aspect ratio fits an image
+
+        Returns:
+            list: Fitting layouts, or the nearest one when none is within ASPECT_TOLERANCE
+        """
+        fitting = [layout for layout in self.layouts if self.fits(layout, width, height)]
+        if fitting:
+            return fitting
+        aspect = width / height
+        return [min(self.layouts, key=lambda layout: abs(layout['aspect'] - aspect))]
+
+    def select(self, gray, edges=None):
+        """
+        Pick the layout for a grayscale screenshot: aspect ratio first, then the best
+        zone/edge alignment when more than one layout fits
+
+        Args:
+            gray: Grayscale screenshot
+            edges: edge_map of it, if already computed
+
+        Returns:
+            tuple: (layout, alignment score or None when no scoring was needed)
+        """
+        height, width = gray.shape[:2]
+        candidates = self.candidates(width, height)
+        if len(candidates) == 1:
+            return candidates[0], None
+
+        if edges is None:
+            edges = edge_map(gray)
+        scored = [(layout_alignment(edges, layout['schema']), layout) for layout in candidates if layout['schema']]
+        if not scored:
+            return candidates[0], None
+        score, layout = max(scored, key=lambda item: item[0])
+        return layout, score
+
+
+def main(argv=None):
+    """Print the layout selected for each image"""
+    arg_parser = argparse.ArgumentParser(prog='python -m ocr.layouts', description='Show the layout selected for screenshots')
+    arg_parser.add_argument('paths', nargs='+', help='Image files or directories')
+    arg_parser.add_argument('--mask', default='ocr/zones.png', help='Default mask (layouts.json is read next to it)')
+    args = arg_parser.parse_args(argv)
+
+    registry = LayoutRegistry.load(args.mask)
+    if registry is None:
+        print(f"❌ No layouts for {args.mask}")
+        return 1
+    for layout in registry.layouts:
+        zones = len(layout['schema']['zones']) if layout['schema'] else 0
+        print(f"  Layout {layout['name']}: aspect {layout['aspect']:.3f}, {zones} zones ({layout['mask_path']})")
+
+    paths = []
+    for arg in args.paths:
+        path = Path(arg)
+        paths.extend(sorted(p for p in path.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS) if path.is_dir() else [path])
+
+    for path in paths:
+        gray = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            print(f"⚠ {path}: unreadable")
+            continue
+        layout, score = registry.select(gray)
+        detail = f" (alignment {score:.2f})" if score is not None else ""
+        print(f"{path}: {layout['name']}{detail}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
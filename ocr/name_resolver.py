@@ -0,0 +1,321 @@
+"""
+Player name canonicalization for OCR misreads
+Snaps new OCR names onto known players using an edit-distance neighbour index
+and keeps a persistent alias table so each misread is only resolved once
+"""
+
+import json
+import os
+import re
+
+
+# Character confusions EasyOCR commonly makes on player names (folded before comparing)
+OCR_CONFUSABLES = str.maketrans({
+    '0': 'o',
+    '1': 'l',
+    '|': 'l',
+    '5': 's',
+})
+
+
+def levenshtein(a, b, limit):
+    """
+    Edit distance between two strings, giving up early once it exceeds limit
+
+    Args:
+        a: First string
+        b: Second string
+        limit: Largest distance the caller cares about
+
+    Returns:
+        int: Edit distance, or limit + 1 if the distance is larger than limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, char_b in enumerate(b, 1):
+            cost = min(
+                previous[j] + 1,                       # deletion
+                current[j - 1] + 1,                    # insertion
+                previous[j - 1] + (char_a != char_b)   # substitution
+            )
+            current.append(cost)
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return limit + 1
+        previous = current
+
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+
+def deletion_variants(word, max_deletes):
+    """
+    All strings reachable from word by deleting up to max_deletes characters
+
+    Returns:
+        set: Deletion variants (including word itself)
+    """
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_deletes):
+        next_frontier = set()
+        for variant in frontier:
+            for i in range(len(variant)):
+                next_frontier.add(variant[:i] + variant[i + 1:])
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+class DeletionIndex:
+    """
+    Edit-distance neighbour index over strings (symmetric delete / SymSpell style)
+    Two strings within edit distance k share a variant reachable by at most k deletions
+    from each, so a query is a handful of dict lookups plus a few verifications
+    """
+
+    def __init__(self, max_distance_for):
+        """
+        Args:
+            max_distance_for: Function giving the allowed edit distance for a word
+        """
+        self.max_distance_for = max_distance_for
+        self.variants = {}  # Deletion variant -> set of indexed words
+        self.size = 0
+
+    def add(self, word):
+        """Index a word with deletion variants up to its own allowed distance"""
+        for variant in deletion_variants(word, self.max_distance_for(word)):
+            self.variants.setdefault(variant, set()).add(word)
+        self.size += 1
+
+    def search(self, word):
+        """
+        Find indexed words within the allowed distance of word
+        The allowed distance for a pair is the smaller of the two words' limits
+
+        Returns:
+            list: (distance, word) tuples
+        """
+        query_distance = self.max_distance_for(word)
+        candidates = set()
+        for variant in deletion_variants(word, query_distance):
+            candidates |= self.variants.get(variant, set())
+
+        matches = []
+        for candidate in candidates:
+            limit = min(query_distance, self.max_distance_for(candidate))
+            distance = levenshtein(word, candidate, limit)
+            if distance <= limit:
+                matches.append((distance, candidate))
+        return matches
+
+
+class NameResolver:
+    """Resolve OCR'd player names to canonical stats keys"""
+
+    def __init__(self, alias_file='ocr/name_aliases.json'):
+        """
+        Initialize the name resolver
+
+        Args:
+            alias_file: Path to JSON file storing learned/manual aliases (alias -> canonical key)
+        """
+        self.alias_file = alias_file
+        self.aliases = {}   # Lowercase OCR name -> canonical stats key
+        self.rebuild_aliases = {}  # Names snapped during a rebuild (in memory only, see resolve)
+        self.index = DeletionIndex(self.max_distance_for)  # Index over folded known names
+        self.folded = {}    # Folded name -> canonical stats key
+        self.load_aliases()
+
+    def load_aliases(self):
+        """Load alias table from JSON file"""
+        if os.path.exists(self.alias_file):
+            try:
+                with open(self.alias_file, 'r') as f:
+                    self.aliases = json.load(f)
+                print(f"Loaded {len(self.aliases)} player name aliases")
+            except Exception as e:
+                print(f"Error loading name aliases: {e}")
+                self.aliases = {}
+        else:
+            self.aliases = {}
+
+    def save_aliases(self):
+        """Save alias table to JSON file"""
+        try:
+            os.makedirs(os.path.dirname(self.alias_file), exist_ok=True)
+            with open(self.alias_file, 'w') as f:
+                json.dump(self.aliases, f, indent=2, sort_keys=True)
+        except Exception as e:
+            print(f"Error saving name aliases: {e}")
+
+    @staticmethod
+    def _fold(name_key):
+        """Fold OCR-confusable characters so e.g. 'jimmyhimse1f' and 'jimmyhimself' compare equal"""
+        return name_key.translate(OCR_CONFUSABLES)
+
+    @staticmethod
+    def max_distance_for(name_key):
+        """
+        Edit distance allowed when snapping a name of this length
+        Names up to 7 characters only merge through OCR_CONFUSABLES folds, since
+        'nuke' vs 'luke' are likely different players
+        """
+        if len(name_key) <= 7:
+            return 0
+        return 1
+
+    @staticmethod
+    def _digits(name_key):
+        """Digits left after folding - numbered names ('player12', 'player13') differ only here"""
+        return re.sub(r'\D', '', NameResolver._fold(name_key))
+
+    def _closest_known(self, name_key):
+        """
+        Known player a name snaps onto: the same name after folding, or the only known
+        name one edit away with the same digits
+
+        Returns:
+            str: Canonical stats key, or None
+        """
+        folded = self._fold(name_key)
+        canonical = self.folded.get(folded)
+        if canonical is not None:
+            return canonical
+
+        matches = [(distance, word) for distance, word in self.index.search(folded)
+                   if self._digits(word) == self._digits(folded)]
+        if not matches:
+            return None
+        best = min(distance for distance, _ in matches)
+        closest = [word for distance, word in matches if distance == best]
+        # Ambiguous misreads (two players equally close) are left alone
+        return self.folded[closest[0]] if len(closest) == 1 else None
+
+    def reset_known(self):
+        """Forget known player names (aliases are kept), e.g. before a full recalculation"""
+        self.index = DeletionIndex(self.max_distance_for)
+        self.folded = {}
+        self.rebuild_aliases = {}
+
+    def clear(self):
+        """Forget known players and every alias, and delete the alias file (database reset)"""
+        self.reset_known()
+        self.aliases = {}
+        if os.path.exists(self.alias_file):
+            os.remove(self.alias_file)
+
+    def add_known(self, name_key):
+        """Register a canonical stats key as a known player"""
+        folded = self._fold(name_key)
+        if folded not in self.folded:
+            self.folded[folded] = name_key
+            self.index.add(folded)
+
+    def add_alias(self, alias, name_key):
+        """
+        Map an OCR name onto a canonical player and persist it
+
+        Args:
+            alias: OCR'd name (any case)
+            name_key: Canonical stats key
+        """
+        self.aliases[alias.lower()] = name_key
+        self.save_aliases()
+
+    def remove_alias(self, alias):
+        """
+        Undo a merge: the name is kept as its own player from now on
+        It is stored as an alias of itself so fuzzy matching won't merge it again
+
+        Args:
+            alias: Merged name (any case)
+
+        Returns:
+            str: Canonical key the name was merged into, or None if it had no alias
+        """
+        name_key = alias.strip().lower()
+        canonical = self.aliases.get(name_key)
+        if canonical is None or canonical == name_key:
+            return None
+        self.aliases[name_key] = name_key
+        self.save_aliases()
+        return canonical
+
+    def list_aliases(self):
+        """
+        Learned and manual merges
+
+        Returns:
+            list: (alias, canonical key) tuples sorted by canonical key, excluding
+                  names kept separate with remove_alias
+        """
+        return sorted(((alias, canonical) for alias, canonical in self.aliases.items() if alias != canonical),
+                      key=lambda item: (item[1], item[0]))
+
+    def lookup(self, name):
+        """
+        Resolve a name using only the alias tables (no fuzzy matching, nothing learned)
+
+        Returns:
+            str: Canonical stats key
+        """
+        name_key = name.strip().lower()
+        return self.aliases.get(name_key, self.rebuild_aliases.get(name_key, name_key))
+
+    def find(self, name):
+        """
+        Look up a player the way resolve() would, without learning anything
+        Used for user-typed names (e.g. the .player command)
+
+        Returns:
+            str: Canonical stats key, or None if no unique known player matches
+        """
+        name_key = name.strip().lower()
+
+        alias = self.aliases.get(name_key, self.rebuild_aliases.get(name_key))
+        if alias is not None:
+            return alias
+        return self._closest_known(name_key)
+
+    def resolve(self, name, learn=True):
+        """
+        Resolve an OCR'd name to a canonical stats key
+        Unknown names that fold onto a known player, or are one edit away from exactly
+        one known long name, are snapped to that player; otherwise they become a new player
+
+        Args:
+            name: Player name as read by OCR
+            learn: Persist snapped names as aliases (False when rebuilding from the
+                   log: snaps are then only kept in memory, so a rebuild never adds
+                   aliases on its own)
+
+        Returns:
+            str: Canonical stats key
+        """
+        name_key = name.strip().lower()
+
+        alias = self.aliases.get(name_key, self.rebuild_aliases.get(name_key))
+        if alias is not None:
+            return alias
+
+        canonical = self._closest_known(name_key)
+        if canonical is None:
+            self.add_known(name_key)
+            return name_key
+
+        if canonical != name_key:
+            if learn:
+                print(f"  Resolved OCR name '{name}' to existing player '{canonical}'")
+                self.add_alias(name_key, canonical)
+            else:
+                self.rebuild_aliases[name_key] = canonical
+        return canonical
@@ -0,0 +1,213 @@
+"""
+Number tokenizer for OCR'd stat zone text
+Splits the text once into digit runs, separator runs (commas/whitespace) and other
+text with a single precompiled pattern, then applies the OCR repairs the parser has
+always used as one linear pass over those tokens:
+
+- comma-formatted scores ("11,665", "9, 990", "17 ,760") in score zones
+- "9 1 990" style splits in score zones (comma read as space + digit)
+- "11 0 190" -> "111190" (a 0 between a 2-digit and 3-digit group is a misread 1)
+- digit groups separated by commas/whitespace are joined ("12 089" -> 12089)
+- a "1" in the thousands separator position of 6+ digit runs is dropped ("121220" -> 12220,
+  "111190" -> 11190)
+- a leading "2" on a standalone 6-digit run is dropped ("210665" -> 10665)
+- values equal to the match minutes/seconds are removed, score zones keep 1,000-50,000
+
+Results are identical to the former regex pipeline in OCRParser (see
+test_number_tokenizer.py for the golden set and the comparison against it).
+"""
+
+import re
+
+
+# One token per maximal run: digits, separators (commas/whitespace) or anything else
+_TOKEN = re.compile(r'(\d+)|([,\s]+)|[^\d,\s]+')
+_WHITESPACE = re.compile(r'\s+')
+_WORD_CHAR = re.compile(r'\w')
+
+SCORE_MIN = 1000
+SCORE_MAX = 50000
+
+# The former pipeline joined separated digit groups pairwise, at most 10 times over,
+# so a chain of groups ends up joined in blocks of 2^10
+_JOIN_BLOCK = 2 ** 10
+
+DIGITS, SEPARATOR, OTHER = 0, 1, 2
+
+
+def tokenize(text):
+    """
+    Split text into (kind, value) tokens
+
+    Returns:
+        list: (DIGITS | SEPARATOR | OTHER, substring) tuples covering the whole text
+    """
+    tokens = []
+    for match in _TOKEN.finditer(text):
+        if match.group(1) is not None:
+            tokens.append((DIGITS, match.group(1)))
+        elif match.group(2) is not None:
+            tokens.append((SEPARATOR, match.group(2)))
+        else:
+            tokens.append((OTHER, match.group(0)))
+    return tokens
+
+
+def _is_whitespace(separator):
+    return _WHITESPACE.fullmatch(separator) is not None
+
+
+def _in_score_range(value):
+    return SCORE_MIN <= value <= SCORE_MAX
+
+
+def _comma_scores(tokens):
+    """Scores written with a thousands separator: 1-2 digits, one comma (spaces allowed), 3 digits"""
+    scores = []
+    available = 0  # Digits of the last run not used by an earlier match
+    for index, (kind, value) in enumerate(tokens):
+        if kind != DIGITS:
+            continue
+        if (index >= 2 and tokens[index - 2][0] == DIGITS and tokens[index - 1][1].count(',') == 1
+                and available and len(value) >= 3):
+            left = tokens[index - 2][1]
+            scores.append(int(left[-min(2, available):] + value[:3]))
+            available = len(value) - 3
+        else:
+            available = len(value)
+    return scores
+
+
+def _spaced_score(tokens):
+    """
+    First "A B CCC" pattern (three digit runs split by whitespace only, the last at least 3 digits)
+
+    Returns:
+        tuple: (A, B, first 3 digits of C) or None
+    """
+    for index in range(len(tokens) - 4):
+        kinds = [kind for kind, _ in tokens[index:index + 5]]
+        if kinds != [DIGITS, SEPARATOR, DIGITS, SEPARATOR, DIGITS]:
+            continue
+        if not (_is_whitespace(tokens[index + 1][1]) and _is_whitespace(tokens[index + 3][1])):
+            continue
+        if len(tokens[index + 4][1]) >= 3:
+            return tokens[index][1], tokens[index + 2][1], tokens[index + 4][1][:3]
+    return None
+
+
+def _join_chain(groups, separators):
+    """
+    Join one chain of digit groups separated by commas/whitespace
+
+    Args:
+        groups: Digit strings of the chain in order
+        separators: Separator strings between them (len(groups) - 1)
+
+    Returns:
+        list: Resulting digit runs
+    """
+    # "11 0 190": a lone 0 between a 2+ digit run and a 3+ digit run is a misread 1
+    merged = [groups[0]]
+    available = len(groups[0])  # Digits of the last merged run a new match may start in
+    i = 1
+    while i < len(groups):
+        if (i + 1 < len(groups) and available >= 2 and groups[i] == '0' and len(groups[i + 1]) >= 3
+                and _is_whitespace(separators[i - 1]) and _is_whitespace(separators[i])):
+            merged[-1] += '1' + groups[i + 1]
+            available = len(groups[i + 1]) - 3
+            i += 2
+        else:
+            merged.append(groups[i])
+            available = len(groups[i])
+            i += 1
+
+    return [''.join(merged[start:start + _JOIN_BLOCK]) for start in range(0, len(merged), _JOIN_BLOCK)]
+
+
+def _runs(tokens):
+    """
+    Digit runs after joining separated groups, with the characters around each run
+
+    Yields:
+        tuple: (digits, char before the run or '', char after the run or '')
+    """
+    index = 0
+    count = len(tokens)
+    while index < count:
+        kind, value = tokens[index]
+        if kind != DIGITS:
+            index += 1
+            continue
+
+        before = tokens[index - 1][1][-1] if index else ''
+        groups = [value]
+        separators = []
+        index += 1
+        while index + 1 < count and tokens[index][0] == SEPARATOR and tokens[index + 1][0] == DIGITS:
+            separators.append(tokens[index][1])
+            groups.append(tokens[index + 1][1])
+            index += 2
+        after = tokens[index][1][0] if index < count else ''
+
+        runs = _join_chain(groups, separators)
+        for position, run in enumerate(runs):
+            # Blocks of a very long chain are separated by commas/whitespace
+            yield (run,
+                   before if position == 0 else ' ',
+                   after if position == len(runs) - 1 else ' ')
+
+
+def _repair_run(run, before, after):
+    """Fix comma misreads inside one digit run"""
+    # "121220" -> "12220": a 1 where the thousands comma was, at the end of the run
+    if len(run) >= 6 and run[-4] == '1':
+        run = run[:-4] + run[-3:]
+    # "210665" -> "10665": a comma read as a leading 2 on a standalone 6-digit run
+    if (len(run) == 6 and run[0] == '2'
+            and not (before and _WORD_CHAR.match(before))
+            and not (after and _WORD_CHAR.match(after))):
+        run = run[1:]
+    return run
+
+
+def extract_numbers(text, time_values=None, is_score_zone=False):
+    """
+    Extract numbers from OCR'd text, repairing common separator misreads
+
+    Args:
+        text: Zone text
+        time_values: (minutes, seconds) of the match time; numbers equal to either are dropped
+        is_score_zone: If True, prefer score patterns and keep only 1,000-50,000
+
+    Returns:
+        list: Extracted numbers
+    """
+    tokens = tokenize(text)
+
+    if is_score_zone:
+        scores = [s for s in _comma_scores(tokens) if _in_score_range(s)]
+        if scores:
+            return scores
+
+        spaced = _spaced_score(tokens)
+        if spaced:
+            first, middle, last = spaced
+            combined_all = int(first + middle + last)
+            if _in_score_range(combined_all):
+                return [combined_all]
+            # Comma misread as space + digit: drop the middle group
+            combined_no_middle = int(first + last)
+            if _in_score_range(combined_no_middle):
+                return [combined_no_middle]
+
+    numbers = [int(_repair_run(run, before, after)) for run, before, after in _runs(tokens)]
+
+    if time_values:
+        minutes, seconds = time_values
+        numbers = [n for n in numbers if n != minutes and n != seconds]
+
+    if is_score_zone:
+        numbers = [n for n in numbers if _in_score_range(n)]
+
+    return numbers
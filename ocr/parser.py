@@ -9,31 +9,137 @@ import numpy as np
 from PIL import Image
 import re
 import io
+import math
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
 
+from ocr.digit_recognizer import DigitRecognizer
+from ocr.layouts import LayoutRegistry
+from ocr.number_tokenizer import extract_numbers
+from ocr.scoreboard_filter import BANNER_MIN_CORRELATION, content_box, find_banner
+from ocr.static_zone_cache import StaticZoneCache
+from ocr.timing import StageTimer, TimingHistograms
+from ocr.zone_schema import STAT_ROLES, place_zones, scale_zones
+
+
+# Tunable OCR settings - hand-picked for accuracy over speed
+# Presets from ocr/tuner.py override any subset of these (see ocr_params_from_config)
+DEFAULT_OCR_PARAMS = {
+    # Zone preprocessing
+    'target_zone_height': 64,    # Zones are scaled to this pixel height (EasyOCR recognizes at 64px)
+    'min_zone_scale': 0.5,       # Bounds on the per-zone scale factor
+    'max_zone_scale': 4.0,
+    'clahe_clip': 2.0,           # CLAHE contrast clip limit
+    'clahe_tile': 8,             # CLAHE tile grid size
+    # EasyOCR detection
+    'width_ths': 0.7,            # Width threshold for text grouping (lower = more strict)
+    'ycenter_ths': 0.5,          # Y-center threshold for line detection
+    'height_ths': 0.5,           # Height threshold for line matching
+    'add_margin': 0.1,           # Add margin around detected text
+    'text_threshold': 0.5,       # Lower = more permissive text detection
+    'low_text': 0.2,             # Lower = detect fainter text
+    'link_threshold': 0.3,       # Lower = more strict character linking
+    'canvas_size': 4096,         # Larger canvas for better detection
+    'mag_ratio': 1.5,            # Magnification ratio for better small text
+    # EasyOCR recognition
+    'contrast_ths': 0.05,        # Lower = more sensitive contrast detection
+    'adjust_contrast': 0.8,      # Higher = more contrast adjustment
+    'min_confidence': 0.3,       # Results below this confidence are dropped
+    # Digit recognizer (stat zones)
+    'digit_min_confidence': 0.35,  # Less certain stat zones are re-read with EasyOCR
+    # Static zone cache (VICTORY banner, mode header)
+    'static_zone_max_diff': 6.0,   # Largest mean gray-level difference to reuse a cached zone's text
+    # Layout-free fallback when no mask layout fits the screenshot
+    'coarse_detect_width': 1280,   # Whole-frame text detection runs at this width (0 = off, stretch the nearest mask)
+}
+
+# Zones whose text is the same on every screenshot - recognized once, then served from StaticZoneCache
+STATIC_ZONE_ROLES = ('header', 'victory')
+
+DETECT_PARAMS = ('width_ths', 'ycenter_ths', 'height_ths', 'add_margin', 'text_threshold',
+                 'low_text', 'link_threshold', 'canvas_size', 'mag_ratio')
+RECOGNIZE_PARAMS = ('contrast_ths', 'adjust_contrast')
+
+# Whole-frame fallback: detected boxes are clipped to the placed layout zones they overlap
+FRAME_ZONE_PAD = 0.3       # Zone padding (share of the zone height) a box may reach into
+FRAME_MIN_OVERLAP = 0.5    # Share of a box's height that must lie inside a zone
+
+
+def ocr_params_from_config(config, preset):
+    """
+    Read an OCR preset written by ocr/tuner.py from a config
+    
+    Args:
+        config: ConfigParser holding [OCRPreset:<name>] sections
+        preset: Preset name (e.g. 'fast', 'balanced', 'accurate'); empty = defaults
+        
+    Returns:
+        dict: OCR parameters (defaults for anything the preset leaves out)
+    """
+    params = dict(DEFAULT_OCR_PARAMS)
+    if not preset:
+        return params
+    
+    section = f'OCRPreset:{preset}'
+    if not config.has_section(section):
+        print(f"⚠ OCR preset '{preset}' not found in config - using defaults")
+        return params
+    
+    for key, value in config.items(section):
+        if key not in DEFAULT_OCR_PARAMS:
+            print(f"⚠ Unknown OCR parameter '{key}' in [{section}] - ignored")
+            continue
+        try:
+            # Keep the type of the default (int vs float)
+            params[key] = type(DEFAULT_OCR_PARAMS[key])(float(value))
+        except ValueError:
+            print(f"⚠ Invalid value for OCR parameter '{key}' in [{section}]: {value}")
+    print(f"✓ Using OCR preset '{preset}'")
+    return params
+
 
 class OCRParser:
     """Parse Battle Royale victory screenshots using mask-based OCR with EasyOCR"""
     
-    def __init__(self, debug_output=True, mask_path='ocr/zones.png'):
+    def __init__(self, debug_output=True, mask_path='ocr/zones.png', ocr_params=None, digit_templates=None,
+                 load_reader=True, zone_cache_size=32):
         """
         Initialize the OCR parser
         
         Args:
             debug_output: Whether to save debug frames (default True)
             mask_path: Path to mask image (required) - white regions will be processed
+            ocr_params: Overrides for DEFAULT_OCR_PARAMS (e.g. a tuned preset)
+            digit_templates: Digit templates for stat zones (default: digit_templates.npz next to the mask)
+            load_reader: Load the EasyOCR model; False for parsers that only re-parse
+                         recorded zone texts (see ocr/reparse.py)
+            zone_cache_size: Recent images whose zone OCR output is kept, so a re-post of
+                             the same screenshot (e.g. with "override") skips OCR (0 = off)
         """
-        # Initialize EasyOCR reader with GPU support
-        print("🔧 Initializing EasyOCR (this may take a moment on first run)...")
-        self.reader = easyocr.Reader(['en'], gpu=True)
-        print("✅ EasyOCR initialized successfully")
+        self.reader = None
+        if load_reader:
+            # Initialize EasyOCR reader with GPU support
+            print("🔧 Initializing EasyOCR (this may take a moment on first run)...")
+            self.reader = easyocr.Reader(['en'], gpu=True)
+            print("✅ EasyOCR initialized successfully")
         
         self.debug_output = debug_output
         self.debug_counter = 0
+        self.last_timings = {}  # Stage -> nanoseconds for the most recent parse_screenshot call
+        self.last_zone_texts = []  # Raw per-zone OCR output of the most recent parse_screenshot call
+        self.last_layout = None  # Layout used for the most recent OCR'd screenshot
+        self.timing_histograms = TimingHistograms()  # Running per-stage latency across all parses
         
         # OCR Configuration - IMPROVED
         self.upscale_factor = 4  # Increased from 2 to 4 for better small text recognition
         self.allowlist = '0123456789,:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_ '
+        self.ocr_params = dict(DEFAULT_OCR_PARAMS, **(ocr_params or {}))
+        self._clahe = None      # Shared CLAHE object, rebuilt only when its parameters change
+        self._clahe_key = None
+        self.zone_cache_size = zone_cache_size
+        self._zone_cache = OrderedDict()  # (image sha256, OCR params) -> zone texts, least recently used first
+        self.static_zone_cache = StaticZoneCache(max_diff=self.ocr_params['static_zone_max_diff'])
         
         # Load mask image (required)
         self.mask = self._load_mask(mask_path)
@@ -41,6 +147,25 @@ class OCRParser:
             raise FileNotFoundError(f"❌ Mask file required but not found: {mask_path}")
         
         print(f"✓ Loaded mask from {mask_path}")
+        
+        # Layouts: this mask plus any others listed in layouts.json next to it (other aspect
+        # ratios / UI versions); one is picked per screenshot
+        self.layouts = LayoutRegistry.load(mask_path)
+        if len(self.layouts) > 1:
+            print(f"✓ {len(self.layouts)} layouts: {', '.join(layout['name'] for layout in self.layouts.layouts)}")
+        
+        # Zone roles (zones.json next to the mask), derived from the mask if there is no sidecar
+        # Without a schema, zone roles are guessed from positions while parsing
+        self.zone_schema = self.layouts.default['schema']
+        if self.zone_schema:
+            print(f"✓ Zone schema: {len(self.zone_schema['zones'])} labeled zones")
+        else:
+            print("⚠ No zone schema - pairing names and stats by position")
+        
+        # Template digit recognizer for stat zones (EasyOCR only reads them when it's unsure)
+        self.digit_recognizer = DigitRecognizer.load(digit_templates or Path(mask_path).with_name('digit_templates.npz'))
+        if self.digit_recognizer is None:
+            print("  → No digit templates - stat zones are read with EasyOCR")
     
     def _load_mask(self, mask_path):
         """
@@ -122,93 +247,486 @@ class OCRParser:
             override: If True, bypass victory verification and treat as first place win
             
         Returns:
-            dict: Parsed data containing match_time and list of players with stats
+            dict: Parsed data containing match_time and list of players with stats,
+                  plus the raw zone_texts it was parsed from (see record_zone_texts)
         """
+        timer = StageTimer()
+        self.last_timings = timer.stages
+        self.last_zone_texts = []
+        parsed_data = None
+        
         try:
-            # Load image
-            image = Image.open(io.BytesIO(image_bytes))
-            img_array = np.array(image)
+            # Re-posts of the same image (e.g. with "override") reuse its zone OCR output
+            cache_key = self._zone_cache_key(image_bytes)
+            zone_texts = self._zone_cache_get(cache_key)
+            timer.mark('cache')
+            if zone_texts is None:
+                zone_texts = self._ocr_zones(image_bytes, timer)
+                if zone_texts is None:
+                    return None
+                self._zone_cache_put(cache_key, zone_texts)
+            else:
+                print(f"♻ Reusing cached zone OCR for this image ({len(zone_texts)} zones) - parsing only")
+            self.last_zone_texts = zone_texts
             
-            # Save original image info
-            height, width = img_array.shape[:2]
-            print(f"📐 Image dimensions: {width}x{height} pixels")
+            # Parse the zone texts to extract structured data
+            parsed_data = self._parse_zone_texts(zone_texts, override=override)
+            timer.mark('parse')
             
-            # Convert to grayscale (minimal preprocessing like the working EasyOCR script)
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+            if not parsed_data or not parsed_data.get('players'):
+                print("⚠ No player data extracted from zones")
+                return None
+            
+            return parsed_data
             
+        except Exception as e:
+            print(f"Error parsing screenshot: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+        
+        finally:
+            timer.finish()
+            self.timing_histograms.record(timer.stages)
+            print(f"⏱ OCR timings: {timer.summary()}")
+            if parsed_data:
+                parsed_data['timings'] = timer.as_dict()
+                parsed_data['zone_texts'] = self.record_zone_texts(self.last_zone_texts)
+                parsed_data['override'] = bool(override)
+    
+    def _ocr_zones(self, image_bytes, timer):
+        """
+        Decode a screenshot and read the text of every mask zone
+        
+        Args:
+            image_bytes: Raw image bytes
+            timer: StageTimer for the current parse
+        
+        Returns:
+            list: Zone text dicts (zone_index, text, bounds, confidence, is_stats, role, slot),
+                  or None if the mask has no zones
+        """
+        # Load image
+        image = Image.open(io.BytesIO(image_bytes))
+        img_array = np.array(image)
+        
+        # Save original image info
+        height, width = img_array.shape[:2]
+        print(f"📐 Image dimensions: {width}x{height} pixels")
+        
+        # Convert to grayscale (minimal preprocessing like the working EasyOCR script)
+        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        timer.mark('decode')
+        
+        # Letterbox/pillarbox bars (e.g. a 16:9 frame on a 16:10 canvas) aren't part of the layout
+        x0, y0, content_w, content_h = content_box(gray)
+        if (content_w, content_h) != (width, height):
+            print(f"✂ Cropped black bars: content {content_w}x{content_h} at ({x0}, {y0})")
+            img_array = img_array[y0:y0 + content_h, x0:x0 + content_w]
+            gray = gray[y0:y0 + content_h, x0:x0 + content_w]
+            width, height = content_w, content_h
+        
+        # Layout for this screenshot's aspect ratio (best aligned one if several fit)
+        layout, alignment = self.layouts.select(gray)
+        self.last_layout = layout['name']
+        if len(self.layouts) > 1:
+            detail = f" (alignment {alignment:.2f})" if alignment is not None else ""
+            print(f"🗺 Layout: {layout['name']}{detail}")
+            timer.mark('layout')
+        schema, mask = layout['schema'], layout['mask']
+        
+        # No mask fits this aspect ratio: find the text on the whole frame instead of stretching one
+        if self.ocr_params['coarse_detect_width'] and self.reader and not self.layouts.fits(layout, width, height):
+            print(f"🗺 No layout fits {width}x{height} - detecting text on the whole frame")
+            self.last_layout = None
+            return self._ocr_frame(gray, timer, self._place_frame_zones(gray, layout))
+        
+        resized_mask = None
+        if schema:
+            # Labeled zone boxes scaled straight from the schema
+            zones = scale_zones(schema, width, height)
+        else:
             # Resize mask to match image
-            resized_mask = cv2.resize(self.mask, (width, height), interpolation=cv2.INTER_LINEAR)
-            print(f"🎭 Resized mask from {self.mask.shape} to {resized_mask.shape}")
+            resized_mask = cv2.resize(mask, (width, height), interpolation=cv2.INTER_LINEAR)
+            print(f"🎭 Resized mask from {mask.shape} to {resized_mask.shape}")
+            timer.mark('mask_resize')
             
             # Extract zones from mask
             zones = self._extract_zones_from_mask(resized_mask)
+        
+        timer.mark('zones')
+        
+        if not zones:
+            print("⚠ No zones detected in mask")
+            return None
+        
+        # Save debug frames if enabled
+        if self.debug_output:
+            if resized_mask is None:
+                resized_mask = cv2.resize(mask, (width, height), interpolation=cv2.INTER_LINEAR)
+            self._save_debug_frames(img_array, gray, resized_mask, zones)
+            timer.mark('debug')
+        
+        # Stat zones go through the digit recognizer first, all in one batch
+        digit_texts = self._read_digit_zones(gray, zones)
+        if digit_texts is not None:
+            timer.mark('digits')
+        
+        # Run OCR on each zone individually using EasyOCR with preprocessing
+        zone_texts = []
+        params_key = tuple(sorted(self.ocr_params.items()))
+        self.static_zone_cache.max_diff = self.ocr_params['static_zone_max_diff']
+        for zone in zones:
+            timer.zone(zone['index'])
+            x, y, w, h = zone['x'], zone['y'], zone['width'], zone['height']
+            zone_region = gray[y:y+h, x:x+w]
             
-            if not zones:
-                print("⚠ No zones detected in mask")
-                return None
-            
-            # Save debug frames if enabled
-            if self.debug_output:
-                self._save_debug_frames(img_array, gray, resized_mask, zones)
+            # Stats zone by schema role, or by position (bottom zones with numbers)
+            role = zone.get('role')
+            is_stats_zone = role in STAT_ROLES if role else y > (height * 0.7)
             
-            # Run OCR on each zone individually using EasyOCR with preprocessing
-            zone_texts = []
-            for zone in zones:
-                x, y, w, h = zone['x'], zone['y'], zone['width'], zone['height']
-                zone_region = gray[y:y+h, x:x+w]
-                
-                # Determine if this is likely a stats zone (bottom zones with numbers)
-                is_stats_zone = y > (height * 0.7)
-                
+            if digit_texts and zone['index'] in digit_texts:
+                zone_text, zone_conf = digit_texts[zone['index']]
+            else:
                 # Preprocess zone for better OCR
                 processed_zone = self._preprocess_zone(zone_region, is_stats_zone)
+                timer.zone_mark('preprocess')
                 
-                # Run EasyOCR on the zone with high-accuracy parameters
-                # These settings prioritize accuracy over speed
-                results = self.reader.readtext(
-                    processed_zone,
-                    allowlist=self.allowlist,
-                    paragraph=False,
-                    detail=1,                # Return detailed results with bounding boxes
-                    width_ths=0.7,           # Width threshold for text grouping (lower = more strict)
-                    ycenter_ths=0.5,         # Y-center threshold for line detection
-                    height_ths=0.5,          # Height threshold for line matching
-                    add_margin=0.1,          # Add margin around detected text
-                    contrast_ths=0.05,       # Lower = more sensitive contrast detection
-                    adjust_contrast=0.8,     # Higher = more contrast adjustment
-                    text_threshold=0.5,      # Lower = more permissive text detection
-                    low_text=0.2,            # Lower = detect fainter text
-                    link_threshold=0.3,      # Lower = more strict character linking
-                    canvas_size=4096,        # Larger canvas for better detection
-                    mag_ratio=1.5            # Magnification ratio for better small text
-                )
+                # Static UI text (VICTORY banner, mode header) is usually recognized already
+                cached = None
+                if role in STATIC_ZONE_ROLES:
+                    namespace = (role, params_key)
+                    cached = self.static_zone_cache.lookup(namespace, processed_zone)
+                    timer.zone_mark('static_cache')
                 
-                # Combine all text from this zone
-                zone_text = ' '.join([text for (bbox, text, conf) in results if conf > 0.3])
-                
-                zone_texts.append({
-                    'zone_index': zone['index'],
-                    'text': zone_text,
-                    'bounds': (x, y, w, h),
-                    'is_stats': is_stats_zone
-                })
-                print(f"📝 Zone {zone['index']} {'[STATS]' if is_stats_zone else '[NAME]'} OCR: {zone_text[:50].strip()}...")
-            
-            # Parse the zone texts to extract structured data
-            parsed_data = self._parse_zone_texts(zone_texts, override=override)
+                if cached is not None:
+                    zone_text, zone_conf = cached
+                else:
+                    results = self._read_zone(processed_zone, timer)
+                    
+                    # Combine all text from this zone
+                    kept = [(text, conf) for (bbox, text, conf) in results if conf > self.ocr_params['min_confidence']]
+                    zone_text = ' '.join(text for text, conf in kept)
+                    zone_conf = sum(conf for text, conf in kept) / len(kept) if kept else 0.0
+                    if role in STATIC_ZONE_ROLES and zone_text:
+                        self.static_zone_cache.store(namespace, processed_zone, zone_text, zone_conf)
             
-            if not parsed_data or not parsed_data.get('players'):
-                print("⚠ No player data extracted from zones")
-                return None
+            zone_texts.append({
+                'zone_index': zone['index'],
+                'text': zone_text,
+                'bounds': (x, y, w, h),
+                'confidence': round(float(zone_conf), 3),
+                'is_stats': is_stats_zone,
+                'role': role,
+                'slot': zone.get('slot')
+            })
+            label = role.upper() if role else ('STATS' if is_stats_zone else 'NAME')
+            print(f"📝 Zone {zone['index']} [{label}] OCR: {zone_text[:50].strip()}...")
+        
+        return zone_texts
+    
+    def _zone_cache_key(self, image_bytes):
+        """Cache key for an image: content hash plus the OCR parameters that shape the zone text"""
+        return hashlib.sha256(image_bytes).hexdigest(), tuple(sorted(self.ocr_params.items()))
+    
+    def _zone_cache_get(self, key):
+        """Cached zone texts for a key (marked most recently used), or None"""
+        if key not in self._zone_cache:
+            return None
+        self._zone_cache.move_to_end(key)
+        # Copies, so parsing never changes the cached entry
+        return [dict(zt) for zt in self._zone_cache[key]]
+    
+    def _zone_cache_put(self, key, zone_texts):
+        """Remember zone texts, evicting the least recently used images beyond zone_cache_size"""
+        if self.zone_cache_size <= 0:
+            return
+        self._zone_cache[key] = [dict(zt) for zt in zone_texts]
+        self._zone_cache.move_to_end(key)
+        while len(self._zone_cache) > self.zone_cache_size:
+            self._zone_cache.popitem(last=False)
+    
+    def _read_digit_zones(self, gray, zones):
+        """
+        Read schema-labeled stat zones with the digit recognizer
+        
+        Args:
+            gray: Grayscale screenshot
+            zones: Zone dicts (with roles when a zone schema is loaded)
+        
+        Returns:
+            dict: zone index -> (text, confidence) for zones read confidently (the rest
+                  need EasyOCR), or None if the digit recognizer isn't available for these zones
+        """
+        if not self.digit_recognizer:
+            return None
+        stat_zones = [zone for zone in zones if zone.get('role') in STAT_ROLES]
+        if not stat_zones:
+            return None
+        
+        crops = [gray[z['y']:z['y'] + z['height'], z['x']:z['x'] + z['width']] for z in stat_zones]
+        texts = {}
+        for zone, (text, confidence) in zip(stat_zones, self.digit_recognizer.recognize_batch(crops)):
+            if text and confidence >= self.ocr_params['digit_min_confidence']:
+                texts[zone['index']] = (text, confidence)
+        print(f"🔢 Digit recognizer read {len(texts)}/{len(stat_zones)} stat zones (rest → EasyOCR)")
+        return texts
+    
+    def _place_frame_zones(self, gray, layout):
+        """
+        Place a layout's zones on a frame it doesn't fit, with one uniform scale
+        Anchored on the VICTORY banner when the banner template finds it; otherwise the
+        layout is scaled to the frame height and centered (how the game scales its UI)
+        
+        Args:
+            gray: Grayscale screenshot
+            layout: Nearest layout (see LayoutRegistry.select)
+        
+        Returns:
+            list: Zone dicts in image pixels, or None without a zone schema
+        """
+        schema = layout['schema']
+        if not schema:
+            return None
+        height, width = gray.shape[:2]
+        mask_w, mask_h = schema['mask_size']
+        victory = [zone for zone in schema['zones'] if zone['role'] == 'victory']
+        
+        box = None
+        if self.layouts.banner_template is not None and victory:
+            correlation, box = find_banner(gray, self.layouts.banner_template, schema, fits=False)
+            if correlation < BANNER_MIN_CORRELATION:
+                box = None
+        
+        if box:
+            scale = box[2] / victory[0]['width']
+            offset_x, offset_y = box[0] - victory[0]['x'] * scale, box[1] - victory[0]['y'] * scale
+            print(f"🗺 Layout '{layout['name']}' anchored on the VICTORY banner at ({box[0]}, {box[1]}), scale {scale:.2f}")
+        else:
+            scale = height / mask_h
+            offset_x, offset_y = (width - mask_w * scale) / 2, 0
+            print(f"🗺 Layout '{layout['name']}' scaled to the frame height and centered, scale {scale:.2f}")
+        return place_zones(schema, scale, offset_x, offset_y)
+    
+    @staticmethod
+    def _clip_boxes_to_zones(boxes, zones, width, height):
+        """
+        Keep the parts of detected boxes that fall in layout zones
+        A box counts for a zone if most of its height lies inside the zone; it is clipped
+        to the (padded) zone, so a box spanning several stat zones is split between them.
+        Text outside every zone (tabs, team totals, column labels) is dropped
+        
+        Args:
+            boxes: Detected boxes [x_min, x_max, y_min, y_max] in image pixels
+            zones: Placed zone dicts
+            width: Image width
+            height: Image height
+        
+        Returns:
+            list: (zone, [x_min, x_max, y_min, y_max]) pairs
+        """
+        clipped = []
+        for x_min, x_max, y_min, y_max in boxes:
+            box_height = max(1, y_max - y_min)
+            for zone in zones:
+                zx, zy, zw, zh = zone['x'], zone['y'], zone['width'], zone['height']
+                overlap = min(y_max, zy + zh) - max(y_min, zy)
+                if overlap < FRAME_MIN_OVERLAP * min(box_height, zh) or x_max <= zx or x_min >= zx + zw:
+                    continue
+                pad = round(FRAME_ZONE_PAD * zh)
+                left, right = max(x_min, zx - pad, 0), min(x_max, zx + zw + pad, width)
+                top, bottom = max(y_min, zy - pad, 0), min(y_max, zy + zh + pad, height)
+                if right - left >= 4 and bottom - top >= 4:
+                    clipped.append((zone, [left, right, top, bottom]))
+        return clipped
+    
+    def _ocr_frame(self, gray, timer, zones=None):
+        """
+        Layout-free OCR: detect text once on a downscaled copy of the frame, then
+        recognize only the detected boxes on the full-resolution image
+        
+        Args:
+            gray: Grayscale screenshot
+            timer: StageTimer for the current parse
+            zones: Layout zones placed on the frame (see _place_frame_zones); boxes are
+                   clipped to them and their text is labeled with the zone roles
             
-            return parsed_data
+        Returns:
+            list: Zone text dicts - one per placed zone, or without zones one per detected
+                  text box (no roles, so names and stats are paired by position)
+        """
+        params = self.ocr_params
+        height, width = gray.shape[:2]
+        scale = min(1.0, params['coarse_detect_width'] / width)
+        small = gray
+        if scale < 1.0:
+            small = cv2.resize(gray, (round(width * scale), round(height * scale)), interpolation=cv2.INTER_AREA)
+        
+        # One detection pass on the small frame (no extra magnification)
+        detect_params = {key: params[key] for key in DETECT_PARAMS}
+        detect_params['mag_ratio'] = 1.0
+        horizontal_list, free_list = self.reader.detect(small, **detect_params)
+        timer.mark('coarse_detect')
+        
+        # Boxes back to full resolution: [x_min, x_max, y_min, y_max] and 4-point polygons
+        boxes = [[max(0, int(x_min / scale)), min(width, math.ceil(x_max / scale)),
+                  max(0, int(y_min / scale)), min(height, math.ceil(y_max / scale))]
+                 for x_min, x_max, y_min, y_max in horizontal_list[0]]
+        polygons = [[[x / scale, y / scale] for x, y in points] for points in free_list[0]]
+        detected = len(boxes) + len(polygons)
+        
+        clipped = None
+        if zones:
+            # Only text inside the layout's zones is recognized (UI text is horizontal, so no polygons)
+            clipped = self._clip_boxes_to_zones(boxes, zones, width, height)
+            boxes, polygons = [box for _, box in clipped], []
+            print(f"🔍 {detected} boxes detected, {len(boxes)} zone pieces kept for recognition")
+        if not boxes and not polygons:
+            print("⚠ No text detected in the frame")
+            return []
+        
+        results = self.reader.recognize(
+            gray,
+            boxes,
+            polygons,
+            allowlist=self.allowlist,
+            paragraph=False,
+            detail=1,
+            **{key: params[key] for key in RECOGNIZE_PARAMS}
+        )
+        timer.mark('recognize')
+        
+        if clipped is not None:
+            return self._frame_zone_texts(results, clipped, zones, width, height)
+        
+        zone_texts = []
+        for bbox, text, conf in results:
+            if conf <= params['min_confidence']:
+                continue
+            xs = [point[0] for point in bbox]
+            ys = [point[1] for point in bbox]
+            x, y = int(min(xs)), int(min(ys))
+            w, h = int(max(xs)) - x, int(max(ys)) - y
+            zone_texts.append({
+                'zone_index': len(zone_texts),
+                'text': text,
+                'bounds': (x, y, w, h),
+                'confidence': round(float(conf), 3),
+                'is_stats': y > (height * 0.7),
+                'role': None,
+                'slot': None
+            })
+            print(f"📝 Text box {len(zone_texts) - 1} at ({x}, {y}) {w}x{h}: {text[:50]}")
+        
+        print(f"🔍 Whole-frame OCR: {detected} boxes detected at {small.shape[1]}px wide, {len(zone_texts)} kept")
+        return zone_texts
+    
+    def _frame_zone_texts(self, results, clipped, zones, width, height):
+        """
+        Collect whole-frame recognition results per placed zone
+        
+        Args:
+            results: EasyOCR recognize output for the clipped boxes
+            clipped: (zone, box) pairs the boxes came from (see _clip_boxes_to_zones)
+            zones: Placed zone dicts
+            width: Image width
+            height: Image height
+        
+        Returns:
+            list: Zone text dicts with the zones' roles and slots, in zone order
+        """
+        found = {}
+        for bbox, text, conf in results:
+            if conf <= self.ocr_params['min_confidence']:
+                continue
+            cx = sum(point[0] for point in bbox) / len(bbox)
+            cy = sum(point[1] for point in bbox) / len(bbox)
+            # Result -> the clipped box it was recognized from
+            for zone, (x_min, x_max, y_min, y_max) in clipped:
+                if x_min <= cx <= x_max and y_min <= cy <= y_max:
+                    found.setdefault(zone['index'], []).append((x_min, text, conf))
+                    break
+        
+        zone_texts = []
+        for zone in zones:
+            x, y = max(0, zone['x']), max(0, zone['y'])
+            w = min(width, zone['x'] + zone['width']) - x
+            h = min(height, zone['y'] + zone['height']) - y
+            if w <= 0 or h <= 0:
+                continue  # Zone falls outside this frame
+            parts = sorted(found.get(zone['index'], []), key=lambda part: part[0])
+            text = ' '.join(part[1] for part in parts)
+            role = zone['role']
+            zone_texts.append({
+                'zone_index': zone['index'],
+                'text': text,
+                'bounds': (x, y, w, h),
+                'confidence': round(float(sum(part[2] for part in parts) / len(parts)), 3) if parts else 0.0,
+                'is_stats': role in STAT_ROLES,
+                'role': role,
+                'slot': zone.get('slot')
+            })
+            label = role.upper() if role else 'ZONE'
+            print(f"📝 Zone {zone['index']} [{label}] whole-frame OCR: {text[:50].strip()}...")
+        return zone_texts
+    
+    def _read_zone(self, processed_zone, timer=None):
+        """
+        Run EasyOCR text detection and recognition on one preprocessed zone
+        
+        Same work as reader.readtext, split in two calls so detection and
+        recognition can be timed separately
+        
+        Args:
+            processed_zone: Preprocessed grayscale zone image
+            timer: Optional StageTimer; 'detect' and 'recognize' are charged to the current zone
             
-        except Exception as e:
-            print(f"Error parsing screenshot: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        Returns:
+            list: (bbox, text, confidence) tuples
+        """
+        params = self.ocr_params
+        horizontal_list, free_list = self.reader.detect(
+            processed_zone,
+            **{key: params[key] for key in DETECT_PARAMS}
+        )
+        if timer:
+            timer.zone_mark('detect')
+        
+        results = self.reader.recognize(
+            processed_zone,
+            horizontal_list[0],
+            free_list[0],
+            allowlist=self.allowlist,
+            paragraph=False,
+            detail=1,                # Return detailed results with bounding boxes
+            **{key: params[key] for key in RECOGNIZE_PARAMS}
+        )
+        if timer:
+            timer.zone_mark('recognize')
+        return results
     
+    @staticmethod
+    def record_zone_texts(zone_texts):
+        """
+        JSON-ready copy of the raw zone OCR output, stored with each logged match so
+        _parse_zone_texts can re-derive the stats later without re-running OCR
+
+        Args:
+            zone_texts: Zone text dicts built by parse_screenshot
+
+        Returns:
+            list: Dicts with zone_index, text, bounds, confidence, is_stats, role and slot
+        """
+        return [{
+            'zone_index': zt['zone_index'],
+            'text': zt['text'],
+            'bounds': [int(v) for v in zt['bounds']],
+            'confidence': zt.get('confidence', 0.0),
+            'is_stats': bool(zt.get('is_stats')),
+            'role': zt.get('role'),
+            'slot': zt.get('slot')
+        } for zt in zone_texts]
+
     def _parse_zone_texts(self, zone_texts, override=False):
         """
         Parse OCR text from individual zones to extract match time and player statistics
@@ -303,12 +821,17 @@ class OCRParser:
                     print(f"  → Detected text: {combined_upper[:100]}")
                     return None
             
-            # Find match time
-            # First try direct colon format
-            time_match = re.search(r'(\d+):(\d+)', combined_text)
-            if not time_match:
-                # Try comma format (OCR misread)
-                time_match = re.search(r'(\d+),(\d+)', combined_text)
+            # Find match time (the schema's time zone first, then anywhere)
+            time_match = None
+            time_sources = [zt['text'] for zt in zone_texts if zt.get('role') == 'time'] + [combined_text]
+            for source in time_sources:
+                # First try direct colon format
+                time_match = re.search(r'(\d+):(\d+)', source)
+                if not time_match:
+                    # Try comma format (OCR misread)
+                    time_match = re.search(r'(\d+),(\d+)', source)
+                if time_match:
+                    break
             
             if time_match:
                 minutes = int(time_match.group(1))
@@ -316,187 +839,275 @@ class OCRParser:
                 match_time = round(minutes + seconds / 60.0, 2)
                 print(f"\n⏱ Match time found: {minutes}:{seconds:02d} = {match_time} minutes")
             
-            # Separate zones into name zones and stat zones by analyzing y-coordinate
-            # Group zones by y-coordinate to find rows
-            y_groups = {}
-            for zt in zone_texts:
-                x, y, w, h = zt['bounds']
-                y_rounded = round(y / 50) * 50  # Group by ~50px bands
-                if y_rounded not in y_groups:
-                    y_groups[y_rounded] = []
-                y_groups[y_rounded].append(zt)
+            # Zone roles from the schema make parsing a direct lookup;
+            # otherwise names and stats are paired by position
+            if zone_texts and all(zt.get('role') for zt in zone_texts):
+                players = self._parse_schema_players(zone_texts)
+            else:
+                players = self._parse_positional_players(zone_texts, time_match)
+            if players is None:
+                return None
             
-            # Sort y-groups to identify which is names and which is stats
-            sorted_y_groups = sorted(y_groups.items())
+            print(f"\n✅ FINAL: Found {len(players)} players")
+            print(f"✅ Game mode: {game_mode}")
             
-            print(f"\n🔍 ZONE GROUPING: Found {len(sorted_y_groups)} rows")
-            for y_val, zones in sorted_y_groups:
-                print(f"  Row at y≈{y_val}: {len(zones)} zones")
+            return {
+                'match_time': match_time,
+                'game_mode': game_mode,
+                'players': players
+            }
             
-            # Try to pair zones by x-coordinate across rows
-            print("\n📝 PARSING STRATEGY:")
+        except Exception as e:
+            print(f"Error parsing zone texts: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+    
+    def _parse_positional_players(self, zone_texts, time_match):
+        """
+        Pair name zones with stat zones by position (used when there is no zone schema)
+        
+        Args:
+            zone_texts: List of dicts with zone_index, text, and bounds
+            time_match: Match object from time regex (to filter out time values)
+            
+        Returns:
+            list: Player dicts, or None if any player could not be parsed completely
+        """
+        players = []
+        
+        # Separate zones into name zones and stat zones by analyzing y-coordinate
+        # Group zones by y-coordinate to find rows
+        y_groups = {}
+        for zt in zone_texts:
+            x, y, w, h = zt['bounds']
+            y_rounded = round(y / 50) * 50  # Group by ~50px bands
+            if y_rounded not in y_groups:
+                y_groups[y_rounded] = []
+            y_groups[y_rounded].append(zt)
+        
+        # Sort y-groups to identify which is names and which is stats
+        sorted_y_groups = sorted(y_groups.items())
+        
+        print(f"\n🔍 ZONE GROUPING: Found {len(sorted_y_groups)} rows")
+        for y_val, zones in sorted_y_groups:
+            print(f"  Row at y≈{y_val}: {len(zones)} zones")
+        
+        # Try to pair zones by x-coordinate across rows
+        print("\n📝 PARSING STRATEGY:")
+        
+        # Case 1: If we have 2 distinct rows, pair them
+        if len(sorted_y_groups) >= 2:
+            # Find row with names (has letters) and row with stats (has numbers)
+            name_row = None
+            stat_row = None
             
-            # Case 1: If we have 2 distinct rows, pair them
-            if len(sorted_y_groups) >= 2:
-                # Find row with names (has letters) and row with stats (has numbers)
-                name_row = None
-                stat_row = None
+            for y_val, zones in sorted_y_groups:
+                has_letters = any(any(c.isalpha() for c in zt['text']) for zt in zones)
+                has_numbers = any(any(c.isdigit() for c in zt['text']) for zt in zones)
                 
-                for y_val, zones in sorted_y_groups:
-                    has_letters = any(any(c.isalpha() for c in zt['text']) for zt in zones)
-                    has_numbers = any(any(c.isdigit() for c in zt['text']) for zt in zones)
-                    
-                    if has_letters and not has_numbers:
-                        name_row = zones
-                        print(f"  Name row identified at y≈{y_val}")
-                    elif has_numbers and not has_letters:
-                        stat_row = zones
-                        print(f"  Stat row identified at y≈{y_val}")
+                if has_letters and not has_numbers:
+                    name_row = zones
+                    print(f"  Name row identified at y≈{y_val}")
+                elif has_numbers and not has_letters:
+                    stat_row = zones
+                    print(f"  Stat row identified at y≈{y_val}")
+            
+            # Pair zones by x-coordinate with improved spatial awareness
+            if name_row and stat_row:
+                print("  Using paired row strategy with spatial awareness")
                 
-                # Pair zones by x-coordinate with improved spatial awareness
-                if name_row and stat_row:
-                    print("  Using paired row strategy with spatial awareness")
-                    
-                    # Sort name zones and stat zones by x-coordinate for proper pairing
-                    name_row_sorted = sorted(name_row, key=lambda z: z['bounds'][0])
-                    stat_row_sorted = sorted(stat_row, key=lambda z: z['bounds'][0])
-                    
-                    # Group stat zones by detecting GAPS between players
-                    # Zones within a player are ~60-100px apart
-                    # Gaps between players are ~170-200px
-                    player_stat_groups = []
-                    current_group = []
-                    last_x = None
+                # Sort name zones and stat zones by x-coordinate for proper pairing
+                name_row_sorted = sorted(name_row, key=lambda z: z['bounds'][0])
+                stat_row_sorted = sorted(stat_row, key=lambda z: z['bounds'][0])
+                
+                # Group stat zones by detecting GAPS between players
+                # Zones within a player are ~60-100px apart
+                # Gaps between players are ~170-200px
+                player_stat_groups = []
+                current_group = []
+                last_x = None
+                
+                for stat_zone in stat_row_sorted:
+                    x_stat = stat_zone['bounds'][0]
+                    # Start new group if gap is > 150px (indicates new player)
+                    if last_x is not None and (x_stat - last_x) > 150:
+                        # Large gap detected - new player
+                        if current_group:
+                            player_stat_groups.append(current_group)
+                        current_group = [stat_zone]
+                    else:
+                        # Same player - add to current group
+                        current_group.append(stat_zone)
+                    last_x = x_stat
+                
+                if current_group:
+                    player_stat_groups.append(current_group)
+                
+                print(f"  Grouped stats into {len(player_stat_groups)} player groups")
+                
+                # Track all detected names for validation
+                detected_names = []
+                failed_players = []
+                
+                # Now pair each name with its stat group
+                for name_zone in name_row_sorted:
+                    x_name = name_zone['bounds'][0]
+                    name = self._extract_name_from_text(name_zone['text'])
                     
-                    for stat_zone in stat_row_sorted:
-                        x_stat = stat_zone['bounds'][0]
-                        # Start new group if gap is > 150px (indicates new player)
-                        if last_x is not None and (x_stat - last_x) > 150:
-                            # Large gap detected - new player
-                            if current_group:
-                                player_stat_groups.append(current_group)
-                            current_group = [stat_zone]
-                        else:
-                            # Same player - add to current group
-                            current_group.append(stat_zone)
-                        last_x = x_stat
+                    if not name:
+                        continue
                     
-                    if current_group:
-                        player_stat_groups.append(current_group)
+                    detected_names.append(name)
                     
-                    print(f"  Grouped stats into {len(player_stat_groups)} player groups")
+                    # Find the closest stat group by x-coordinate
+                    best_group = None
+                    min_distance = float('inf')
                     
-                    # Track all detected names for validation
-                    detected_names = []
-                    failed_players = []
+                    for stat_group in player_stat_groups:
+                        # Use the leftmost zone in the group for distance calculation
+                        group_x = stat_group[0]['bounds'][0]
+                        distance = abs(x_name - group_x)
+                        if distance < min_distance:
+                            min_distance = distance
+                            best_group = stat_group
                     
-                    # Now pair each name with its stat group
-                    for name_zone in name_row_sorted:
-                        x_name = name_zone['bounds'][0]
-                        name = self._extract_name_from_text(name_zone['text'])
-                        
-                        if not name:
-                            continue
+                    if best_group and min_distance < 500:  # Within 500px
+                        # Extract numbers from all zones in this group
+                        player_stats = []
                         
-                        detected_names.append(name)
+                        # First zone is typically the score (larger zone)
+                        for i, stat_zone in enumerate(best_group):
+                            is_score = (i == 0 and stat_zone['bounds'][2] > 60)  # width > 60px = score
+                            numbers = self._extract_numbers_from_text(
+                                stat_zone['text'], 
+                                time_match,
+                                is_score_zone=is_score
+                            )
+                            player_stats.extend(numbers)
                         
-                        # Find the closest stat group by x-coordinate
-                        best_group = None
-                        min_distance = float('inf')
+                        print(f"  Stats for {name}: {player_stats}")
                         
-                        for stat_group in player_stat_groups:
-                            # Use the leftmost zone in the group for distance calculation
-                            group_x = stat_group[0]['bounds'][0]
-                            distance = abs(x_name - group_x)
-                            if distance < min_distance:
-                                min_distance = distance
-                                best_group = stat_group
-                        
-                        if best_group and min_distance < 500:  # Within 500px
-                            # Extract numbers from all zones in this group
-                            player_stats = []
-                            
-                            # First zone is typically the score (larger zone)
-                            for i, stat_zone in enumerate(best_group):
-                                is_score = (i == 0 and stat_zone['bounds'][2] > 60)  # width > 60px = score
-                                numbers = self._extract_numbers_from_text(
-                                    stat_zone['text'], 
-                                    time_match,
-                                    is_score_zone=is_score
-                                )
-                                player_stats.extend(numbers)
+                        # Validate and assign stats (score, kills, deaths, assists, playtime_minutes)
+                        if len(player_stats) >= 4:
+                            # Filter out obviously wrong values
+                            score = player_stats[0] if 1000 <= player_stats[0] <= 50000 else None
+                            if not score and len(player_stats) > 4:
+                                # Try next value as score
+                                score = player_stats[1] if 1000 <= player_stats[1] <= 50000 else player_stats[0]
+                                player_stats = player_stats[1:]
                             
-                            print(f"  Stats for {name}: {player_stats}")
+                            player_data = {
+                                'name': name,
+                                'score': player_stats[0],
+                                'kills': player_stats[1],
+                                'deaths': player_stats[2],
+                                'assists': player_stats[3]
+                            }
                             
-                            # Validate and assign stats (score, kills, deaths, assists, playtime_minutes)
-                            if len(player_stats) >= 4:
-                                # Filter out obviously wrong values
-                                score = player_stats[0] if 1000 <= player_stats[0] <= 50000 else None
-                                if not score and len(player_stats) > 4:
-                                    # Try next value as score
-                                    score = player_stats[1] if 1000 <= player_stats[1] <= 50000 else player_stats[0]
-                                    player_stats = player_stats[1:]
-                                
-                                player_data = {
-                                    'name': name,
-                                    'score': player_stats[0],
-                                    'kills': player_stats[1],
-                                    'deaths': player_stats[2],
-                                    'assists': player_stats[3]
-                                }
-                                
-                                # Extract playtime if available (5th stat)
-                                if len(player_stats) >= 5:
-                                    playtime_minutes = player_stats[4]
-                                    # Validate playtime (should be reasonable: 0-60 minutes typically)
-                                    if 0 <= playtime_minutes <= 120:
-                                        player_data['playtime_minutes'] = playtime_minutes
-                                        print(f"  ✓ PAIRED: {name} - Score: {player_stats[0]}, K/D/A: {player_stats[1]}/{player_stats[2]}/{player_stats[3]}, Playtime: {playtime_minutes}m")
-                                    else:
-                                        print(f"  ✓ PAIRED: {name} - Score: {player_stats[0]}, K/D/A: {player_stats[1]}/{player_stats[2]}/{player_stats[3]}")
+                            # Extract playtime if available (5th stat)
+                            if len(player_stats) >= 5:
+                                playtime_minutes = player_stats[4]
+                                # Validate playtime (should be reasonable: 0-60 minutes typically)
+                                if 0 <= playtime_minutes <= 120:
+                                    player_data['playtime_minutes'] = playtime_minutes
+                                    print(f"  ✓ PAIRED: {name} - Score: {player_stats[0]}, K/D/A: {player_stats[1]}/{player_stats[2]}/{player_stats[3]}, Playtime: {playtime_minutes}m")
                                 else:
                                     print(f"  ✓ PAIRED: {name} - Score: {player_stats[0]}, K/D/A: {player_stats[1]}/{player_stats[2]}/{player_stats[3]}")
-                                
-                                players.append(player_data)
-                                
-                                # Remove this group so it's not reused
-                                player_stat_groups.remove(best_group)
                             else:
-                                print(f"  ✗ FAILED: Name '{name}' found but insufficient stats: {player_stats}")
-                                failed_players.append(name)
+                                print(f"  ✓ PAIRED: {name} - Score: {player_stats[0]}, K/D/A: {player_stats[1]}/{player_stats[2]}/{player_stats[3]}")
+                            
+                            players.append(player_data)
+                            
+                            # Remove this group so it's not reused
+                            player_stat_groups.remove(best_group)
                         else:
-                            print(f"  ✗ FAILED: Name '{name}' found but no nearby stat group (min_distance={min_distance})")
+                            print(f"  ✗ FAILED: Name '{name}' found but insufficient stats: {player_stats}")
                             failed_players.append(name)
-                    
-                    # ALL-OR-NOTHING VALIDATION: If any player failed, reject entire screenshot
-                    if failed_players:
-                        print(f"\n❌ REJECTING SCREENSHOT: Failed to extract complete stats for {len(failed_players)} player(s): {', '.join(failed_players)}")
-                        print(f"   → Successfully parsed: {len(players)} player(s)")
-                        print(f"   → Failed to parse: {len(failed_players)} player(s)")
-                        print(f"   → All-or-nothing policy: Rejecting entire screenshot")
-                        return None
-                else:
-                    print("  ⚠ Could not identify distinct name/stat rows, trying single-zone strategy")
-                    # Fall back to single zone strategy
-                    players = self._parse_single_zone_strategy(zone_texts, time_match)
+                    else:
+                        print(f"  ✗ FAILED: Name '{name}' found but no nearby stat group (min_distance={min_distance})")
+                        failed_players.append(name)
+                
+                # ALL-OR-NOTHING VALIDATION: If any player failed, reject entire screenshot
+                if failed_players:
+                    print(f"\n❌ REJECTING SCREENSHOT: Failed to extract complete stats for {len(failed_players)} player(s): {', '.join(failed_players)}")
+                    print(f"   → Successfully parsed: {len(players)} player(s)")
+                    print(f"   → Failed to parse: {len(failed_players)} player(s)")
+                    print(f"   → All-or-nothing policy: Rejecting entire screenshot")
+                    return None
             else:
-                print("  Using single-zone strategy (all data in one zone)")
+                print("  ⚠ Could not identify distinct name/stat rows, trying single-zone strategy")
+                # Fall back to single zone strategy
                 players = self._parse_single_zone_strategy(zone_texts, time_match)
+        else:
+            print("  Using single-zone strategy (all data in one zone)")
+            players = self._parse_single_zone_strategy(zone_texts, time_match)
+        
+        return players
+    
+    def _parse_schema_players(self, zone_texts):
+        """
+        Read players straight from zones labeled by the zone schema
+        
+        Each player slot has a name zone and score/kills/deaths/assists (and
+        optionally playtime) zones, so no pairing is needed. Slots with no name
+        are empty cards (e.g. duos) and skipped.
+        
+        Args:
+            zone_texts: List of dicts with zone_index, text, bounds, role and slot
             
-            print(f"\n✅ FINAL: Found {len(players)} players")
-            print(f"✅ Game mode: {game_mode}")
+        Returns:
+            list: Player dicts, or None if any player could not be parsed completely
+        """
+        print("  Using zone schema (direct role lookup)")
+        slots = {}
+        for zt in zone_texts:
+            if zt.get('slot') is not None:
+                slots.setdefault(zt['slot'], {})[zt['role']] = zt['text']
+        
+        players = []
+        failed_players = []
+        for slot in sorted(slots):
+            roles = slots[slot]
+            name = self._extract_name_from_text(roles.get('name', ''))
+            if not name:
+                continue
             
-            return {
-                'match_time': match_time,
-                'game_mode': game_mode,
-                'players': players
-            }
+            stats = {}
+            for role in STAT_ROLES:
+                if role not in roles:
+                    continue
+                # The match time has its own zone, so no time filtering (a kill count can equal the minutes)
+                numbers = self._extract_numbers_from_text(roles[role], None, is_score_zone=(role == 'score'))
+                if numbers:
+                    stats[role] = numbers[0]
             
-        except Exception as e:
-            print(f"Error parsing zone texts: {e}")
-            import traceback
-            traceback.print_exc()
+            missing = [role for role in ('score', 'kills', 'deaths', 'assists') if role not in stats]
+            if missing:
+                print(f"  ✗ FAILED: Name '{name}' found but no {'/'.join(missing)} in its stat zones")
+                failed_players.append(name)
+                continue
+            
+            player_data = {
+                'name': name,
+                'score': stats['score'],
+                'kills': stats['kills'],
+                'deaths': stats['deaths'],
+                'assists': stats['assists']
+            }
+            # Playtime only if the schema has a playtime zone and the value is reasonable
+            if 0 <= stats.get('playtime', -1) <= 120:
+                player_data['playtime_minutes'] = stats['playtime']
+            print(f"  ✓ SLOT {slot + 1}: {name} - Score: {stats['score']}, K/D/A: {stats['kills']}/{stats['deaths']}/{stats['assists']}")
+            players.append(player_data)
+        
+        # ALL-OR-NOTHING VALIDATION: If any player failed, reject entire screenshot
+        if failed_players:
+            print(f"\n❌ REJECTING SCREENSHOT: Failed to extract complete stats for {len(failed_players)} player(s): {', '.join(failed_players)}")
+            print(f"   → All-or-nothing policy: Rejecting entire screenshot")
             return None
+        
+        return players
     
     def _extract_name_from_text(self, text):
         """Extract player name from text"""
@@ -511,6 +1122,7 @@ class OCRParser:
         """
         Extract numbers from text, filtering out time values
         Handles various OCR artifacts like spaces, extra digits, comma misreads
+        (single-pass tokenizer, see number_tokenizer.py)
         
         Args:
             text: Text to extract numbers from
@@ -524,89 +1136,8 @@ class OCRParser:
         if text.strip():
             print(f"    🔢 Extracting numbers from: '{text}' (is_score_zone={is_score_zone})")
         
-        # First, try to find properly formatted scores with commas
-        # Handle: "11,665", "9, 990" (space after comma), "17 ,760" (space before comma)
-        # Remove spaces around commas first
-        text_no_space_comma = re.sub(r'\s*,\s*', ',', text)
-        comma_numbers = re.findall(r'\d{1,2},\d{3}', text_no_space_comma)
-        if comma_numbers and is_score_zone:
-            # Remove commas and spaces, then convert to int
-            score_candidates = [int(n.replace(',', '').replace(' ', '')) for n in comma_numbers]
-            # Filter to reasonable score range (1000-50000)
-            scores = [s for s in score_candidates if 1000 <= s <= 50000]
-            if scores:
-                print(f"    ✓ Found comma-formatted score: {scores}")
-                return scores
-        
-        text_cleaned = text
-        
-        # ENHANCED: Handle "X X XXX" patterns specifically (like "9 1 990")
-        # This is a common OCR error where the comma in "9,990" becomes a space and "1"
-        space_pattern = re.search(r'(\d+)\s+(\d+)\s+(\d{3})', text_cleaned)
-        if space_pattern and is_score_zone:
-            first = space_pattern.group(1)
-            middle = space_pattern.group(2)
-            last = space_pattern.group(3)
-            
-            # Try concatenating all parts: "9 1 990" -> "91990"
-            combined_all = int(first + middle + last)
-            if 1000 <= combined_all <= 50000:
-                print(f"    ✓ Found space-separated score: '{space_pattern.group(0)}' -> {combined_all}")
-                return [combined_all]
-            
-            # If that's out of range, try dropping the middle digit: "9 1 990" -> "9990"
-            # This handles OCR misreading comma as space+digit
-            combined_no_middle = int(first + last)
-            if 1000 <= combined_no_middle <= 50000:
-                print(f"    ✓ Found comma-misread pattern: '{space_pattern.group(0)}' -> {combined_no_middle} (dropped middle '{middle}')")
-                return [combined_no_middle]
-        
-        # Special case: Handle "11 0 190" pattern (middle 0 should be 1)
-        # Pattern: XX 0 XXX where the 0 is likely a misread 1
-        text_cleaned = re.sub(r'(\d{2})\s+0\s+(\d{3})', r'\g<1>1\2', text_cleaned)
-        
-        # Handle comma-space combinations: "9, 990" -> "9,990" then "9990"
-        text_cleaned = re.sub(r'(\d),\s+(\d)', r'\1,\2', text_cleaned)
-        
-        # Handle space-separated digit groups: "12 089" -> "12089", "12 1 220" -> "12220"
-        # Be aggressive: replace any sequence of [digit][space/comma][digit] with concatenated digits
-        iteration_count = 0
-        while iteration_count < 10:  # Safety limit
-            new_text = re.sub(r'(\d+)[,\s]+(\d+)', r'\1\2', text_cleaned)
-            if new_text == text_cleaned:
-                break
-            text_cleaned = new_text
-            iteration_count += 1
-        
-        # Handle comma misread patterns more carefully
-        # Pattern 1: Middle "1" in 6-digit number like "121220" -> "12220"
-        # Only if it looks like: XX1XXX where the last 3 digits would make sense as decimals
-        text_cleaned = re.sub(r'(\d{2})1(\d{3})(?!\d)', r'\1\2', text_cleaned)
-        
-        # Pattern 2: Leading "2" on 6-digit scores (but NOT leading "1")
-        # "210665" -> "10665" (comma misread as 2)
-        # But preserve "110190" as it could be valid
-        text_cleaned = re.sub(r'\b2(\d{5})\b', r'\1', text_cleaned)
-        
-        # Extract all numbers
-        numbers = re.findall(r'\d+', text_cleaned)
-        numbers = [int(n) for n in numbers]
-        
-        print(f"    → After cleaning: {numbers}")
-        
-        # Filter out time numbers
-        if time_match:
-            minutes_val = int(time_match.group(1))
-            seconds_val = int(time_match.group(2))
-            numbers = [n for n in numbers if n != minutes_val and n != seconds_val]
-        
-        # If this is a score zone, filter to reasonable score ranges
-        if is_score_zone:
-            # Scores are typically 1,000 - 50,000
-            original_count = len(numbers)
-            numbers = [n for n in numbers if 1000 <= n <= 50000]
-            if len(numbers) < original_count:
-                print(f"    ⚠ Filtered out non-score values (kept {len(numbers)}/{original_count})")
+        time_values = (int(time_match.group(1)), int(time_match.group(2))) if time_match else None
+        numbers = extract_numbers(text, time_values, is_score_zone)
         
         print(f"    → Final numbers: {numbers}")
         return numbers
@@ -649,10 +1180,36 @@ class OCRParser:
         
         return players
     
+    def _get_clahe(self):
+        """Shared CLAHE object for the current clahe_clip/clahe_tile parameters"""
+        key = (self.ocr_params['clahe_clip'], self.ocr_params['clahe_tile'])
+        if self._clahe_key != key:
+            clip_limit, tile = key
+            self._clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(tile, tile))
+            self._clahe_key = key
+        return self._clahe
+    
+    def _zone_scale(self, zone_height):
+        """
+        Scale factor that brings a zone to the target text height
+        
+        Args:
+            zone_height: Zone height in pixels
+            
+        Returns:
+            float: Scale factor, clamped to min_zone_scale..max_zone_scale
+        """
+        params = self.ocr_params
+        scale = params['target_zone_height'] / max(zone_height, 1)
+        return min(max(scale, params['min_zone_scale']), params['max_zone_scale'])
+    
     def _preprocess_zone(self, zone_image, is_stats_zone):
         """
         Enhanced preprocessing with different strategies for stats vs name zones
         
+        Zones are scaled by their pixel height rather than a fixed factor, so a 4K
+        screenshot doesn't produce crops several times larger than a 1080p one
+        
         Args:
             zone_image: Grayscale zone image
             is_stats_zone: Boolean indicating if this is a stats zone (numbers)
@@ -663,25 +1220,26 @@ class OCRParser:
         try:
             original_h, original_w = zone_image.shape
             
-            # Always upscale for better OCR
-            scale_factor = 3
-            zone_image = cv2.resize(
-                zone_image,
-                (original_w * scale_factor, original_h * scale_factor),
-                interpolation=cv2.INTER_CUBIC
-            )
+            # Scale to the target text height (small zones up, oversized zones down)
+            scale_factor = self._zone_scale(original_h)
+            if abs(scale_factor - 1.0) > 0.05:
+                zone_image = cv2.resize(
+                    zone_image,
+                    (max(1, round(original_w * scale_factor)), max(1, round(original_h * scale_factor))),
+                    interpolation=cv2.INTER_CUBIC if scale_factor > 1 else cv2.INTER_AREA
+                )
+            
+            clahe = self._get_clahe()
             
             # For stats zones (numbers), use minimal preprocessing
             # Let EasyOCR's neural network handle the raw image
             if is_stats_zone:
                 # Only apply gentle contrast enhancement - no thresholding
                 # This prevents creating artifacts from shapes/icons
-                clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
                 zone_image = clahe.apply(zone_image)
             else:
                 # For name zones, use lighter preprocessing
                 # Just enhance contrast
-                clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
                 zone_image = clahe.apply(zone_image)
             
             return zone_image
@@ -0,0 +1,100 @@
+"""
+Compact per-player aggregate records used by StatsManager
+Each record uses __slots__ instead of a per-player dict, and is only
+materialized as a dict when exporting to JSON or formatting embeds
+"""
+
+
+class ModeStats:
+    """Aggregate totals for a single player in one game mode (duos/squads)"""
+
+    __slots__ = ('display_name', 'wins', 'kills', 'deaths', 'score', 'games_played')
+
+    # Field order used for the dict view (matches stats_data.json layout)
+    FIELDS = ('display_name', 'wins', 'kills', 'deaths', 'score', 'games_played')
+
+    def __init__(self, display_name):
+        self.display_name = display_name
+        self.wins = 0
+        self.kills = 0
+        self.deaths = 0
+        self.score = 0
+        self.games_played = 0
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a record from a stats_data.json player entry
+
+        Args:
+            data: Player stats dictionary (missing fields default to zero)
+
+        Returns:
+            Record instance
+        """
+        record = cls(data.get('display_name', ''))
+        for field in cls.FIELDS[1:]:
+            if field in data:
+                setattr(record, field, data[field])
+        return record
+
+    def to_dict(self):
+        """Materialize the record as a plain dict (for JSON export and embeds)"""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def merge(self, other):
+        """Add another record's totals into this one (used to sum time-window buckets)"""
+        for field in self.FIELDS[1:]:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        if len(other.display_name) > len(self.display_name):
+            self.display_name = other.display_name
+
+    def add_match(self, kills, deaths, score):
+        """Accumulate one victory into the mode totals"""
+        self.wins += 1
+        self.kills += kills
+        self.deaths += deaths
+        self.score += score
+        self.games_played += 1
+
+    def remove_match(self, kills, deaths, score):
+        """Reverse a previously accumulated victory (clamped at zero)"""
+        self.wins = max(0, self.wins - 1)
+        self.games_played = max(0, self.games_played - 1)
+        self.kills = max(0, self.kills - kills)
+        self.deaths = max(0, self.deaths - deaths)
+        self.score = max(0, self.score - score)
+
+
+class PlayerStats(ModeStats):
+    """Overall aggregate totals for a single player (all modes, with assists and playtime)"""
+
+    __slots__ = ('assists', 'playtime')
+
+    FIELDS = ('display_name', 'wins', 'kills', 'deaths', 'assists', 'score', 'playtime', 'games_played')
+
+    def __init__(self, display_name):
+        super().__init__(display_name)
+        self.assists = 0
+        self.playtime = 0.0
+
+    def add_match(self, kills, deaths, score, assists=0, playtime=0.0):
+        """Accumulate one victory into the overall totals"""
+        super().add_match(kills, deaths, score)
+        self.assists += assists
+        self.playtime += playtime
+
+    def remove_match(self, kills, deaths, score, assists=0, playtime=0.0, totals_only=False):
+        """
+        Reverse a previously accumulated victory (clamped at zero)
+
+        Args:
+            totals_only: Only reverse wins/games/playtime (old log entries without per-player stats)
+        """
+        if totals_only:
+            self.wins = max(0, self.wins - 1)
+            self.games_played = max(0, self.games_played - 1)
+        else:
+            super().remove_match(kills, deaths, score)
+            self.assists = max(0, self.assists - assists)
+        self.playtime = max(0, self.playtime - playtime)
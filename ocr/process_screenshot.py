@@ -11,26 +11,8 @@ import io
 
 async def process_screenshot(image_path):
     """Process a screenshot and show results"""
-    # Find Tesseract installation
-    import os
-    tesseract_path = None
-    common_paths = [
-        r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-        r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-    ]
-    for path in common_paths:
-        if os.path.exists(path):
-            tesseract_path = path
-            print(f"✅ Found Tesseract at: {tesseract_path}")
-            break
-    
-    if not tesseract_path:
-        print("❌ Tesseract not found. Please install Tesseract OCR.")
-        print("   Download from: https://github.com/UB-Mannheim/tesseract/wiki")
-        return
-    
     # Initialize parser with correct relative path from ocr directory
-    parser = OCRParser(tesseract_path=tesseract_path, debug_output=True, mask_path='zones.png')
+    parser = OCRParser(debug_output=True, mask_path='zones.png')
     
     # Load the screenshot
     screenshot_path = Path(image_path)
@@ -2,11 +2,14 @@
 RecZone manager for monitoring victory screenshots and tracking player stats
 """
 
+import asyncio
 import discord
 from discord.ext import commands
 import configparser
 import aiohttp
-from ocr.parser import OCRParser
+from ocr.parser import OCRParser, ocr_params_from_config
+from ocr.scoreboard_filter import ScoreboardFilter
+from ocr.screenshot_store import ScreenshotStore
 from ocr.stats_manager import StatsManager
 
 
@@ -36,13 +39,35 @@ class RecZoneManager:
             self.write_channel_id = None
             self.bot_channel_id = None
         
+        # Matches older than this many days are moved to compressed archive segments (0 = off)
+        archive_after_days = self.config.getint('RecZone', 'archive_after_days', fallback=0)
+        
+        # Tuned OCR parameter preset from ocr/tuner.py (empty = built-in defaults)
+        ocr_preset = self.config.get('RecZone', 'ocr_preset', fallback='').strip()
+        
         # Initialize OCR and stats
-        self.parser = OCRParser()
-        self.stats_manager = StatsManager()
+        self.parser = OCRParser(ocr_params=ocr_params_from_config(self.config, ocr_preset))
+        self.stats_manager = StatsManager(archive_after_days=archive_after_days)
+        
+        # Cheap layout check that keeps non-scoreboard images away from OCR ("override" skips it)
+        use_filter = self.config.getboolean('RecZone', 'scoreboard_filter', fallback=True)
+        self.scoreboard_filter = ScoreboardFilter(self.parser.layouts) if use_filter else None
+        
+        # Local copy of every downloaded screenshot, so rebuilds don't need the Discord CDN (empty = off)
+        store_dir = self.config.get('RecZone', 'screenshot_store', fallback='ocr/screenshots').strip()
+        store_webp = self.config.getboolean('RecZone', 'screenshot_store_webp', fallback=False)
+        self.screenshot_store = ScreenshotStore(store_dir, lossless_webp=store_webp) if store_dir else None
         
         # Track rebuilding state
         self.is_rebuilding = False  # Flag to track if we're rebuilding database
         
+        # Stats data version of the last leaderboard posted to RecZone
+        self.last_posted_version = None
+        
+        # Serializes stats mutations on the bot loop; a running rebuild holds it
+        self.stats_lock = asyncio.Lock()
+        self._recalc_future = None  # In-flight rebuild (shared by concurrent requests)
+        
         print(f"RecZone manager initialized with EasyOCR support")
         print(f"Channels - Read: {self.read_channel_id}, Write: {self.write_channel_id}")
     
@@ -114,18 +139,34 @@ class RecZoneManager:
             except Exception as e:
                 print(f"⚠ Could not clear bot reactions: {e}")
             
-            # Download image
-            print(f"⬇ RecZone: Downloading screenshot: {attachment.filename}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(attachment.url) as resp:
-                    if resp.status != 200:
-                        print(f"✗ RecZone: Failed to download image (HTTP {resp.status})")
-                        await self._send_error(f"Failed to download image: {attachment.filename}")
-                        return
-                    
-                    image_bytes = await resp.read()
+            # Use the local copy if this screenshot was downloaded before (e.g. during a rebuild)
+            log_key = f"{original_message.id}_{attachment.id}"
+            image_bytes = self._load_stored_screenshot(log_key)
+            if image_bytes is not None:
+                print(f"✓ RecZone: Loaded {attachment.filename} from the local screenshot store ({len(image_bytes)} bytes)")
+            else:
+                # Download image
+                print(f"⬇ RecZone: Downloading screenshot: {attachment.filename}")
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(attachment.url) as resp:
+                        if resp.status != 200:
+                            print(f"✗ RecZone: Failed to download image (HTTP {resp.status})")
+                            await self._send_error(f"Failed to download image: {attachment.filename}")
+                            return
+                        
+                        image_bytes = await resp.read()
+                
+                print(f"✓ RecZone: Download complete ({len(image_bytes)} bytes)")
+            
+            # Reject images that don't look like a victory scoreboard before any OCR
+            if self.scoreboard_filter and not override_mode:
+                is_scoreboard, reason = self.scoreboard_filter.check(image_bytes)
+                if not is_scoreboard:
+                    await self._send_error(f"Not a victory scoreboard ({reason}): {attachment.filename}", original_message)
+                    print(f"  → Re-post with \"override\" if this is a scoreboard")
+                    return
             
-            print(f"✓ RecZone: Download complete ({len(image_bytes)} bytes)")
+            sha256 = self._store_screenshot(image_bytes, log_key)
             
             # Parse screenshot
             print(f"🔍 RecZone: Starting OCR parsing on {attachment.filename}...")
@@ -136,23 +177,27 @@ class RecZoneManager:
                 await self._send_error(f"Failed to parse screenshot: {attachment.filename}", original_message)
                 return
             
+            if sha256:
+                parsed_data['sha256'] = sha256
+            
             # Display parsed results
             player_names = [p['name'] for p in parsed_data['players']]
             print(f"✓ RecZone: OCR parsing successful!")
             print(f"  → Found {len(parsed_data['players'])} player(s): {', '.join(player_names)}")
             print(f"  → Match time: {parsed_data['match_time']:.2f} minutes")
             
-            # Update stats
+            # Update stats (waits for a running rebuild to finish)
             print(f"💾 RecZone: Updating player stats in database...")
-            self.stats_manager.update_player_stats(parsed_data)
-            
-            # Log the screenshot
-            self.stats_manager.log_screenshot(
-                original_message.id,
-                attachment.id,
-                attachment.filename,
-                parsed_data
-            )
+            async with self.stats_lock:
+                self.stats_manager.update_player_stats(parsed_data)
+                
+                # Log the screenshot
+                self.stats_manager.log_screenshot(
+                    original_message.id,
+                    attachment.id,
+                    attachment.filename,
+                    parsed_data
+                )
             
             print(f"✓ RecZone: Stats saved to database successfully")
             
@@ -165,6 +210,36 @@ class RecZoneManager:
             traceback.print_exc()
             await self._send_error(f"Error processing {attachment.filename}: {str(e)}")
     
+    def _load_stored_screenshot(self, log_key):
+        """
+        Read a previously downloaded screenshot from the local store
+        
+        Args:
+            log_key: Screenshot log key ("<message_id>_<attachment_id>")
+            
+        Returns:
+            bytes: Image bytes, or None if it isn't stored (or the store is off)
+        """
+        if not self.screenshot_store:
+            return None
+        sha256 = self.screenshot_store.lookup(log_key)
+        return self.screenshot_store.get(sha256) if sha256 else None
+    
+    def _store_screenshot(self, image_bytes, log_key):
+        """
+        Keep a downloaded screenshot in the local store
+        
+        Returns:
+            str: SHA-256 of the image, or None if the store is off or the write failed
+        """
+        if not self.screenshot_store:
+            return None
+        try:
+            return self.screenshot_store.put(image_bytes, log_key)
+        except Exception as e:
+            print(f"⚠ RecZone: Could not store screenshot locally: {e}")
+            return None
+    
     async def _send_confirmation(self, parsed_data, filename, original_message):
         """Log confirmation message to console and add success emoji"""
         try:
@@ -197,9 +272,19 @@ class RecZoneManager:
         except Exception as e:
             print(f"✗ RecZone: Error in confirmation: {e}")
     
-    async def _auto_post_leaderboard(self):
-        """Automatically post leaderboard sorted by score to READ channel - deletes all previous bot messages first"""
+    async def _auto_post_leaderboard(self, force=False):
+        """
+        Automatically post leaderboard sorted by score to READ channel - deletes all previous bot messages first
+        
+        Args:
+            force: Repost even if stats haven't changed since the last post
+        """
         try:
+            # Skip the delete/repost cycle if nothing changed since the last post
+            if not force and self.last_posted_version == self.stats_manager.data_version:
+                print("  → Leaderboard unchanged since last post (skipping)")
+                return
+
             # Auto-post to READ channel (RecZone), not write channel
             channel = self.bot.get_channel(self.read_channel_id)
             if not channel:
@@ -222,6 +307,7 @@ class RecZoneManager:
                 print(f"  → Deleted {deleted_count} previous bot message(s) from RecZone")
             
             # Get leaderboard sorted by score
+            posted_version = self.stats_manager.data_version
             embed_data = self.stats_manager.format_leaderboard_embed('score', min_games=2)
             
             embed = discord.Embed(
@@ -240,6 +326,7 @@ class RecZoneManager:
             
             # Post new leaderboard to READ channel (RecZone)
             new_message = await channel.send(embed=embed)
+            self.last_posted_version = posted_version
             print(f"Leaderboard posted to RecZone successfully (Message ID: {new_message.id})")
             
         except Exception as e:
@@ -426,20 +513,19 @@ class RecZoneManager:
                         )
                         if not has_matching_attachment:
                             print(f"Screenshot deleted: {log_entry['filename']}")
-                            self.stats_manager.remove_screenshot_stats(log_entry)
-                            del self.stats_manager.screenshot_log[log_key]
+                            async with self.stats_lock:
+                                self.stats_manager.remove_screenshot(log_key)
                             deleted_count += 1
                     except discord.NotFound:
                         # Message was deleted entirely
                         print(f"Message with screenshot deleted: {log_entry['filename']}")
-                        self.stats_manager.remove_screenshot_stats(log_entry)
-                        del self.stats_manager.screenshot_log[log_key]
+                        async with self.stats_lock:
+                            self.stats_manager.remove_screenshot(log_key)
                         deleted_count += 1
                     except Exception as e:
                         print(f"Error checking message {message_id}: {e}")
             
             if deleted_count > 0:
-                self.stats_manager.save_screenshot_log()
                 print(f"Removed stats for {deleted_count} deleted screenshot(s)")
                 
         except Exception as e:
@@ -447,6 +533,43 @@ class RecZoneManager:
             import traceback
             traceback.print_exc()
     
+    async def recalculate_stats(self, reload_log=False):
+        """
+        Rebuild all stats from the screenshot log on a worker thread
+        Concurrent requests (e.g. .refresh and the GUI button) share one rebuild,
+        and screenshot processing waits for it instead of racing it
+        
+        Args:
+            reload_log: Re-read screenshot_log.json (and the event log tail) first
+            
+        Returns:
+            tuple: (success: bool, message: str, stats_count: int)
+        """
+        if self._recalc_future is None or self._recalc_future.done():
+            self._recalc_future = asyncio.ensure_future(self._run_recalculation(reload_log))
+        return await asyncio.shield(self._recalc_future)
+    
+    async def _run_recalculation(self, reload_log):
+        """Run one rebuild in the default executor while holding the stats lock"""
+        async with self.stats_lock:
+            loop = asyncio.get_event_loop()
+            if reload_log:
+                await loop.run_in_executor(None, self.stats_manager.load_screenshot_log)
+            return await loop.run_in_executor(None, self.stats_manager.recalculate_all_stats_from_log)
+    
+    async def reset_stats(self):
+        """
+        Delete all stats and logs (GUI "Rebuild Database") on a worker thread
+        Holds the stats lock, so it waits for screenshot processing and rebuilds
+        and they can't write the old stats back afterwards
+        
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        async with self.stats_lock:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self.stats_manager.reset)
+    
     def register_commands(self, bot):
         """Register stats commands with the bot"""
         
@@ -468,8 +591,7 @@ class RecZoneManager:
                 
                 # Reload screenshot log and rebuild stats from it
                 print("🔄 Reloading screenshot log and rebuilding stats...")
-                self.stats_manager.load_screenshot_log()
-                success, message, stats_count = self.stats_manager.recalculate_all_stats_from_log()
+                success, message, stats_count = await self.recalculate_stats(reload_log=True)
                 
                 if success:
                     print(f"  ✓ {message}")
@@ -479,7 +601,7 @@ class RecZoneManager:
                 
                 # Use existing auto-post leaderboard which handles cleanup
                 print("🔄 Manual refresh requested - posting leaderboard...")
-                await self._auto_post_leaderboard()
+                await self._auto_post_leaderboard(force=True)
                 
                 # If command was from bot channel, send confirmation there
                 if ctx.channel.id == self.bot_channel_id:
@@ -491,9 +613,9 @@ class RecZoneManager:
                 if ctx.channel.id == self.bot_channel_id:
                     await ctx.send(error_msg)
         
-        @bot.command(name='stats', help='Display player stats leaderboard (sorted by score)')
-        async def stats_command(ctx):
-            """Display stats leaderboard sorted by score"""
+        @bot.command(name='stats', help='Display player stats leaderboard (sorted by score). Optional window: today, week, month or Nd (e.g. 14d)')
+        async def stats_command(ctx, window: str = None):
+            """Display stats leaderboard sorted by score, optionally limited to a recent time window"""
             # Only allow commands from the designated bot channel
             if ctx.channel.id != self.bot_channel_id:
                 return  # Silently ignore commands from other channels
@@ -519,7 +641,16 @@ class RecZoneManager:
                 print(f"  → Deleted {deleted_count} previous bot message(s) from bot channel")
             
             # Get leaderboard sorted by score (min 2 games like auto-post)
-            embed_data = self.stats_manager.format_leaderboard_embed('score', min_games=2)
+            # Time-windowed boards count every player with a win in the window
+            try:
+                days = self.stats_manager.parse_window(window)
+            except ValueError as e:
+                await bot_channel.send(f"❌ {e}")
+                return
+            if days is None:
+                embed_data = self.stats_manager.format_leaderboard_embed('score', min_games=2)
+            else:
+                embed_data = self.stats_manager.format_leaderboard_embed('score', min_games=1, days=days)
             
             embed = discord.Embed(
                 description=embed_data.get('description', ''),
@@ -537,7 +668,80 @@ class RecZoneManager:
             
             # Post to the BOT channel
             await bot_channel.send(embed=embed)
-        
+
+        @bot.command(name='player', help='Display a player\'s totals and recent matches (e.g. .player JimmyHimself)')
+        async def player_command(ctx, *, name: str = None):
+            """Display one player's stats card with per-mode splits and match history"""
+            # Only allow commands from the designated bot channel
+            if ctx.channel.id != self.bot_channel_id:
+                return  # Silently ignore commands from other channels
+
+            if not name:
+                await ctx.send("Usage: `.player <name>`")
+                return
+
+            embed_data = self.stats_manager.format_player_embed(name)
+            if embed_data is None:
+                await ctx.send(f"❌ No stats found for '{name}'")
+                return
+
+            embed = discord.Embed(
+                title=embed_data['title'],
+                description=embed_data.get('description', ''),
+                color=embed_data['color']
+            )
+            for field in embed_data['fields']:
+                embed.add_field(
+                    name=field['name'],
+                    value=field['value'],
+                    inline=field.get('inline', False)
+                )
+
+            await ctx.send(embed=embed)
+
+        @bot.command(name='aliases', help='List OCR misreads merged into known players')
+        async def aliases_command(ctx):
+            """List the learned and manual name aliases"""
+            # Only allow commands from the designated bot channel
+            if ctx.channel.id != self.bot_channel_id:
+                return  # Silently ignore commands from other channels
+
+            aliases = self.stats_manager.list_aliases()
+            if not aliases:
+                await ctx.send("No merged player names")
+                return
+
+            lines = [f"`{alias}` → `{canonical}`" for alias, canonical in aliases]
+            # Stay under Discord's 2000 character message limit
+            message = "**Merged player names** (undo with `.unalias <name>`)\n"
+            for index, line in enumerate(lines):
+                if len(message) + len(line) > 1900:
+                    message += f"... and {len(lines) - index} more"
+                    break
+                message += line + "\n"
+            await ctx.send(message)
+
+        @bot.command(name='unalias', help='Undo an OCR misread merge so the name counts as its own player (e.g. .unalias player13)')
+        async def unalias_command(ctx, *, name: str = None):
+            """Remove a name alias and rebuild stats"""
+            # Only allow commands from the designated bot channel
+            if ctx.channel.id != self.bot_channel_id:
+                return  # Silently ignore commands from other channels
+
+            if not name:
+                await ctx.send("Usage: `.unalias <name>`")
+                return
+
+            # Rebuilding stats reads the whole log, so keep it off the event loop; the stats
+            # lock keeps screenshots logged meanwhile from being overwritten by the rebuilt state
+            async with self.stats_lock:
+                loop = asyncio.get_event_loop()
+                success, message = await loop.run_in_executor(None, self.stats_manager.unalias_player, name)
+            print(f"{'✓' if success else '✗'} Unalias: {message}")
+            await ctx.send(f"{'✅' if success else '❌'} {message}")
+            if success:
+                await self._auto_post_leaderboard()
+
         print("RecZone commands registered")
     
     async def handle_message_delete(self, message):
@@ -552,12 +756,9 @@ class RecZoneManager:
             if message.channel.id != self.read_channel_id:
                 return
             
-            # Check our screenshot log for this message ID
+            # Check our screenshot log (and the archive) for this message ID
             # (message.attachments is often empty in deletion events)
-            deleted_screenshots = []
-            for log_key, log_entry in list(self.stats_manager.screenshot_log.items()):
-                if str(message.id) == log_entry['message_id']:
-                    deleted_screenshots.append((log_key, log_entry))
+            deleted_screenshots = self.stats_manager.find_screenshots(message.id)
             
             if not deleted_screenshots:
                 return
@@ -566,11 +767,9 @@ class RecZoneManager:
             for log_key, log_entry in deleted_screenshots:
                 print(f"Screenshot deleted: {log_entry['filename']} - removing stats")
                 
-                # Remove stats
-                self.stats_manager.remove_screenshot_stats(log_entry)
-                
-                # Remove from log
-                del self.stats_manager.screenshot_log[log_key]
+                # Remove stats and the log entry
+                async with self.stats_lock:
+                    self.stats_manager.remove_screenshot(log_key)
                 
                 # Get player names for notification
                 player_names = []
@@ -595,9 +794,6 @@ class RecZoneManager:
                     )
                     await write_channel.send(embed=embed)
             
-            # Save log changes
-            self.stats_manager.save_screenshot_log()
-            
             # Refresh leaderboard after all deletions processed
             if deleted_screenshots:
                 print("🏆 RecZone: Refreshing leaderboard after deletion...")
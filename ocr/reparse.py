@@ -0,0 +1,216 @@
+"""
+Re-parse logged matches from their recorded zone text
+Every match logged since zone texts were recorded keeps the raw per-zone OCR output
+(text, bounds, confidence, role). This runs the current OCRParser._parse_zone_texts
+over that text - no downloads, no EasyOCR - and shows which stats would change, so
+parser fixes can be checked against (and applied to) the whole history in seconds.
+
+With --reocr the screenshots are OCR'd again from the local screenshot store
+(ocr/screenshot_store.py) instead, for changes that affect OCR itself - still no
+downloads.
+
+Usage (from the project root, with the bot stopped when using --apply):
+    python -m ocr.reparse               # show the diff
+    python -m ocr.reparse --apply       # rewrite changed live matches and save
+    python -m ocr.reparse --reocr       # full OCR from locally stored screenshots
+
+Archived matches are compared too, but only live matches are rewritten.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+
+
+STAT_FIELDS = ('score', 'kills', 'deaths', 'assists', 'playtime_minutes')
+
+
+def reparse_entry(parser, log_entry, verbose=False):
+    """
+    Re-derive a match from its recorded zone texts
+
+    Args:
+        parser: OCRParser (the EasyOCR model isn't needed)
+        log_entry: Screenshot log entry with 'zone_texts'
+        verbose: Show the parser's console output
+
+    Returns:
+        dict: New parsed data (carrying the zone texts and override flag), or None if
+              the current parser rejects the recorded text
+    """
+    zone_texts = log_entry['zone_texts']
+    override = log_entry.get('override', False)
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        parsed_data = parser._parse_zone_texts(zone_texts, override=override)
+    if not parsed_data or not parsed_data.get('players'):
+        return None
+    parsed_data['zone_texts'] = zone_texts
+    parsed_data['override'] = override
+    return parsed_data
+
+
+def reocr_entry(parser, image_bytes, log_entry, verbose=False):
+    """
+    Re-run full OCR on a stored screenshot of a logged match
+
+    Args:
+        parser: OCRParser with the EasyOCR model loaded
+        image_bytes: Screenshot read from the local store
+        log_entry: Screenshot log entry (for the override flag)
+        verbose: Show the parser's console output
+
+    Returns:
+        dict: New parsed data, or None if the current parser rejects the screenshot
+    """
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        parsed_data = asyncio.run(parser.parse_screenshot(image_bytes, override=log_entry.get('override', False)))
+    if not parsed_data:
+        return None
+    parsed_data.pop('timings', None)
+    return parsed_data
+
+
+def diff_match(log_entry, parsed_data):
+    """
+    Differences between a logged match and a new parse of it
+
+    Returns:
+        list: Human-readable change lines (empty if nothing changed)
+    """
+    changes = []
+    for field in ('match_time', 'game_mode'):
+        old, new = log_entry.get(field), parsed_data.get(field)
+        if old != new:
+            changes.append(f"{field}: {old} → {new}")
+
+    old_players = {p['name'].lower(): p for p in log_entry.get('players', []) if isinstance(p, dict)}
+    new_players = {p['name'].lower(): p for p in parsed_data.get('players', [])}
+    for key, player in old_players.items():
+        if key not in new_players:
+            changes.append(f"- {player['name']}")
+    for key, player in new_players.items():
+        old = old_players.get(key)
+        if old is None:
+            changes.append(f"+ {player['name']} ({'/'.join(str(player.get(f, 0)) for f in STAT_FIELDS[:4])})")
+            continue
+        for field in STAT_FIELDS:
+            if old.get(field) != player.get(field):
+                changes.append(f"{player['name']} {field}: {old.get(field)} → {player.get(field)}")
+    return changes
+
+
+def reparse_all(parser, stats_manager, verbose=False, store=None):
+    """
+    Re-parse every live and archived match from its zone texts or stored screenshot
+
+    Args:
+        parser: OCRParser
+        stats_manager: StatsManager holding the matches
+        verbose: Show the parser's console output
+        store: ScreenshotStore to re-OCR the screenshots from (None = parse recorded zone texts)
+
+    Returns:
+        dict: 'changed' [(log_key, archived, parsed_data, changes)], 'rejected'
+              [(log_key, archived)], 'unchanged' and 'skipped' (no zone texts or
+              stored screenshot) counts
+    """
+    report = {'changed': [], 'rejected': [], 'unchanged': 0, 'skipped': 0}
+    for log_key, log_entry in stats_manager.iter_all_entries():
+        archived = log_key not in stats_manager.screenshot_log
+        if store is None:
+            if not log_entry.get('zone_texts'):
+                report['skipped'] += 1
+                continue
+            parsed_data = reparse_entry(parser, log_entry, verbose=verbose)
+        else:
+            sha256 = log_entry.get('sha256') or store.lookup(log_key)
+            image_bytes = store.get(sha256) if sha256 else None
+            if image_bytes is None:
+                report['skipped'] += 1
+                continue
+            parsed_data = reocr_entry(parser, image_bytes, log_entry, verbose=verbose)
+        if parsed_data is None:
+            report['rejected'].append((log_key, archived))
+            continue
+        changes = diff_match(log_entry, parsed_data)
+        if changes:
+            report['changed'].append((log_key, archived, parsed_data, changes))
+        else:
+            report['unchanged'] += 1
+    return report
+
+
+def apply_changes(stats_manager, changed):
+    """
+    Rewrite changed live matches and snapshot the result
+
+    Returns:
+        int: Number of matches rewritten
+    """
+    applied = 0
+    for log_key, archived, parsed_data, _ in changed:
+        if archived:
+            continue
+        with contextlib.redirect_stdout(io.StringIO()):
+            entry = stats_manager.replace_screenshot(log_key, parsed_data)
+        if entry is not None:
+            applied += 1
+    if applied:
+        stats_manager.compact()
+    return applied
+
+
+def main(argv=None):
+    """Command line entry point"""
+    arg_parser = argparse.ArgumentParser(prog='python -m ocr.reparse', description='Re-parse logged matches from their recorded zone text')
+    arg_parser.add_argument('--apply', action='store_true', help='Rewrite changed live matches (stop the bot first)')
+    arg_parser.add_argument('--data-file', default='ocr/stats_data.json', help='Stats file of the StatsManager to read')
+    arg_parser.add_argument('--mask', default='ocr/zones.png', help='Zone mask passed to OCRParser')
+    arg_parser.add_argument('--verbose', action='store_true', help="Show the parser's console output")
+    arg_parser.add_argument('--reocr', action='store_true', help='Run full OCR on the locally stored screenshots')
+    arg_parser.add_argument('--store', default='ocr/screenshots', help='Screenshot store directory (with --reocr)')
+    args = arg_parser.parse_args(argv)
+
+    from ocr.parser import OCRParser
+    from ocr.screenshot_store import ScreenshotStore
+    from ocr.stats_manager import StatsManager
+
+    parser = OCRParser(debug_output=False, mask_path=args.mask, load_reader=args.reocr, zone_cache_size=0)
+    stats_manager = StatsManager(data_file=args.data_file)
+    store = ScreenshotStore(args.store) if args.reocr else None
+
+    started = time.perf_counter()
+    report = reparse_all(parser, stats_manager, verbose=args.verbose, store=store)
+    elapsed = time.perf_counter() - started
+
+    print("\n" + "=" * 60)
+    for log_key, archived, _, changes in report['changed']:
+        print(f"🔄 {log_key}{' (archived)' if archived else ''}")
+        for change in changes:
+            print(f"    {change}")
+    for log_key, archived in report['rejected']:
+        print(f"❌ {log_key}{' (archived)' if archived else ''}: rejected by the current parser (kept as logged)")
+
+    reparsed = len(report['changed']) + len(report['rejected']) + report['unchanged']
+    print(f"\nRe-parsed {reparsed} match(es) in {elapsed:.2f}s: {len(report['changed'])} changed, "
+          f"{report['unchanged']} unchanged, {len(report['rejected'])} rejected")
+    if report['skipped']:
+        reason = 'have no stored screenshot' if args.reocr else 'were logged before zone texts were recorded'
+        print(f"  {report['skipped']} match(es) skipped: they {reason}")
+
+    if args.apply and report['changed']:
+        applied = apply_changes(stats_manager, report['changed'])
+        skipped = len(report['changed']) - applied
+        print(f"✅ Rewrote {applied} live match(es)" + (f" ({skipped} archived left as is)" if skipped else ""))
+    elif report['changed']:
+        print("Run with --apply to rewrite the changed live matches")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
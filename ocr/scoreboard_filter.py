@@ -0,0 +1,344 @@
+"""
+Scoreboard pre-filter
+Decides without OCR whether an image looks like a victory scoreboard, so memes,
+clips and other pictures posted in the RecZone channel are rejected before the OCR
+pass. Checks, on a 640px-wide copy with letterbox/pillarbox bars cropped off:
+
+- aspect ratio within the range of screenshots the mask layouts fit
+- the VICTORY banner: normalized correlation with victory_template.png (cut from a
+  real scoreboard) plus a share of banner-yellow pixels where it matched. When a
+  layout fits, the banner is searched around its zone; otherwise over the top half
+  of the frame at the size the game's height-scaled UI gives it
+- when a layout fits, text-like edge density (Canny) in the first player's name
+  and stat zones of the selected layout (see layouts.py)
+
+The checks take about 5 ms (around 20 ms when the banner is searched over the
+whole top half); decoding dominates the cost: JPEGs are decoded at half size in a
+few ms, but PNG/WebP have to be decoded in full (30-60 ms at 1080p).
+
+Check images (e.g. stored screenshots and a folder of non-scoreboards) with:
+    python -m ocr.scoreboard_filter ocr/screenshots path/to/other_images
+
+Cut a new banner template from a scoreboard (e.g. after a game UI update):
+    python -m ocr.scoreboard_filter --save-template path/to/scoreboard.png
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from ocr.zone_schema import STAT_ROLES, scale_zones
+
+
+FILTER_WIDTH = 640          # Images are checked at this width
+MIN_ASPECT = 1.25           # Width / height range of accepted screenshots
+MAX_ASPECT = 2.5
+EDGE_MIN = 0.02             # Edge pixel share of a zone holding text
+EDGE_MAX = 0.45             # Above this a zone is noise/texture, not text
+MIN_TEXT_ZONES = 0.75       # Share of the first player's zones that must hold text
+LETTERBOX_MAX = 16          # Brightest gray level of a letterbox/pillarbox bar
+BANNER_MIN_CORRELATION = 0.3    # Normalized correlation with the VICTORY template
+BANNER_MIN_YELLOW = 0.1         # Share of banner-yellow pixels in the matched window
+BANNER_FIT_SCALES = (0.9, 1.0, 1.1)               # Around the zone of a fitting layout
+BANNER_SEARCH_SCALES = (0.8, 0.9, 1.0, 1.1, 1.25)  # Around the height-scaled size otherwise
+# HSV range of the banner's yellow (OpenCV hue is 0-179)
+BANNER_HUE = (15, 40)
+BANNER_MIN_SATURATION = 80
+BANNER_MIN_VALUE = 120
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp')
+
+
+def decode_image(image_bytes):
+    """
+    Decode image bytes to BGR, JPEGs at half size (the only format OpenCV can
+    decode reduced directly)
+
+    Returns:
+        numpy.ndarray: BGR image, or None if the bytes can't be decoded
+    """
+    flags = cv2.IMREAD_REDUCED_COLOR_2 if image_bytes[:3] == b'\xff\xd8\xff' else cv2.IMREAD_COLOR
+    return cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), flags)
+
+
+def downscale(image, width=FILTER_WIDTH):
+    """Image resized to at most width pixels wide"""
+    height, image_width = image.shape[:2]
+    if image_width <= width:
+        return image
+    return cv2.resize(image, (width, max(1, round(height * width / image_width))), interpolation=cv2.INTER_AREA)
+
+
+def edge_map(gray):
+    """Canny edges of a grayscale image downscaled to FILTER_WIDTH"""
+    return cv2.Canny(downscale(gray), 50, 150)
+
+
+def content_box(gray):
+    """
+    Part of an image inside letterbox/pillarbox bars (near-black rows and columns
+    at the edges, e.g. a 16:9 screenshot saved on a 16:10 canvas)
+
+    Returns:
+        tuple: (x, y, width, height) of the content
+    """
+    height, width = gray.shape[:2]
+    rows = np.flatnonzero(gray.max(axis=1) > LETTERBOX_MAX)
+    cols = np.flatnonzero(gray.max(axis=0) > LETTERBOX_MAX)
+    if not len(rows) or not len(cols):
+        return 0, 0, width, height
+    return int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)
+
+
+def zone_has_text(edges, zone):
+    """True if a zone's edge pixel share is in the range text produces"""
+    region = edges[zone['y']:zone['y'] + zone['height'], zone['x']:zone['x'] + zone['width']]
+    density = np.count_nonzero(region) / region.size if region.size else 0.0
+    return EDGE_MIN <= density <= EDGE_MAX
+
+
+def probe_zones(schema, width, height):
+    """
+    Zones that hold text on every scoreboard
+
+    Returns:
+        tuple: (VICTORY banner zones, first player card zones) scaled to the image
+    """
+    zones = scale_zones(schema, width, height)
+    victory = [zone for zone in zones if zone['role'] == 'victory']
+    # The first player card is filled in every mode (duos leave the last two empty)
+    first_player = [zone for zone in zones if zone['slot'] == 0 and zone['role'] in ('name',) + STAT_ROLES]
+    return victory, first_player
+
+
+def layout_alignment(edges, schema):
+    """
+    How well a layout's zones line up with the text in an image
+
+    Args:
+        edges: edge_map of the image
+        schema: Zone schema of the layout
+
+    Returns:
+        float: Share of the always-filled zones (see probe_zones) that hold text
+    """
+    height, width = edges.shape[:2]
+    victory, first_player = probe_zones(schema, width, height)
+    zones = victory + first_player
+    if not zones:
+        return 0.0
+    return sum(1 for zone in zones if zone_has_text(edges, zone)) / len(zones)
+
+
+def find_banner(gray, template, schema, fits=True):
+    """
+    Locate the VICTORY banner by template correlation on a FILTER_WIDTH copy
+
+    Args:
+        gray: Grayscale screenshot (bars already cropped off)
+        template: Grayscale VICTORY banner template
+        schema: Zone schema of the selected layout (its victory zone sets the size)
+        fits: The layout fits the image's aspect ratio, so only its zone is searched;
+              otherwise the top half is searched at the height-scaled banner size
+
+    Returns:
+        tuple: (correlation, (x, y, width, height) in gray's pixels), or (0.0, None)
+               if the schema has no victory zone
+    """
+    victory = [zone for zone in schema['zones'] if zone['role'] == 'victory']
+    if not victory:
+        return 0.0, None
+    height, width = gray.shape[:2]
+    small = downscale(gray)
+    factor = small.shape[1] / width
+    small_h, small_w = small.shape[:2]
+
+    if fits:
+        zone = scale_zones({'mask_size': schema['mask_size'], 'zones': victory}, small_w, small_h)[0]
+        expected_w, expected_h = zone['width'], zone['height']
+        margin_x, margin_y = expected_w // 4, expected_h // 2
+        x0, y0 = max(0, zone['x'] - margin_x), max(0, zone['y'] - margin_y)
+        x1, y1 = min(small_w, zone['x'] + expected_w + margin_x), min(small_h, zone['y'] + expected_h + margin_y)
+        scales = BANNER_FIT_SCALES
+    else:
+        ui_scale = small_h / schema['mask_size'][1]
+        expected_w, expected_h = victory[0]['width'] * ui_scale, victory[0]['height'] * ui_scale
+        x0, y0, x1, y1 = 0, 0, small_w, small_h // 2
+        scales = BANNER_SEARCH_SCALES
+    region = small[y0:y1, x0:x1]
+
+    best = (0.0, None)
+    for scale in scales:
+        tw, th = round(expected_w * scale), round(expected_h * scale)
+        if tw < 8 or th < 4 or tw > region.shape[1] or th > region.shape[0]:
+            continue
+        scaled = cv2.resize(template, (tw, th), interpolation=cv2.INTER_AREA)
+        result = cv2.matchTemplate(region, scaled, cv2.TM_CCOEFF_NORMED)
+        _, correlation, _, (mx, my) = cv2.minMaxLoc(result)
+        if correlation > best[0]:
+            best = (float(correlation), ((x0 + mx) / factor, (y0 + my) / factor, tw / factor, th / factor))
+    if best[1] is None:
+        return best
+    return best[0], tuple(round(v) for v in best[1])
+
+
+def yellow_share(color, box):
+    """Share of banner-yellow pixels of a BGR image inside an (x, y, width, height) box"""
+    x, y, w, h = box
+    region = color[y:y + h, x:x + w]
+    if not region.size:
+        return 0.0
+    hsv = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
+    yellow = ((hsv[..., 0] >= BANNER_HUE[0]) & (hsv[..., 0] <= BANNER_HUE[1])
+              & (hsv[..., 1] >= BANNER_MIN_SATURATION) & (hsv[..., 2] >= BANNER_MIN_VALUE))
+    return float(yellow.mean())
+
+
+class ScoreboardFilter:
+    """Cheap layout check of an image against the scoreboard layouts"""
+
+    def __init__(self, layouts):
+        """
+        Initialize the filter
+
+        Args:
+            layouts: LayoutRegistry of the parser (see layouts.py); without one every
+                     image is accepted. Its banner_template enables the banner check
+        """
+        self.layouts = layouts
+
+    def check(self, image_bytes):
+        """
+        Check whether an image looks like a victory scoreboard
+
+        Args:
+            image_bytes: Raw image bytes
+
+        Returns:
+            tuple: (is_scoreboard: bool, reason: str)
+        """
+        if not self.layouts:
+            return True, "no layouts - not checked"
+
+        try:
+            color = decode_image(image_bytes)
+        except Exception as e:
+            return False, f"image could not be decoded ({e})"
+        if color is None:
+            return False, "image could not be decoded"
+
+        color = downscale(color)
+        gray = cv2.cvtColor(color, cv2.COLOR_BGR2GRAY)
+        x, y, width, height = content_box(gray)
+        if width < 32 or height < 32:
+            return False, "image is blank"
+        color, gray = color[y:y + height, x:x + width], gray[y:y + height, x:x + width]
+
+        aspect = width / height
+        if not MIN_ASPECT <= aspect <= MAX_ASPECT:
+            return False, f"aspect ratio {aspect:.2f} outside {MIN_ASPECT}-{MAX_ASPECT}"
+
+        edges = edge_map(gray)
+        layout, _ = self.layouts.select(gray, edges)
+        if not layout['schema']:
+            return True, f"layout '{layout['name']}' has no zone schema - not checked"
+        fits = self.layouts.fits(layout, width, height)
+
+        template = self.layouts.banner_template
+        if template is not None:
+            correlation, box = find_banner(gray, template, layout['schema'], fits)
+            if box is not None:
+                if correlation < BANNER_MIN_CORRELATION:
+                    return False, f"no VICTORY banner (correlation {correlation:.2f})"
+                yellow = yellow_share(color, box)
+                if yellow < BANNER_MIN_YELLOW:
+                    return False, f"VICTORY banner shape but not its colour (yellow {yellow:.0%})"
+        else:
+            victory, _ = probe_zones(layout['schema'], width, height)
+            if victory and not zone_has_text(edges, victory[0]):
+                return False, "no text in the VICTORY banner zone"
+
+        if not fits:
+            # The zones can't be placed on this aspect ratio; the parser detects text on the whole frame
+            return True, f"VICTORY banner found, no layout fits aspect {aspect:.2f} (whole-frame OCR)"
+
+        _, first_player = probe_zones(layout['schema'], width, height)
+        if first_player:
+            text_zones = sum(1 for zone in first_player if zone_has_text(edges, zone))
+            if text_zones < MIN_TEXT_ZONES * len(first_player):
+                return False, f"text in only {text_zones}/{len(first_player)} zones of the first player card"
+
+        return True, f"layout '{layout['name']}' matches"
+
+
+def save_template(screenshot_path, layouts):
+    """
+    Cut the VICTORY banner template from a scoreboard screenshot using the default
+    layout's victory zone
+
+    Returns:
+        str: Path the template was written to, or None if it couldn't be cut
+    """
+    color = cv2.imread(str(screenshot_path), cv2.IMREAD_COLOR)
+    if color is None:
+        print(f"❌ {screenshot_path}: unreadable")
+        return None
+    gray = cv2.cvtColor(color, cv2.COLOR_BGR2GRAY)
+    x, y, width, height = content_box(gray)
+    gray = gray[y:y + height, x:x + width]
+    victory, _ = probe_zones(layouts.default['schema'], width, height)
+    if not victory:
+        print("❌ The default layout has no victory zone")
+        return None
+    zone = victory[0]
+    template = gray[zone['y']:zone['y'] + zone['height'], zone['x']:zone['x'] + zone['width']]
+    cv2.imwrite(layouts.banner_template_path, template)
+    return layouts.banner_template_path
+
+
+def main(argv=None):
+    """Check image files or directories and print each decision"""
+    arg_parser = argparse.ArgumentParser(prog='python -m ocr.scoreboard_filter', description='Run the scoreboard pre-filter on images')
+    arg_parser.add_argument('paths', nargs='*', help='Image files or directories')
+    arg_parser.add_argument('--mask', default='ocr/zones.png', help='Default mask (layouts.json is read next to it)')
+    arg_parser.add_argument('--save-template', metavar='SCREENSHOT', help='Cut the VICTORY banner template from a scoreboard')
+    args = arg_parser.parse_args(argv)
+    from ocr.layouts import LayoutRegistry
+    layouts = LayoutRegistry.load(args.mask)
+    if layouts is None:
+        print(f"❌ No layouts for {args.mask}")
+        return 1
+
+    if args.save_template:
+        path = save_template(args.save_template, layouts)
+        if path is None:
+            return 1
+        print(f"✅ Saved the VICTORY banner template to {path}")
+        return 0
+    if not args.paths:
+        arg_parser.error("no images given")
+
+    paths = []
+    for arg in args.paths:
+        path = Path(arg)
+        paths.extend(sorted(p for p in path.rglob('*') if p.suffix.lower() in IMAGE_EXTENSIONS) if path.is_dir() else [path])
+
+    scoreboard_filter = ScoreboardFilter(layouts)
+    accepted = 0
+    for path in paths:
+        image_bytes = path.read_bytes()
+        started = time.perf_counter()
+        is_scoreboard, reason = scoreboard_filter.check(image_bytes)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        accepted += is_scoreboard
+        print(f"{'✅' if is_scoreboard else '❌'} {path} ({elapsed_ms:.1f} ms): {reason}")
+    print(f"\n{accepted}/{len(paths)} image(s) accepted as scoreboards")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
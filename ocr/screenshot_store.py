@@ -0,0 +1,258 @@
+"""
+Content-addressed local store for downloaded screenshots
+Every screenshot RecZone downloads is kept on disk under its SHA-256
+(screenshots/ab/abcdef....png), optionally re-encoded as lossless WebP. The
+screenshot log records the hash of each match, and an append-only index
+(index.jsonl) maps screenshot log keys to hashes, so rebuilds, re-parses and benchmarks can read images from
+local disk instead of the Discord CDN (whose links are rate-limited and expire).
+
+Export the stored screenshots as a benchmark corpus labeled with the logged stats:
+    python -m ocr.screenshot_store export-corpus ocr/logged_corpus
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+
+
+# Leading bytes -> file extension of the formats Discord screenshots come in
+IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'GIF8', '.gif'),
+    (b'BM', '.bmp'),
+)
+
+
+def image_extension(image_bytes):
+    """File extension for image bytes by their signature ('.bin' if unknown)"""
+    if image_bytes[:4] == b'RIFF' and image_bytes[8:12] == b'WEBP':
+        return '.webp'
+    for signature, extension in IMAGE_SIGNATURES:
+        if image_bytes.startswith(signature):
+            return extension
+    return '.bin'
+
+
+class ScreenshotStore:
+    """Screenshots on disk keyed by the SHA-256 of the downloaded bytes"""
+
+    def __init__(self, store_dir='ocr/screenshots', lossless_webp=False):
+        """
+        Initialize the store
+
+        Args:
+            store_dir: Directory holding the images and index.jsonl
+            lossless_webp: Re-encode new screenshots as lossless WebP when that is smaller
+                           (same pixels; the hash stays that of the downloaded bytes)
+        """
+        self.store_dir = store_dir
+        self.index_file = os.path.join(store_dir, 'index.jsonl')
+        self.lossless_webp = lossless_webp
+        self.keys = {}   # Screenshot log key -> sha256
+        self.paths = {}  # sha256 -> path of the stored image
+        self.scan_images()
+        self.load_index()
+
+    def scan_images(self):
+        """Map the stored images by hash (one directory walk at startup)"""
+        self.paths = {}
+        if not os.path.isdir(self.store_dir):
+            return
+        for prefix in os.scandir(self.store_dir):
+            if not prefix.is_dir():
+                continue
+            for image in os.scandir(prefix.path):
+                sha256, extension = os.path.splitext(image.name)
+                if extension != '.tmp':
+                    self.paths[sha256] = image.path
+
+    def load_index(self):
+        """
+        Load the log key index
+        index.jsonl holds one {"key", "sha256"} line per indexed screenshot, later lines
+        win; an index.json written by older versions is read first
+        """
+        legacy_file = os.path.join(self.store_dir, 'index.json')
+        if os.path.exists(legacy_file):
+            try:
+                with open(legacy_file, 'r') as f:
+                    self.keys = json.load(f)
+            except Exception as e:
+                print(f"Error loading screenshot store index: {e}")
+                self.keys = {}
+
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'rb+') as f:
+                data = f.read()
+                # Cut off a torn last line from a crash mid-append, or the next append is glued onto it
+                if data and not data.endswith(b'\n'):
+                    f.truncate(data.rfind(b'\n') + 1)
+            for line in data.decode('utf-8', errors='replace').splitlines():
+                try:
+                    record = json.loads(line)
+                    self.keys[record['key']] = record['sha256']
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+
+        if self.keys:
+            print(f"Loaded screenshot store index: {len(self.keys)} screenshots")
+
+    def _append_index(self, log_key, sha256):
+        """Durably append one key -> hash line to the index"""
+        os.makedirs(self.store_dir, exist_ok=True)
+        with open(self.index_file, 'a') as f:
+            f.write(json.dumps({'key': log_key, 'sha256': sha256}, separators=(',', ':')) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def __contains__(self, sha256):
+        return sha256 in self.paths
+
+    def __len__(self):
+        return len(self.keys)
+
+    def path_for(self, sha256):
+        """Path of a stored screenshot, or None if it isn't stored"""
+        return self.paths.get(sha256)
+
+    def _encode_lossless_webp(self, image_bytes):
+        """Lossless WebP of an image if it is smaller than the original, else None"""
+        try:
+            from PIL import Image
+            image = Image.open(io.BytesIO(image_bytes))
+            output = io.BytesIO()
+            image.save(output, format='WEBP', lossless=True, method=6)
+            webp_bytes = output.getvalue()
+            return webp_bytes if len(webp_bytes) < len(image_bytes) else None
+        except Exception as e:
+            print(f"⚠ Could not re-encode screenshot as WebP: {e}")
+            return None
+
+    def put(self, image_bytes, log_key=None):
+        """
+        Store screenshot bytes (a no-op for content that is already stored)
+
+        Args:
+            image_bytes: Downloaded image bytes
+            log_key: Screenshot log key ("<message_id>_<attachment_id>") to index
+
+        Returns:
+            str: SHA-256 hex digest of image_bytes
+        """
+        sha256 = hashlib.sha256(image_bytes).hexdigest()
+
+        if self.path_for(sha256) is None:
+            data, extension = image_bytes, image_extension(image_bytes)
+            if self.lossless_webp and extension in ('.png', '.bmp'):
+                webp_bytes = self._encode_lossless_webp(image_bytes)
+                if webp_bytes is not None:
+                    data, extension = webp_bytes, '.webp'
+
+            directory = os.path.join(self.store_dir, sha256[:2])
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, sha256 + extension)
+            temp_path = path + '.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+            self.paths[sha256] = path
+
+        if log_key is not None and self.keys.get(log_key) != sha256:
+            self.keys[log_key] = sha256
+            self._append_index(log_key, sha256)
+        return sha256
+
+    def get(self, sha256):
+        """
+        Read a stored screenshot
+
+        Returns:
+            bytes: Image bytes, or None if the screenshot isn't stored
+        """
+        path = self.path_for(sha256)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except Exception as e:
+            print(f"Error reading stored screenshot {sha256}: {e}")
+            return None
+
+    def lookup(self, log_key):
+        """SHA-256 stored for a screenshot log key, or None"""
+        return self.keys.get(log_key)
+
+
+def export_corpus(store, entries, output_dir):
+    """
+    Copy stored screenshots into a benchmark corpus labeled with their logged stats
+
+    Args:
+        store: ScreenshotStore to read from
+        entries: (log_key, log_entry) tuples
+        output_dir: Corpus directory (image + ground-truth JSON per match)
+
+    Returns:
+        int: Number of screenshots exported
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    exported = 0
+    for log_key, log_entry in entries:
+        sha256 = log_entry.get('sha256') or store.lookup(log_key)
+        path = store.path_for(sha256) if sha256 else None
+        if path is None:
+            continue
+        with open(path, 'rb') as f:
+            image_bytes = f.read()
+        stem = os.path.join(output_dir, log_key)
+        with open(stem + os.path.splitext(path)[1], 'wb') as f:
+            f.write(image_bytes)
+        truth = {
+            'victory': True,
+            'game_mode': log_entry.get('game_mode', 'squads'),
+            'match_time': log_entry.get('match_time', 0),
+            'players': [p for p in log_entry.get('players', []) if isinstance(p, dict)]
+        }
+        with open(stem + '.json', 'w', encoding='utf-8') as f:
+            json.dump(truth, f, indent=2)
+        exported += 1
+    return exported
+
+
+def main(argv=None):
+    """Command line entry point"""
+    arg_parser = argparse.ArgumentParser(prog='python -m ocr.screenshot_store', description='Local screenshot store tools')
+    subparsers = arg_parser.add_subparsers(dest='command', required=True)
+    export = subparsers.add_parser('export-corpus', help='Write stored screenshots + logged stats as a benchmark corpus')
+    export.add_argument('output', help='Corpus directory to create')
+    export.add_argument('--store', default='ocr/screenshots', help='Screenshot store directory')
+    export.add_argument('--data-file', default='ocr/stats_data.json', help='Stats file of the StatsManager to read')
+    export.add_argument('--limit', type=int, help='Only export the first N matches')
+    args = arg_parser.parse_args(argv)
+
+    from ocr.stats_manager import StatsManager
+
+    store = ScreenshotStore(args.store)
+    stats_manager = StatsManager(data_file=args.data_file)
+    entries = list(stats_manager.iter_all_entries())
+    if args.limit:
+        entries = entries[:args.limit]
+
+    count = export_corpus(store, entries, args.output)
+    if not count:
+        print(f"❌ None of the {len(entries)} logged matches have a stored screenshot")
+        return 1
+    print(f"✅ Exported {count}/{len(entries)} matches to {args.output}")
+    print(f"   Benchmark them with: python -m ocr.benchmark {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
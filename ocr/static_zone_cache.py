@@ -0,0 +1,91 @@
+"""
+Recognized-text cache for static zones
+The VICTORY banner and the mode header render almost the same pixels on every
+screenshot at a given resolution, so their text only has to be recognized once.
+Zones are keyed by an average hash of the preprocessed pixels; a hit is only used
+if a small thumbnail of the zone is also close to the cached one (the hash alone
+can't tell "SQUADS" from "DUOS" once the zone is downsampled far enough).
+"""
+
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+
+HASH_SIZE = (16, 8)     # Width x height of the average hash grid (128 bits)
+GUARD_SIZE = (64, 16)   # Width x height of the thumbnail compared on a hit
+
+
+class StaticZoneCache:
+    """LRU of recognized zone text keyed by a perceptual hash of the zone pixels"""
+
+    def __init__(self, max_entries=64, max_diff=6.0):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Zones kept before the least recently used is evicted
+            max_diff: Largest mean absolute gray-level difference between the cached
+                      and the new thumbnail for a hit to be used
+        """
+        self.max_entries = max_entries
+        self.max_diff = max_diff
+        self._entries = OrderedDict()  # key -> (thumbnail, text, confidence)
+        self.hits = 0
+        self.misses = 0
+        self.guard_rejects = 0
+
+    @staticmethod
+    def _key(namespace, zone_image):
+        """Cache key: caller namespace, zone size and the average hash of its pixels"""
+        small = cv2.resize(zone_image, HASH_SIZE, interpolation=cv2.INTER_AREA)
+        bits = np.packbits(small > small.mean()).tobytes()
+        return namespace, zone_image.shape[:2], bits
+
+    @staticmethod
+    def _thumbnail(zone_image):
+        return cv2.resize(zone_image, GUARD_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32)
+
+    def lookup(self, namespace, zone_image):
+        """
+        Cached text for a zone
+
+        Args:
+            namespace: Hashable that must match too (e.g. zone role and OCR parameters)
+            zone_image: Preprocessed grayscale zone
+
+        Returns:
+            tuple: (text, confidence), or None on a miss
+        """
+        key = self._key(namespace, zone_image)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        thumbnail, text, confidence = entry
+        if float(np.abs(self._thumbnail(zone_image) - thumbnail).mean()) > self.max_diff:
+            # Same hash, different pixels - recognize it again
+            self.guard_rejects += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return text, confidence
+
+    def store(self, namespace, zone_image, text, confidence):
+        """Remember a zone's recognized text, evicting the least recently used zones"""
+        if self.max_entries <= 0:
+            return
+        key = self._key(namespace, zone_image)
+        self._entries[key] = (self._thumbnail(zone_image), text, confidence)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self):
+        """Hit/miss counters since startup"""
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses,
+                'guard_rejects': self.guard_rejects}
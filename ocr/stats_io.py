@@ -0,0 +1,572 @@
+"""
+Streaming import/export for the match log and player aggregates
+Reads screenshot_log.json, archive segments and stats_data.json incrementally and
+writes JSONL, CSV or Parquet one record at a time, so export memory use stays flat
+no matter how long the history is. Imported matches are appended to the match event
+log and picked up (stats included) the next time the bot starts; to skip matches
+that are already logged, import keeps the set of logged match keys (not the
+entries) in memory, which grows with the history.
+
+Usage (from the project root, with the bot stopped):
+    python -m ocr.stats_io export matches season1.jsonl
+    python -m ocr.stats_io export stats aggregates.csv
+    python -m ocr.stats_io import matches season1.parquet
+    python -m ocr.stats_io import stats aggregates.csv
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import os
+import sys
+
+from ocr.event_log import MATCH_ADDED, MatchEventLog
+from ocr.player_stats import ModeStats, PlayerStats
+
+
+# One row per player per match in the flat (CSV/Parquet) match layout
+MATCH_COLUMNS = [
+    'message_id', 'attachment_id', 'filename', 'processed_at', 'match_time', 'game_mode',
+    'slot', 'name', 'score', 'kills', 'deaths', 'assists', 'playtime_minutes'
+]
+
+# One row per player per mode in the aggregate layout
+STATS_COLUMNS = ['mode', 'name_key'] + list(PlayerStats.FIELDS)
+
+# Per-player match fields (everything else in a match row belongs to the match)
+PLAYER_FIELDS = ('name', 'score', 'kills', 'deaths', 'assists', 'playtime_minutes')
+
+FORMATS = ('jsonl', 'csv', 'parquet')
+STATS_MODES = ('overall', 'duos', 'squads')
+PARQUET_BATCH_SIZE = 4096
+
+
+# ---------------------------------------------------------------------------
+# Incremental JSON reading
+# ---------------------------------------------------------------------------
+
+class _JsonStream:
+    """Minimal pull reader over a JSON text stream, holding one chunk plus the current value"""
+
+    def __init__(self, f, chunk_size=65536):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """Read another chunk, dropping consumed text; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character ('' at end of file)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        """Consume the next non-whitespace character, which must be char"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON stream, found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number may continue past the end of the buffer
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+def _iter_object(stream, depth):
+    """Yield (key path, value) for every member depth levels into a JSON object"""
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.pos += 1
+        return
+
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if depth > 1 and stream.peek() == '{':
+            for path, value in _iter_object(stream, depth - 1):
+                yield (key,) + path, value
+        else:
+            yield (key,), stream.value()
+
+        separator = stream.peek()
+        stream.pos += 1
+        if separator == '}':
+            return
+        if separator != ',':
+            raise ValueError(f"Expected ',' or '}}' in JSON stream, found '{separator or 'end of file'}'")
+
+
+def iter_json_object(path, depth=1):
+    """
+    Stream the members of a JSON object file without loading it whole
+
+    Args:
+        path: JSON file (.gz files are decompressed on the fly)
+        depth: 1 for {key: value}, 2 for {key: {key: value}} (e.g. stats_data.json)
+
+    Yields:
+        tuple: (key path tuple, value)
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        yield from _iter_object(_JsonStream(f), depth)
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+def _data_paths(data_dir):
+    """Paths of the StatsManager files inside a data directory"""
+    return {
+        'stats': os.path.join(data_dir, 'stats_data.json'),
+        'log': os.path.join(data_dir, 'screenshot_log.json'),
+        'events': os.path.join(data_dir, 'match_events.jsonl'),
+        'archive': os.path.join(data_dir, 'archive'),
+    }
+
+
+def iter_matches(data_dir, include_archive=True):
+    """
+    Stream every logged match: archive segments, the screenshot log snapshot, then
+    the event log tail (which is bounded by the snapshot interval, so it is read whole)
+
+    Yields:
+        tuple: (log_key, log_entry)
+    """
+    paths = _data_paths(data_dir)
+
+    # Final state of each key touched since the last snapshot (None = removed)
+    tail = {}
+    for event in MatchEventLog(paths['events']).read():
+        tail[event['key']] = event['entry'] if event['type'] == MATCH_ADDED else None
+
+    index_file = os.path.join(paths['archive'], 'index.json')
+    if include_archive and os.path.exists(index_file):
+        with open(index_file, 'r') as f:
+            index = json.load(f)
+        # Archived matches whose screenshot was deleted stay in their (immutable) segment
+        removed = set(index.get('removed_keys', []))
+        for segment in index.get('segments', []):
+            segment_path = os.path.join(paths['archive'], segment['file'])
+            for (log_key,), log_entry in iter_json_object(segment_path):
+                if log_key not in tail and log_key not in removed:
+                    yield log_key, log_entry
+
+    if os.path.exists(paths['log']):
+        for (log_key,), log_entry in iter_json_object(paths['log']):
+            if log_key not in tail:
+                yield log_key, log_entry
+
+    for log_key, log_entry in tail.items():
+        if log_entry is not None:
+            yield log_key, log_entry
+
+
+def iter_stats_rows(data_dir):
+    """
+    Stream aggregate rows from stats_data.json
+
+    Yields:
+        dict: Row with STATS_COLUMNS
+    """
+    stats_file = _data_paths(data_dir)['stats']
+    if not os.path.exists(stats_file):
+        return
+    for path, player in iter_json_object(stats_file, depth=2):
+        if len(path) != 2 or path[0] not in STATS_MODES:
+            continue  # event_seq and other metadata
+        row = {'mode': path[0], 'name_key': path[1]}
+        row.update({field: player.get(field) for field in PlayerStats.FIELDS})
+        yield row
+
+
+def match_to_rows(log_key, log_entry):
+    """Flatten one match into per-player rows (MATCH_COLUMNS)"""
+    message_id, _, attachment_id = log_key.partition('_')
+    base = {
+        'message_id': log_entry.get('message_id', message_id),
+        'attachment_id': log_entry.get('attachment_id', attachment_id),
+        'filename': log_entry.get('filename', ''),
+        'processed_at': log_entry.get('processed_at', ''),
+        'match_time': log_entry.get('match_time', 0),
+        'game_mode': log_entry.get('game_mode', 'squads'),
+    }
+    for slot, player in enumerate(log_entry.get('players', [])):
+        if isinstance(player, str):
+            player = {'name': player}  # Old format - just player name
+        row = dict(base, slot=slot)
+        row.update({field: player.get(field) for field in PLAYER_FIELDS})
+        yield row
+
+
+def rows_to_matches(rows):
+    """
+    Regroup consecutive per-player rows (as written by export) into matches
+    A match's rows must be next to each other (a file re-sorted e.g. by player would
+    otherwise split matches into duplicate wins), so a key that shows up again after
+    another one is rejected; the keys seen are kept in memory to check this
+
+    Yields:
+        tuple: (log_key, log_entry)
+    """
+    current_key = None
+    current_entry = None
+    finished = set()
+    for row in rows:
+        log_key = f"{row['message_id']}_{row['attachment_id']}"
+        if log_key != current_key:
+            if log_key in finished:
+                raise SystemExit(f"Rows of match {log_key} are not next to each other - "
+                                 f"sort the file by message_id and attachment_id before importing")
+            if current_entry is not None:
+                yield current_key, current_entry
+                finished.add(current_key)
+            current_key = log_key
+            current_entry = {
+                'message_id': str(row['message_id']),
+                'attachment_id': str(row['attachment_id']),
+                'filename': row.get('filename') or '',
+                'processed_at': row.get('processed_at') or '',
+                'match_time': _number(row.get('match_time'), float),
+                'game_mode': row.get('game_mode') or 'squads',
+                'players': []
+            }
+        player = {
+            'name': row['name'],
+            'score': _number(row.get('score'), int),
+            'kills': _number(row.get('kills'), int),
+            'deaths': _number(row.get('deaths'), int),
+            'assists': _number(row.get('assists'), int),
+        }
+        if row.get('playtime_minutes') not in (None, ''):
+            player['playtime_minutes'] = _number(row['playtime_minutes'], float)
+        current_entry['players'].append(player)
+
+    if current_entry is not None:
+        yield current_key, current_entry
+
+
+def _number(value, cast):
+    """Parse a CSV/Parquet cell into a number (blank = 0)"""
+    if value in (None, ''):
+        return cast(0)
+    return cast(float(value)) if cast is int else cast(value)
+
+
+# ---------------------------------------------------------------------------
+# File formats
+# ---------------------------------------------------------------------------
+
+def _require_pyarrow():
+    """Import pyarrow for Parquet support (optional dependency)"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise SystemExit("Parquet support requires pyarrow: pip install pyarrow")
+    return pyarrow, pyarrow.parquet
+
+
+def write_rows(path, fmt, columns, rows):
+    """
+    Stream rows to a JSONL, CSV or Parquet file
+
+    Returns:
+        int: Number of rows written
+    """
+    count = 0
+    if fmt == 'jsonl':
+        with open(path, 'w', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps(row, separators=(',', ':')) + '\n')
+                count += 1
+    elif fmt == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+    else:
+        pa, pq = _require_pyarrow()
+        writer = None
+        batch = []
+        try:
+            for row in rows:
+                batch.append(row)
+                count += 1
+                if len(batch) >= PARQUET_BATCH_SIZE:
+                    writer = _write_parquet_batch(pa, pq, path, columns, batch, writer)
+                    batch = []
+            if batch or writer is None:
+                writer = _write_parquet_batch(pa, pq, path, columns, batch, writer)
+        finally:
+            if writer is not None:
+                writer.close()
+    return count
+
+
+def _write_parquet_batch(pa, pq, path, columns, batch, writer):
+    """Append one row batch to a Parquet file (schema taken from the first batch)"""
+    table = pa.Table.from_pylist([{column: row.get(column) for column in columns} for row in batch])
+    if writer is None:
+        if not batch:
+            table = pa.table({column: pa.array([], pa.string()) for column in columns})
+        writer = pq.ParquetWriter(path, table.schema)
+    else:
+        table = table.cast(writer.schema)
+    writer.write_table(table)
+    return writer
+
+
+def read_rows(path, fmt):
+    """
+    Stream rows from a JSONL, CSV or Parquet file
+
+    Yields:
+        dict: One row
+    """
+    if fmt == 'jsonl':
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif fmt == 'csv':
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+    else:
+        _, pq = _require_pyarrow()
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=PARQUET_BATCH_SIZE):
+            yield from batch.to_pylist()
+
+
+def _detect_format(path, fmt=None):
+    """Pick the file format from --format or the file extension"""
+    if fmt:
+        return fmt
+    extension = os.path.splitext(path)[1].lstrip('.').lower()
+    if extension in ('json', 'ndjson'):
+        extension = 'jsonl'
+    if extension not in FORMATS:
+        raise SystemExit(f"Can't tell the format of {path} - use --format {{{','.join(FORMATS)}}}")
+    return extension
+
+
+# ---------------------------------------------------------------------------
+# Commands
+# ---------------------------------------------------------------------------
+
+def export_matches(data_dir, path, fmt, include_archive=True):
+    """
+    Export the match log
+
+    JSONL keeps one match per line ({"key": ..., **entry}); CSV and Parquet use
+    one row per player (MATCH_COLUMNS)
+
+    Returns:
+        int: Number of records written
+    """
+    matches = iter_matches(data_dir, include_archive)
+    if fmt == 'jsonl':
+        rows = (dict(log_entry, key=log_key) for log_key, log_entry in matches)
+    else:
+        rows = (row for log_key, log_entry in matches for row in match_to_rows(log_key, log_entry))
+    return write_rows(path, fmt, MATCH_COLUMNS, rows)
+
+
+def export_stats(data_dir, path, fmt):
+    """
+    Export player aggregates (one row per player per mode)
+
+    Returns:
+        int: Number of rows written
+    """
+    return write_rows(path, fmt, STATS_COLUMNS, iter_stats_rows(data_dir))
+
+
+def _known_match_keys(data_dir):
+    """
+    Keys already logged (snapshot, archive index and event log tail)
+    The entries themselves are streamed, but the key set is held in memory: one
+    short string per logged match, so it is O(n) in the history size
+
+    Returns:
+        set: Logged match keys
+    """
+    paths = _data_paths(data_dir)
+    keys = set()
+    if os.path.exists(paths['log']):
+        keys.update(log_key for (log_key,), _ in iter_json_object(paths['log']))
+    index_file = os.path.join(paths['archive'], 'index.json')
+    if os.path.exists(index_file):
+        with open(index_file, 'r') as f:
+            keys.update(json.load(f).get('archived_keys', []))
+    for event in MatchEventLog(paths['events']).read():
+        if event['type'] == MATCH_ADDED:
+            keys.add(event['key'])
+        else:
+            keys.discard(event['key'])
+    return keys
+
+
+def import_matches(data_dir, path, fmt):
+    """
+    Import matches by appending match_added events to the event log
+    Matches already logged are skipped. StatsManager replays the events (log and
+    stats) on its next start, so no full recalculation is needed. Rows are streamed,
+    but duplicate detection keeps every logged match key in memory (see
+    _known_match_keys)
+
+    Returns:
+        tuple: (imported count, skipped count)
+    """
+    paths = _data_paths(data_dir)
+    known = _known_match_keys(data_dir)
+
+    # Sequence numbers continue after the stats snapshot as well as the event log
+    event_log = MatchEventLog(paths['events'])
+    if os.path.exists(paths['stats']):
+        for (key,), value in iter_json_object(paths['stats']):
+            if key == 'event_seq':
+                event_log.last_seq = max(event_log.last_seq, value)
+
+    rows = read_rows(path, fmt)
+    if fmt == 'jsonl':
+        matches = ((row.pop('key', None) or f"{row['message_id']}_{row['attachment_id']}", row) for row in rows)
+    else:
+        # Check the row order in a first pass, so a badly sorted file imports nothing
+        for _ in rows_to_matches(read_rows(path, fmt)):
+            pass
+        matches = rows_to_matches(rows)
+
+    def new_events():
+        for log_key, log_entry in matches:
+            if log_key in known:
+                counts['skipped'] += 1
+                continue
+            known.add(log_key)
+            counts['imported'] += 1
+            yield MATCH_ADDED, log_key, log_entry
+
+    counts = {'imported': 0, 'skipped': 0}
+    event_log.extend(new_events())
+    return counts['imported'], counts['skipped']
+
+
+def import_stats(data_dir, path, fmt):
+    """
+    Replace stats_data.json with imported aggregates
+    Refuses while match events are waiting to be replayed, since they would be
+    applied on top of the imported totals
+
+    Returns:
+        int: Number of player rows imported
+    """
+    paths = _data_paths(data_dir)
+    if MatchEventLog(paths['events']).pending:
+        raise SystemExit("Match events are pending replay - start the bot once (or run a recalculation) before importing stats")
+
+    event_seq = 0
+    if os.path.exists(paths['stats']):
+        for (key,), value in iter_json_object(paths['stats']):
+            if key == 'event_seq':
+                event_seq = value
+
+    # Aggregates are one record per player, so they are grouped in memory by mode
+    data = {mode: {} for mode in STATS_MODES}
+    count = 0
+    for row in read_rows(path, fmt):
+        mode = row.get('mode') or 'overall'
+        if mode not in data:
+            continue
+        record_cls = PlayerStats if mode == 'overall' else ModeStats
+        values = {field: row.get(field) for field in record_cls.FIELDS if row.get(field) not in (None, '')}
+        for field in record_cls.FIELDS[1:]:
+            if field in values:
+                values[field] = _number(values[field], float if field == 'playtime' else int)
+        data[mode][row['name_key']] = record_cls.from_dict(values).to_dict()
+        count += 1
+
+    data['event_seq'] = event_seq
+    temp_path = paths['stats'] + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(temp_path, paths['stats'])
+    return count
+
+
+def main(argv=None):
+    """Command line entry point"""
+    arg_parser = argparse.ArgumentParser(
+        prog='python -m ocr.stats_io',
+        description='Stream RecZone match logs and player aggregates to/from JSONL, CSV or Parquet. '
+                    'Run with the bot stopped.'
+    )
+    arg_parser.add_argument('--data-dir', default='ocr', help='Directory holding stats_data.json (default: ocr)')
+    subparsers = arg_parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='Export matches or aggregates')
+    export_parser.add_argument('dataset', choices=['matches', 'stats'])
+    export_parser.add_argument('path')
+    export_parser.add_argument('--format', choices=FORMATS)
+    export_parser.add_argument('--no-archive', action='store_true', help='Skip archived matches')
+
+    import_parser = subparsers.add_parser('import', help='Import matches or aggregates')
+    import_parser.add_argument('dataset', choices=['matches', 'stats'])
+    import_parser.add_argument('path')
+    import_parser.add_argument('--format', choices=FORMATS)
+
+    args = arg_parser.parse_args(argv)
+    fmt = _detect_format(args.path, args.format)
+
+    if args.command == 'export':
+        if args.dataset == 'matches':
+            count = export_matches(args.data_dir, args.path, fmt, include_archive=not args.no_archive)
+        else:
+            count = export_stats(args.data_dir, args.path, fmt)
+        print(f"✓ Exported {count} record(s) of {args.dataset} to {args.path}")
+    else:
+        if args.dataset == 'matches':
+            imported, skipped = import_matches(args.data_dir, args.path, fmt)
+            print(f"✓ Imported {imported} match(es), skipped {skipped} already logged")
+            if imported:
+                print("  Stats pick them up the next time the bot starts")
+        else:
+            count = import_stats(args.data_dir, args.path, fmt)
+            print(f"✓ Imported aggregates for {count} player row(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,29 +3,89 @@ Stats Manager for tracking player statistics across multiple matches
 Stores data in JSON format and provides leaderboard functionality
 """
 
+import bisect
+import functools
 import json
 import os
-from datetime import datetime
+import sys
+import threading
+from collections import namedtuple
+from datetime import date, datetime
+from types import MappingProxyType
+
+from ocr.archive import ScreenshotArchive
+from ocr.event_log import MATCH_ADDED, MATCH_REMOVED, MatchEventLog
+from ocr.name_resolver import NameResolver
+from ocr.player_stats import ModeStats, PlayerStats
+
+# Discord snowflake epoch (2015-01-01 UTC) in milliseconds
+DISCORD_EPOCH_MS = 1420070400000
+
+# Named leaderboard time windows (days, today included)
+TIME_WINDOWS = {
+    'today': 1,
+    'day': 1,
+    'week': 7,
+    'month': 30,
+}
+
+# Longest 'Nd' leaderboard window (ten years)
+MAX_WINDOW_DAYS = 3650
+
+# Compact the match event log into snapshots after this many appended events
+SNAPSHOT_INTERVAL = 50
+
+# Read-only view of the aggregates handed to other threads (e.g. the GUI)
+StatsSnapshot = namedtuple('StatsSnapshot', ['version', 'overall', 'duos', 'squads', 'match_count', 'archived_count'])
+
+
+def _locked(method):
+    """Run a StatsManager method while holding the manager's lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class StatsManager:
     """Manage player statistics storage and retrieval"""
     
-    def __init__(self, data_file='ocr/stats_data.json'):
+    def __init__(self, data_file='ocr/stats_data.json', snapshot_interval=SNAPSHOT_INTERVAL, archive_after_days=0):
         """
         Initialize the stats manager
         
         Args:
             data_file: Path to JSON file for storing stats
+            snapshot_interval: Match events to append before compacting into snapshots
+            archive_after_days: Move matches older than this many days into compressed
+                                archive segments (0 = keep everything in screenshot_log.json)
         """
         self.data_file = data_file
         self.screenshot_log_file = data_file.replace('stats_data.json', 'screenshot_log.json')
-        self.stats = {}
-        self.duos_stats = {}  # Track duos-specific stats
-        self.squads_stats = {}  # Track squads-specific stats
+        self.stats = {}  # Interned name key -> PlayerStats
+        self.duos_stats = {}  # Interned name key -> ModeStats (duos only)
+        self.squads_stats = {}  # Interned name key -> ModeStats (squads only)
         self.screenshot_log = {}  # Track processed screenshots
+        self.daily_buckets = {}  # Date ordinal -> {'overall'|'duos'|'squads': {name_key: record}}
+        self.player_matches = {}  # Name key -> sorted [(message_id, log_key)] posting list
+        self.data_version = 0  # Bumped on every stats mutation
+        self.lock = threading.RLock()  # Held by every mutation (bot loop, rebuild worker threads)
+        self._snapshot = None  # Last StatsSnapshot handed out
+        self._change_listeners = []  # Callables notified with the new data_version
+        self._embed_cache = {}  # (data_version, min_games, top_n) -> rendered embed dict
+        self.name_resolver = NameResolver(data_file.replace('stats_data.json', 'name_aliases.json'))
+        self.event_log = MatchEventLog(data_file.replace('stats_data.json', 'match_events.jsonl'))
+        self.snapshot_interval = snapshot_interval
+        self.stats_event_seq = 0  # Last match event included in the stats snapshot
+        self.archive = ScreenshotArchive(os.path.join(os.path.dirname(data_file), 'archive'))
+        self.archive_after_days = archive_after_days
         self.load_stats()
         self.load_screenshot_log()
+        self._replay_stats_events()
+        archived = self.archive_old_matches()
+        if archived or self.event_log.pending >= self.snapshot_interval:
+            self.compact()
     
     def load_stats(self):
         """Load stats from JSON file"""
@@ -36,14 +96,19 @@ class StatsManager:
                     # Support both old format (dict) and new format (dict with mode keys)
                     if 'overall' in data or 'duos' in data or 'squads' in data:
                         # New format with mode separation
-                        self.stats = data.get('overall', {})
-                        self.duos_stats = data.get('duos', {})
-                        self.squads_stats = data.get('squads', {})
+                        self.stats = self._records_from_dict(data.get('overall', {}), PlayerStats)
+                        self.duos_stats = self._records_from_dict(data.get('duos', {}), ModeStats)
+                        self.squads_stats = self._records_from_dict(data.get('squads', {}), ModeStats)
+                        self.stats_event_seq = data.get('event_seq', 0)
                     else:
                         # Old format - treat as overall stats
-                        self.stats = data
+                        self.stats = self._records_from_dict(data, PlayerStats)
                         self.duos_stats = {}
                         self.squads_stats = {}
+                for name_key in self.stats:
+                    self.name_resolver.add_known(name_key)
+                # Keep sequence numbers increasing even when the event log was truncated
+                self.event_log.last_seq = max(self.event_log.last_seq, self.stats_event_seq)
                 print(f"Loaded stats for {len(self.stats)} players overall, {len(self.duos_stats)} duos, {len(self.squads_stats)} squads")
             except Exception as e:
                 print(f"Error loading stats: {e}")
@@ -55,26 +120,143 @@ class StatsManager:
             self.stats = {}
             self.duos_stats = {}
             self.squads_stats = {}
+        
+        self._bump_version()
+    
+    @staticmethod
+    def _records_from_dict(players, record_cls):
+        """Convert a {name_key: stats_dict} mapping into compact records keyed by interned names"""
+        return {
+            sys.intern(name_key): record_cls.from_dict(player)
+            for name_key, player in players.items()
+        }
+    
+    @staticmethod
+    def _records_to_dict(records):
+        """Materialize a {name_key: record} mapping as plain dicts (JSON layout)"""
+        return {name_key: record.to_dict() for name_key, record in records.items()}
+    
+    def _bump_version(self):
+        """
+        Mark the in-memory stats as changed
+        Invalidates memoized leaderboard renders from older versions
+        """
+        self.data_version += 1
+        self._embed_cache.clear()
+        for listener in self._change_listeners:
+            try:
+                listener(self.data_version)
+            except Exception as e:
+                print(f"Error in stats change listener: {e}")
+    
+    def add_change_listener(self, listener):
+        """
+        Register a callable notified after every stats change
+        Listeners run on whichever thread made the change (bot loop or a rebuild
+        worker), so they should only record that a change happened, e.g. set a flag,
+        and read snapshot() from their own thread
+        
+        Args:
+            listener: Callable taking the new data_version
+        """
+        self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener):
+        """Unregister a listener added with add_change_listener()"""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+    
+    @staticmethod
+    def _write_json_atomic(path, data):
+        """Write JSON to a temp file and swap it in, so a crash never leaves a half-written snapshot"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
     
     def save_stats(self):
-        """Save stats to JSON file"""
+        """
+        Save stats to JSON file
+        
+        Returns:
+            bool: True if saved
+        """
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-            
             # Save in new format with mode separation
             data = {
-                'overall': self.stats,
-                'duos': self.duos_stats,
-                'squads': self.squads_stats
+                'overall': self._records_to_dict(self.stats),
+                'duos': self._records_to_dict(self.duos_stats),
+                'squads': self._records_to_dict(self.squads_stats),
+                'event_seq': self.stats_event_seq
             }
             
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._write_json_atomic(self.data_file, data)
             print(f"Stats saved for {len(self.stats)} players overall, {len(self.duos_stats)} duos, {len(self.squads_stats)} squads")
+            return True
         except Exception as e:
             print(f"Error saving stats: {e}")
+            return False
     
+    @_locked
+    def compact(self):
+        """
+        Snapshot the screenshot log and aggregates, then truncate the match event log
+        The screenshot log is written first: its events replay idempotently by key, while
+        stats only replay events newer than the event_seq stored in the stats snapshot
+        
+        Returns:
+            bool: True if both snapshots were written and the event log truncated
+        """
+        if not self.save_screenshot_log():
+            return False
+        
+        previous_seq = self.stats_event_seq
+        self.stats_event_seq = self.event_log.last_seq
+        if not self.save_stats():
+            self.stats_event_seq = previous_seq
+            return False
+        
+        self.event_log.truncate()
+        return True
+    
+    def _record_event(self, event_type, key, log_entry):
+        """Append a match event and compact once enough events have piled up"""
+        try:
+            self.event_log.append(event_type, key, log_entry)
+        except Exception as e:
+            # Without the event the change only survives via a snapshot
+            print(f"Error appending match event: {e}")
+            self.compact()
+            return
+        
+        if self.event_log.pending >= self.snapshot_interval:
+            self.archive_old_matches()
+            self.compact()
+    
+    def _replay_stats_events(self):
+        """Apply match events newer than the stats snapshot to the aggregates"""
+        replayed = 0
+        for event in self.event_log.read(after_seq=self.stats_event_seq):
+            parsed_data = self._entry_to_parsed_data(event['entry'])
+            mode_stats = self._mode_table(self.duos_stats, self.squads_stats, parsed_data['game_mode'])
+            if event['type'] == MATCH_ADDED:
+                self._accumulate_players(self.stats, mode_stats, parsed_data['players'], parsed_data['match_time'])
+            elif event['type'] == MATCH_REMOVED:
+                self._reverse_players(
+                    self.stats, mode_stats, parsed_data['players'],
+                    parsed_data['match_time'], parsed_data['game_mode']
+                )
+            self.stats_event_seq = event['seq']
+            replayed += 1
+        
+        if replayed:
+            print(f"Replayed {replayed} match event(s) since the last stats snapshot")
+            self._bump_version()
+    
+    @_locked
     def update_player_stats(self, parsed_data):
         """
         Update stats for all players from a parsed screenshot
@@ -89,96 +271,96 @@ class StatsManager:
         game_mode = parsed_data.get('game_mode', 'squads')  # Default to squads if not specified
         
         # Select the appropriate stats dictionary based on game mode
-        if game_mode == 'duos':
-            mode_stats = self.duos_stats
-        elif game_mode == 'squads':
-            mode_stats = self.squads_stats
-        else:
-            mode_stats = self.squads_stats  # Default fallback
+        mode_stats = self._mode_table(self.duos_stats, self.squads_stats, game_mode)
+        
+        self._accumulate_players(self.stats, mode_stats, parsed_data['players'], match_time, verbose=True, learn=True)
+        
+        # Persisted through the match_added event appended by log_screenshot()
+        self._bump_version()
+    
+    @staticmethod
+    def _mode_table(duos_table, squads_table, game_mode):
+        """Pick the mode-specific table for a game mode (unknown modes count as squads)"""
+        return duos_table if game_mode == 'duos' else squads_table
+    
+    def _accumulate_players(self, overall_table, mode_table, players, match_time, verbose=False, learn=False):
+        """
+        Add one match's player stats into an overall table and a mode table
         
-        for player_data in parsed_data['players']:
+        Args:
+            overall_table: {name_key: PlayerStats} to update
+            mode_table: {name_key: ModeStats} to update
+            players: List of player stat dicts from a parsed screenshot
+            match_time: Match length in minutes (fallback playtime)
+            verbose: Log which playtime source was used per player
+            learn: Save OCR misread merges as aliases (only for newly processed screenshots,
+                   never when rebuilding or replaying from the log)
+        """
+        for player_data in players:
             name = player_data.get('name', '').strip()
             
             if not name:
                 continue
             
-            # Normalize name (case-insensitive storage)
-            name_lower = name.lower()
+            # Normalize name (case-insensitive storage, OCR misreads snapped onto known players,
+            # interned so all tables share one key)
+            name_lower = sys.intern(self.name_resolver.resolve(name, learn=learn))
             
-            # Initialize player in overall stats if not exists
-            if name_lower not in self.stats:
-                self.stats[name_lower] = {
-                    'display_name': name,  # Store original capitalization
-                    'wins': 0,
-                    'kills': 0,
-                    'deaths': 0,
-                    'assists': 0,
-                    'score': 0,
-                    'playtime': 0.0,
-                    'games_played': 0
-                }
+            # Fetch (or create) the player's records once - original capitalization kept as display name
+            overall = overall_table.get(name_lower)
+            if overall is None:
+                overall = overall_table[name_lower] = PlayerStats(name)
             
-            # Initialize player in mode-specific stats if not exists
-            if name_lower not in mode_stats:
-                mode_stats[name_lower] = {
-                    'display_name': name,
-                    'wins': 0,
-                    'kills': 0,
-                    'deaths': 0,
-                    'score': 0,
-                    'games_played': 0
-                }
+            mode_record = mode_table.get(name_lower)
+            if mode_record is None:
+                mode_record = mode_table[name_lower] = ModeStats(name)
             
             # Determine playtime to use: individual if available, otherwise match_time
             if 'playtime_minutes' in player_data:
                 # Use individual playtime from OCR detection
                 player_playtime = player_data['playtime_minutes']
-                print(f"  Using individual playtime for {name}: {player_playtime} minutes")
+                if verbose:
+                    print(f"  Using individual playtime for {name}: {player_playtime} minutes")
             else:
                 # Fall back to match_time if individual playtime not detected
                 player_playtime = match_time
-                print(f"  Using match time for {name}: {player_playtime} minutes (individual playtime not detected)")
+                if verbose:
+                    print(f"  Using match time for {name}: {player_playtime} minutes (individual playtime not detected)")
             
-            # Update overall stats (accumulate totals)
-            self.stats[name_lower]['wins'] += 1  # Each screenshot is a win
-            self.stats[name_lower]['kills'] += player_data.get('kills', 0)
-            self.stats[name_lower]['deaths'] += player_data.get('deaths', 0)
-            self.stats[name_lower]['assists'] += player_data.get('assists', 0)
-            self.stats[name_lower]['score'] += player_data.get('score', 0)
-            self.stats[name_lower]['playtime'] += player_playtime
-            self.stats[name_lower]['games_played'] += 1
+            kills = player_data.get('kills', 0)
+            deaths = player_data.get('deaths', 0)
+            score = player_data.get('score', 0)
+            
+            # Update overall stats (accumulate totals - each screenshot is a win)
+            overall.add_match(kills, deaths, score, player_data.get('assists', 0), player_playtime)
             
             # Update mode-specific stats (no playtime or assists for mode tables)
-            mode_stats[name_lower]['wins'] += 1
-            mode_stats[name_lower]['kills'] += player_data.get('kills', 0)
-            mode_stats[name_lower]['deaths'] += player_data.get('deaths', 0)
-            mode_stats[name_lower]['score'] += player_data.get('score', 0)
-            mode_stats[name_lower]['games_played'] += 1
+            mode_record.add_match(kills, deaths, score)
             
-            # Update display name if it's more complete
-            if len(name) > len(self.stats[name_lower]['display_name']):
-                self.stats[name_lower]['display_name'] = name
-                mode_stats[name_lower]['display_name'] = name
-        
-        # Save after updating
-        self.save_stats()
+            # Update display name if it's more complete (never from a snapped misread)
+            if name.lower() == name_lower and len(name) > len(overall.display_name):
+                overall.display_name = name
+                mode_record.display_name = name
     
-    def get_leaderboard(self, category='wins', min_games=2):
+    def get_leaderboard(self, category='wins', min_games=2, days=None):
         """
         Get leaderboard sorted by category
         
         Args:
             category: Stat category to sort by (wins, kills, deaths, assists, score, playtime)
             min_games: Minimum games played to appear on leaderboard
+            days: Only count matches from the last N days (None = all-time)
             
         Returns:
             list: Sorted list of player stats dictionaries
         """
+        source = self.stats if days is None else self.get_window_stats(days)
+        
         # Filter players with minimum games
         eligible_players = [
-            {**stats, 'name': name_key}
-            for name_key, stats in self.stats.items()
-            if stats['games_played'] >= min_games
+            {**stats.to_dict(), 'name': name_key}
+            for name_key, stats in source.items()
+            if stats.games_played >= min_games
         ]
         
         # Validate category
@@ -205,12 +387,201 @@ class StatsManager:
         Returns:
             dict: Player stats or None if not found
         """
-        name_lower = name.lower()
-        return self.stats.get(name_lower)
+        record = self.stats.get(self.name_resolver.lookup(name))
+        return record.to_dict() if record else None
+    
+    def get_player_history(self, name, limit=10):
+        """
+        Get a player's totals, per-mode splits and recent matches
+        Matches come from the player's posting list, so this only touches their own games
+        
+        Args:
+            name: Player name (case-insensitive, OCR misreads are tolerated)
+            limit: Number of recent matches to return
+            
+        Returns:
+            dict: overall/duos/squads totals, recent matches (newest first), best match
+                  and total match count, or None if the player isn't known
+        """
+        name_key = self.name_resolver.find(name)
+        record = self.stats.get(name_key) if name_key else None
+        if record is None:
+            return None
+        
+        matches = []
+        for _, log_key in self.player_matches.get(name_key, []):
+            log_entry = self.screenshot_log.get(log_key)
+            if log_entry is None:
+                continue
+            for player in log_entry.get('players', []):
+                player_name = player if isinstance(player, str) else player.get('name', '')
+                if self.name_resolver.lookup(player_name) != name_key:
+                    continue
+                match = {} if isinstance(player, str) else dict(player)
+                match['name'] = player_name
+                match['game_mode'] = log_entry.get('game_mode', 'squads')
+                match['day'] = self._match_day(log_entry)
+                match['message_id'] = log_entry.get('message_id')
+                matches.append(match)
+                break
+        
+        duos = self.duos_stats.get(name_key)
+        squads = self.squads_stats.get(name_key)
+        return {
+            'name_key': name_key,
+            'overall': record.to_dict(),
+            'duos': duos.to_dict() if duos else None,
+            'squads': squads.to_dict() if squads else None,
+            'recent': matches[::-1][:limit],
+            'best': max(matches, key=lambda m: m.get('score', 0)) if matches else None,
+            'total_matches': len(matches)
+        }
+    
+    def list_aliases(self):
+        """
+        Get the OCR misread merges (see name_resolver.py)
+        
+        Returns:
+            list: (alias, canonical name key) tuples
+        """
+        return self.name_resolver.list_aliases()
+    
+    @_locked
+    def unalias_player(self, name):
+        """
+        Undo an OCR misread merge and rebuild stats so the name counts as its own player
+        
+        Args:
+            name: Merged name (case-insensitive)
+        
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        canonical = self.name_resolver.remove_alias(name)
+        if canonical is None:
+            return (False, f"'{name}' is not merged into another player")
+        
+        success, message, _ = self.recalculate_all_stats_from_log()
+        if not success:
+            return (False, f"Removed alias '{name}' → '{canonical}', but rebuilding stats failed: {message}")
+        return (True, f"'{name}' is no longer merged into '{canonical}'")
+    
+    @_locked
+    def reset(self):
+        """
+        Delete all stats, the screenshot log, the match event log, archived matches
+        and name aliases, in memory and on disk (GUI "Rebuild Database")
+        The running bot calls this instead of having its files deleted underneath it,
+        so the next save can't write the old state back
+        
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        try:
+            self.stats, self.duos_stats, self.squads_stats = {}, {}, {}
+            self.screenshot_log = {}
+            self.archive.clear()
+            self.name_resolver.clear()
+            self._rebuild_indexes()
+            if not self.compact():
+                return (False, "Stats were cleared in memory but could not be saved")
+            return (True, "Deleted all stats, screenshot log, archived matches and name aliases")
+        except Exception as e:
+            error_msg = f"Error resetting stats: {e}"
+            print(error_msg)
+            return (False, error_msg)
+    
+    def format_player_embed(self, name, limit=10):
+        """
+        Format a player's stats card for Discord
+        
+        Args:
+            name: Player name
+            limit: Number of recent matches to show
+            
+        Returns:
+            dict: Embed data, or None if the player isn't known
+        """
+        history = self.get_player_history(name, limit)
+        if history is None:
+            return None
+        
+        fields = []
+        
+        # Totals per mode
+        summary_rows = []
+        for label, totals in (('All', history['overall']), ('Duos', history['duos']), ('Squads', history['squads'])):
+            if not totals or not totals['games_played']:
+                continue
+            kd_ratio = totals['kills'] / max(1, totals['deaths'])
+            summary_rows.append([label, str(totals['wins']), f"{totals['score']:,}",
+                                 f"{totals['kills']}-{totals['deaths']}", f"{kd_ratio:.2f}"])
+        if summary_rows:
+            summary_table = self._format_discord_table(
+                ['MODE', 'Wins', 'Score', 'K/D', 'Ratio'], summary_rows, padding=3
+            )
+            fields.append(self._table_to_field('\u200b', summary_table))
+        
+        # Recent matches
+        def match_row(match):
+            day = date.fromordinal(match['day']).strftime('%m/%d') if match['day'] else '-'
+            return [day, match['game_mode'].capitalize(), f"{match.get('score', 0):,}",
+                    f"{match.get('kills', 0)}/{match.get('deaths', 0)}/{match.get('assists', 0)}"]
+        
+        recent_rows = [match_row(match) for match in history['recent']]
+        if recent_rows:
+            recent_table = self._format_discord_table(['DATE', 'Mode', 'Score', 'K/D/A'], recent_rows, padding=3)
+            fields.append(self._table_to_field('Recent matches', recent_table))
+        
+        best = history['best']
+        if best and best.get('score', 0):
+            best_table = self._format_discord_table(['DATE', 'Mode', 'Score', 'K/D/A'], [match_row(best)], padding=3)
+            fields.append(self._table_to_field('Best match', best_table))
+        
+        overall = history['overall']
+        playtime = overall['playtime']
+        hours = int(playtime // 60)
+        minutes = int(playtime % 60)
+        playtime_str = f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
+        
+        return {
+            'title': overall['display_name'],
+            'description': f"{history['total_matches']} logged matches \u2022 {overall['assists']} assists \u2022 {playtime_str} played",
+            'color': 0x00D166,  # Green
+            'fields': fields
+        }
+    
+    def snapshot(self):
+        """
+        Get a read-only snapshot of the aggregates, safe to hand to other threads
+        Snapshots are cached per data version. While another thread holds the lock
+        (e.g. a rebuild), the last complete snapshot is returned instead of waiting
+        
+        Returns:
+            StatsSnapshot: Read-only snapshot (None if the first one can't be taken yet)
+        """
+        cached = self._snapshot
+        if cached is not None and cached.version == self.data_version:
+            return cached
+        
+        if not self.lock.acquire(blocking=False):
+            return cached
+        try:
+            self._snapshot = StatsSnapshot(
+                version=self.data_version,
+                overall=MappingProxyType(self._records_to_dict(self.stats)),
+                duos=MappingProxyType(self._records_to_dict(self.duos_stats)),
+                squads=MappingProxyType(self._records_to_dict(self.squads_stats)),
+                match_count=len(self.screenshot_log),
+                archived_count=len(self.archive)
+            )
+            return self._snapshot
+        finally:
+            self.lock.release()
     
     def get_all_stats(self):
-        """Get all player stats"""
-        return self.stats
+        """Get all player stats (as plain dicts keyed by lowercase name)"""
+        return self._records_to_dict(self.stats)
     
     def _format_discord_table(self, headers, rows, padding=2, alignments=None):
         """
@@ -277,7 +648,7 @@ class StatsManager:
         
         return "\n".join(table_lines)
     
-    def get_mode_leaderboard(self, mode='squads', category='score', min_games=2):
+    def get_mode_leaderboard(self, mode='squads', category='score', min_games=2, days=None):
         """
         Get mode-specific leaderboard sorted by category
         
@@ -285,18 +656,22 @@ class StatsManager:
             mode: Game mode ('duos' or 'squads')
             category: Stat category to sort by (score, wins, kills, deaths)
             min_games: Minimum games played to appear on leaderboard
+            days: Only count matches from the last N days (None = all-time)
             
         Returns:
             list: Sorted list of player stats dictionaries
         """
         # Select the appropriate stats dictionary
-        mode_stats = self.duos_stats if mode == 'duos' else self.squads_stats
+        if days is None:
+            mode_stats = self.duos_stats if mode == 'duos' else self.squads_stats
+        else:
+            mode_stats = self.get_window_stats(days, 'duos' if mode == 'duos' else 'squads')
         
         # Filter players with minimum games
         eligible_players = [
-            {**stats, 'name': name_key}
+            {**stats.to_dict(), 'name': name_key}
             for name_key, stats in mode_stats.items()
-            if stats['games_played'] >= min_games
+            if stats.games_played >= min_games
         ]
         
         # Validate category
@@ -313,7 +688,7 @@ class StatsManager:
         
         return sorted_players
     
-    def format_leaderboard_embed(self, category='score', min_games=2, top_n=6):
+    def format_leaderboard_embed(self, category='score', min_games=2, top_n=6, days=None):
         """
         Format leaderboard embed with FOUR tables for Discord:
         1. Overall Score leaderboard (Score, Wins, Playtime)
@@ -328,10 +703,37 @@ class StatsManager:
         - Each table as a separate field (not code blocks)
         - All tables have consistent column widths for vertical alignment
         
+        Renders are memoized per (data_version, min_games, top_n, days), so repeated
+        calls between stats mutations return the cached embed without rebuilding
+        
         Args:
             category: Unused (kept for compatibility), always shows all 4 tables
             min_games: Minimum games to display
             top_n: Number of top players to show (default: 6)
+            days: Only count matches from the last N days (None = all-time)
+            
+        Returns:
+            dict: Embed data with 4 leaderboards as fields
+        """
+        # Windowed boards also depend on the current day, so key them by it
+        today = date.today().toordinal() if days is not None else None
+        cache_key = (self.data_version, min_games, top_n, days, today)
+        cached = self._embed_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        embed_data = self._build_leaderboard_embed(min_games, top_n, days)
+        self._embed_cache[cache_key] = embed_data
+        return embed_data
+    
+    def _build_leaderboard_embed(self, min_games, top_n, days=None):
+        """
+        Build the four-table leaderboard embed (uncached)
+        
+        Args:
+            min_games: Minimum games to display
+            top_n: Number of top players to show
+            days: Only count matches from the last N days (None = all-time)
             
         Returns:
             dict: Embed data with 4 leaderboards as fields
@@ -344,22 +746,22 @@ class StatsManager:
         all_names = []
         
         # 1. Collect Overall Score data
-        score_leaders = self.get_leaderboard('score', min_games)[:top_n]
+        score_leaders = self.get_leaderboard('score', min_games, days)[:top_n]
         for player in score_leaders:
             all_names.append(player['display_name'][:20])
         
         # 2. Collect Overall K/D data
-        kills_leaders = self.get_leaderboard('kills', min_games)[:top_n]
+        kills_leaders = self.get_leaderboard('kills', min_games, days)[:top_n]
         for player in kills_leaders:
             all_names.append(player['display_name'][:20])
         
         # 3. Collect Duos data
-        duos_leaders = self.get_mode_leaderboard('duos', 'score', min_games)[:top_n]
+        duos_leaders = self.get_mode_leaderboard('duos', 'score', min_games, days)[:top_n]
         for player in duos_leaders:
             all_names.append(player['display_name'][:20])
         
         # 4. Collect Squads data
-        squads_leaders = self.get_mode_leaderboard('squads', 'score', min_games)[:top_n]
+        squads_leaders = self.get_mode_leaderboard('squads', 'score', min_games, days)[:top_n]
         for player in squads_leaders:
             all_names.append(player['display_name'][:20])
         
@@ -478,8 +880,16 @@ class StatsManager:
             )
             fields.append(self._table_to_field('\u200b', combined_table))
         
+        # Label time-windowed boards (all-time board has no description)
+        if days is None:
+            description = ''
+        elif days == 1:
+            description = 'Today'
+        else:
+            description = f'Last {days} days'
+        
         return {
-            'description': '',
+            'description': description,
             'color': 0x00D166,  # Green
             'fields': fields
         }
@@ -506,6 +916,7 @@ class StatsManager:
             'inline': False
         }
     
+    @_locked
     def recalculate_all_stats_from_log(self):
         """
         Recalculate all player stats from screenshot log
@@ -515,58 +926,40 @@ class StatsManager:
             tuple: (success: bool, message: str, stats_count: int)
         """
         try:
-            if not self.screenshot_log:
+            if not self.screenshot_log and not len(self.archive):
                 return (False, "No screenshot log found to recalculate from", 0)
             
-            # Clear existing stats (all modes)
-            self.stats = {}
-            self.duos_stats = {}
-            self.squads_stats = {}
-            print("Cleared existing stats for recalculation")
+            # Rebuild into fresh tables (all modes) and swap them in at the end, so
+            # readers on other threads never see a half-built leaderboard
+            overall_stats = {}
+            duos_stats = {}
+            squads_stats = {}
+            self.name_resolver.reset_known()  # Re-learn players so old misreads merge on replay
+            print("Rebuilding stats for recalculation")
             
-            # Process each logged screenshot
+            # Process each logged screenshot (archived segments first, oldest matches)
             processed_count = 0
-            for log_key, log_entry in self.screenshot_log.items():
+            for log_key, log_entry in self.iter_all_entries():
                 try:
                     # Reconstruct parsed_data format from log entry
-                    parsed_data = {
-                        'match_time': log_entry.get('match_time', 0),
-                        'game_mode': log_entry.get('game_mode', 'squads'),  # Include game mode
-                        'players': []
-                    }
+                    parsed_data = self._entry_to_parsed_data(log_entry)
                     
-                    # Add player data
-                    for player in log_entry.get('players', []):
-                        if isinstance(player, dict):
-                            player_data = {
-                                'name': player.get('name', ''),
-                                'score': player.get('score', 0),
-                                'kills': player.get('kills', 0),
-                                'deaths': player.get('deaths', 0),
-                                'assists': player.get('assists', 0)
-                            }
-                            if 'playtime_minutes' in player:
-                                player_data['playtime_minutes'] = player['playtime_minutes']
-                            parsed_data['players'].append(player_data)
-                        elif isinstance(player, str):
-                            # Old format - just player name
-                            parsed_data['players'].append({
-                                'name': player,
-                                'score': 0,
-                                'kills': 0,
-                                'deaths': 0,
-                                'assists': 0
-                            })
-                    
-                    # Update stats using normal update method
                     if parsed_data['players']:
-                        self.update_player_stats(parsed_data)
+                        mode_stats = self._mode_table(duos_stats, squads_stats, parsed_data['game_mode'])
+                        self._accumulate_players(
+                            overall_stats, mode_stats, parsed_data['players'],
+                            parsed_data['match_time'], verbose=True
+                        )
                         processed_count += 1
                         
                 except Exception as e:
                     print(f"Error processing log entry {log_key}: {e}")
                     continue
             
+            self.stats, self.duos_stats, self.squads_stats = overall_stats, duos_stats, squads_stats
+            self._rebuild_indexes()
+            self.compact()
+            
             message = f"Successfully recalculated stats from {processed_count} screenshots"
             print(message)
             return (True, message, len(self.stats))
@@ -578,31 +971,144 @@ class StatsManager:
             traceback.print_exc()
             return (False, error_msg, 0)
     
+    def iter_all_entries(self):
+        """
+        Iterate over archived and live screenshot log entries, oldest segments first
+        Only full recalculations and offline tools (reparse, corpus export) read the
+        archive segments; stats_io streams the same files without loading a StatsManager
+        
+        Yields:
+            tuple: (log_key, log_entry)
+        """
+        for log_key, log_entry in self.archive.iter_entries():
+            # Skip entries from an archive run that crashed before the log snapshot
+            if log_key not in self.screenshot_log:
+                yield log_key, log_entry
+        yield from self.screenshot_log.items()
+    
+    @_locked
+    def archive_old_matches(self):
+        """
+        Move matches older than archive_after_days into a compressed archive segment
+        All-time stats keep counting them; time windows and .player history only cover
+        live matches. The caller snapshots the shortened log with compact()
+        
+        Returns:
+            int: Number of matches archived
+        """
+        if self.archive_after_days <= 0:
+            return 0
+        
+        cutoff = date.today().toordinal() - self.archive_after_days
+        old_entries = {}
+        days = []
+        for log_key, log_entry in self.screenshot_log.items():
+            day = self._match_day(log_entry)
+            if day is not None and day < cutoff:
+                old_entries[log_key] = log_entry
+                days.append(day)
+        
+        if not old_entries:
+            return 0
+        
+        try:
+            segment = self.archive.write_segment(old_entries, min(days), max(days))
+        except Exception as e:
+            print(f"Error writing archive segment: {e}")
+            return 0
+        
+        for log_key in old_entries:
+            del self.screenshot_log[log_key]
+        self._rebuild_indexes()
+        print(f"Archived {len(old_entries)} match(es) older than {self.archive_after_days} days to {segment}")
+        return len(old_entries)
+    
+    @staticmethod
+    def _entry_to_parsed_data(log_entry):
+        """
+        Reconstruct parsed screenshot data from a screenshot log entry
+        
+        Args:
+            log_entry: Screenshot log entry
+            
+        Returns:
+            dict: parsed_data with match_time, game_mode and players
+        """
+        parsed_data = {
+            'match_time': log_entry.get('match_time', 0),
+            'game_mode': log_entry.get('game_mode', 'squads'),  # Include game mode
+            'players': []
+        }
+        
+        # Add player data
+        for player in log_entry.get('players', []):
+            if isinstance(player, dict):
+                player_data = {
+                    'name': player.get('name', ''),
+                    'score': player.get('score', 0),
+                    'kills': player.get('kills', 0),
+                    'deaths': player.get('deaths', 0),
+                    'assists': player.get('assists', 0)
+                }
+                if 'playtime_minutes' in player:
+                    player_data['playtime_minutes'] = player['playtime_minutes']
+                parsed_data['players'].append(player_data)
+            elif isinstance(player, str):
+                # Old format - just player name
+                parsed_data['players'].append({
+                    'name': player,
+                    'score': 0,
+                    'kills': 0,
+                    'deaths': 0,
+                    'assists': 0
+                })
+        
+        return parsed_data
+    
     def get_available_categories(self):
         """Get list of available stat categories"""
         return ['wins', 'kills', 'deaths', 'assists', 'score', 'playtime', 'games_played']
     
+    @_locked
     def load_screenshot_log(self):
         """Load screenshot log from JSON file"""
+        screenshot_log = {}
         if os.path.exists(self.screenshot_log_file):
             try:
                 with open(self.screenshot_log_file, 'r') as f:
-                    self.screenshot_log = json.load(f)
-                print(f"Loaded {len(self.screenshot_log)} screenshot entries")
+                    screenshot_log = json.load(f)
+                print(f"Loaded {len(screenshot_log)} screenshot entries")
             except Exception as e:
                 print(f"Error loading screenshot log: {e}")
-                self.screenshot_log = {}
-        else:
-            self.screenshot_log = {}
+                screenshot_log = {}
+        
+        # Apply matches added/removed since the last snapshot (idempotent by key)
+        for event in self.event_log.read():
+            if event['type'] == MATCH_ADDED:
+                screenshot_log[event['key']] = event['entry']
+            elif event['type'] == MATCH_REMOVED:
+                screenshot_log.pop(event['key'], None)
+        
+        # Finish an archive run that crashed before the log snapshot was written
+        for log_key in [key for key in screenshot_log if key in self.archive]:
+            del screenshot_log[log_key]
+        
+        self.screenshot_log = screenshot_log
+        self._rebuild_indexes()
     
     def save_screenshot_log(self):
-        """Save screenshot log to JSON file"""
+        """
+        Save screenshot log to JSON file
+        
+        Returns:
+            bool: True if saved
+        """
         try:
-            os.makedirs(os.path.dirname(self.screenshot_log_file), exist_ok=True)
-            with open(self.screenshot_log_file, 'w') as f:
-                json.dump(self.screenshot_log, f, indent=2)
+            self._write_json_atomic(self.screenshot_log_file, self.screenshot_log)
+            return True
         except Exception as e:
             print(f"Error saving screenshot log: {e}")
+            return False
     
     def is_screenshot_processed(self, message_id, attachment_id):
         """
@@ -616,9 +1122,10 @@ class StatsManager:
             bool: True if already processed
         """
         key = f"{message_id}_{attachment_id}"
-        return key in self.screenshot_log
+        return key in self.screenshot_log or key in self.archive
     
-    def log_screenshot(self, message_id, attachment_id, filename, parsed_data):
+    @_locked
+    def log_screenshot(self, message_id, attachment_id, filename, parsed_data, processed_at=None):
         """
         Log a processed screenshot with full player stats
         
@@ -626,7 +1133,9 @@ class StatsManager:
             message_id: Discord message ID
             attachment_id: Discord attachment ID
             filename: Screenshot filename
-            parsed_data: Parsed player data (includes game_mode)
+            parsed_data: Parsed player data (includes game_mode, and the raw zone_texts
+                         when it came from OCRParser.parse_screenshot)
+            processed_at: ISO timestamp to keep (default: now)
         """
         key = f"{message_id}_{attachment_id}"
         
@@ -650,13 +1159,24 @@ class StatsManager:
             'message_id': str(message_id),
             'attachment_id': str(attachment_id),
             'filename': filename,
-            'processed_at': datetime.now().isoformat(),
+            'processed_at': processed_at or datetime.now().isoformat(),
             'match_time': parsed_data.get('match_time', 0),
             'game_mode': parsed_data.get('game_mode', 'squads'),  # Store game mode
             'players': players_data  # Now includes full stats per player including playtime
         }
-        self.save_screenshot_log()
+        # Hash of the screenshot in the local store (ocr/screenshot_store.py)
+        if parsed_data.get('sha256'):
+            self.screenshot_log[key]['sha256'] = parsed_data['sha256']
+        # Raw zone OCR text, so the match can be re-parsed later without the image (ocr/reparse.py)
+        if parsed_data.get('zone_texts'):
+            self.screenshot_log[key]['zone_texts'] = parsed_data['zone_texts']
+            self.screenshot_log[key]['override'] = bool(parsed_data.get('override', False))
+        self._add_to_buckets(self.screenshot_log[key])
+        self._index_match(key, self.screenshot_log[key])
+        self._bump_version()
+        self._record_event(MATCH_ADDED, key, self.screenshot_log[key])
     
+    @_locked
     def remove_screenshot_stats(self, log_entry):
         """
         Remove stats associated with a deleted screenshot
@@ -669,11 +1189,111 @@ class StatsManager:
         game_mode = log_entry.get('game_mode', 'squads')  # Get game mode from log
         
         # Select mode-specific stats dictionary
-        if game_mode == 'duos':
-            mode_stats = self.duos_stats
-        else:
-            mode_stats = self.squads_stats
+        mode_stats = self._mode_table(self.duos_stats, self.squads_stats, game_mode)
+        
+        self._reverse_players(self.stats, mode_stats, players, match_time, game_mode, verbose=True)
+        self._remove_from_buckets(log_entry)
+        self._unindex_match(f"{log_entry.get('message_id')}_{log_entry.get('attachment_id')}", log_entry)
+        
+        self._bump_version()
+    
+    def find_screenshots(self, message_id):
+        """
+        Logged screenshots of a Discord message, live or archived
+        
+        Args:
+            message_id: Discord message ID
+            
+        Returns:
+            list: (log_key, log_entry) tuples
+        """
+        found = [(log_key, log_entry) for log_key, log_entry in list(self.screenshot_log.items())
+                 if log_entry['message_id'] == str(message_id)]
+        for log_key in self.archive.keys_for_message(message_id):
+            log_entry = self.archive.get(log_key)
+            if log_entry is not None:
+                found.append((log_key, log_entry))
+        return found
+    
+    @_locked
+    def remove_screenshot(self, log_key):
+        """
+        Remove a logged screenshot and reverse its stats
+        Archived screenshots are reversed from their archive segment and marked as
+        removed in the archive index
         
+        Args:
+            log_key: Screenshot log key ("<message_id>_<attachment_id>")
+            
+        Returns:
+            dict: The removed log entry, or None if the key wasn't logged
+        """
+        log_entry = self.screenshot_log.get(log_key)
+        if log_entry is None:
+            return self._remove_archived_screenshot(log_key)
+        
+        self.remove_screenshot_stats(log_entry)
+        del self.screenshot_log[log_key]
+        self._record_event(MATCH_REMOVED, log_key, log_entry)
+        return log_entry
+    
+    def _remove_archived_screenshot(self, log_key):
+        """Reverse an archived match's all-time stats (it has no day bucket or history entry)"""
+        log_entry = self.archive.get(log_key)
+        if log_entry is None:
+            return None
+        
+        print(f"Removing archived match {log_key} (read back from its archive segment)")
+        parsed_data = self._entry_to_parsed_data(log_entry)
+        mode_stats = self._mode_table(self.duos_stats, self.squads_stats, parsed_data['game_mode'])
+        self._reverse_players(
+            self.stats, mode_stats, parsed_data['players'],
+            parsed_data['match_time'], parsed_data['game_mode'], verbose=True
+        )
+        self.archive.remove(log_key)
+        self._bump_version()
+        self._record_event(MATCH_REMOVED, log_key, log_entry)
+        return log_entry
+    
+    @_locked
+    def replace_screenshot(self, log_key, parsed_data):
+        """
+        Swap a logged match's stats for a new parse of the same screenshot
+        Recorded as a removal followed by an addition, so the event log replays it
+        
+        Args:
+            log_key: Screenshot log key ("<message_id>_<attachment_id>")
+            parsed_data: New parsed data for the screenshot
+            
+        Returns:
+            dict: The new log entry, or None if the key wasn't logged
+        """
+        old_entry = self.remove_screenshot(log_key)
+        if old_entry is None:
+            return None
+        
+        if old_entry.get('sha256') and not parsed_data.get('sha256'):
+            parsed_data = dict(parsed_data, sha256=old_entry['sha256'])
+        self.update_player_stats(parsed_data)
+        self.log_screenshot(
+            old_entry['message_id'], old_entry['attachment_id'], old_entry.get('filename'),
+            parsed_data, processed_at=old_entry.get('processed_at')
+        )
+        return self.screenshot_log[log_key]
+    
+    def _reverse_players(self, overall_table, mode_table, players, match_time, game_mode, verbose=False):
+        """
+        Subtract one match's player stats from an overall table and a mode table
+        Players left with no games are dropped from the tables
+        
+        Args:
+            overall_table: {name_key: PlayerStats} to update
+            mode_table: {name_key: ModeStats} to update
+            players: Log entry player list (dicts, or bare names for old entries)
+            match_time: Match length in minutes (fallback playtime)
+            game_mode: Game mode of the match (for logging)
+            verbose: Log players removed from the tables
+        """
         for player_data in players:
             # Handle both old format (string) and new format (dict)
             if isinstance(player_data, str):
@@ -686,38 +1306,195 @@ class StatsManager:
                 # Use individual playtime if available, otherwise match_time
                 player_playtime = player_stats.get('playtime_minutes', match_time)
             
-            name_lower = player_name.lower()
+            name_lower = self.name_resolver.lookup(player_name)
+            kills = player_stats.get('kills', 0)
+            deaths = player_stats.get('deaths', 0)
+            score = player_stats.get('score', 0)
             
             # Remove from overall stats
-            if name_lower in self.stats:
-                # Reverse the stats added from this match
-                self.stats[name_lower]['wins'] = max(0, self.stats[name_lower]['wins'] - 1)
-                self.stats[name_lower]['games_played'] = max(0, self.stats[name_lower]['games_played'] - 1)
-                self.stats[name_lower]['playtime'] = max(0, self.stats[name_lower]['playtime'] - player_playtime)
-                
-                # Subtract individual stats if available
-                if player_stats:
-                    self.stats[name_lower]['kills'] = max(0, self.stats[name_lower]['kills'] - player_stats.get('kills', 0))
-                    self.stats[name_lower]['deaths'] = max(0, self.stats[name_lower]['deaths'] - player_stats.get('deaths', 0))
-                    self.stats[name_lower]['assists'] = max(0, self.stats[name_lower]['assists'] - player_stats.get('assists', 0))
-                    self.stats[name_lower]['score'] = max(0, self.stats[name_lower]['score'] - player_stats.get('score', 0))
+            overall = overall_table.get(name_lower)
+            if overall is not None:
+                # Reverse the stats added from this match (individual stats only if available)
+                overall.remove_match(
+                    kills, deaths, score, player_stats.get('assists', 0), player_playtime,
+                    totals_only=not player_stats
+                )
                 
                 # Remove player if they have no games left
-                if self.stats[name_lower]['games_played'] == 0:
-                    del self.stats[name_lower]
-                    print(f"Removed player {player_name} from overall stats (no games remaining)")
+                if overall.games_played == 0:
+                    del overall_table[name_lower]
+                    if verbose:
+                        print(f"Removed player {player_name} from overall stats (no games remaining)")
             
             # Remove from mode-specific stats
-            if name_lower in mode_stats and player_stats:
-                mode_stats[name_lower]['wins'] = max(0, mode_stats[name_lower]['wins'] - 1)
-                mode_stats[name_lower]['games_played'] = max(0, mode_stats[name_lower]['games_played'] - 1)
-                mode_stats[name_lower]['kills'] = max(0, mode_stats[name_lower]['kills'] - player_stats.get('kills', 0))
-                mode_stats[name_lower]['deaths'] = max(0, mode_stats[name_lower]['deaths'] - player_stats.get('deaths', 0))
-                mode_stats[name_lower]['score'] = max(0, mode_stats[name_lower]['score'] - player_stats.get('score', 0))
+            mode_record = mode_table.get(name_lower)
+            if mode_record is not None and player_stats:
+                mode_record.remove_match(kills, deaths, score)
                 
                 # Remove player from mode stats if they have no games left
-                if mode_stats[name_lower]['games_played'] == 0:
-                    del mode_stats[name_lower]
-                    print(f"Removed player {player_name} from {game_mode} stats (no games remaining)")
+                if mode_record.games_played == 0:
+                    del mode_table[name_lower]
+                    if verbose:
+                        print(f"Removed player {player_name} from {game_mode} stats (no games remaining)")
+    
+    @staticmethod
+    def _match_day(log_entry):
+        """
+        Get the calendar day a logged match was played on
+        Uses the Discord message snowflake (when the screenshot was posted), falling back
+        to processed_at, since rebuilds re-process old screenshots with a new timestamp
+        
+        Args:
+            log_entry: Screenshot log entry
+            
+        Returns:
+            int: Date ordinal (date.toordinal()), or None if no timestamp is available
+        """
+        try:
+            timestamp_ms = (int(log_entry['message_id']) >> 22) + DISCORD_EPOCH_MS
+            return datetime.fromtimestamp(timestamp_ms / 1000).date().toordinal()
+        except (KeyError, TypeError, ValueError, OverflowError, OSError):
+            pass
+        
+        try:
+            return datetime.fromisoformat(log_entry['processed_at']).date().toordinal()
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _day_bucket(daily_buckets, day):
+        """Get (or create) the aggregate bucket for a day"""
+        bucket = daily_buckets.get(day)
+        if bucket is None:
+            bucket = daily_buckets[day] = {'overall': {}, 'duos': {}, 'squads': {}}
+        return bucket
+    
+    def _add_to_buckets(self, log_entry, daily_buckets=None):
+        """Add a logged match into its daily aggregate bucket"""
+        day = self._match_day(log_entry)
+        if day is None:
+            return
+        
+        parsed_data = self._entry_to_parsed_data(log_entry)
+        bucket = self._day_bucket(self.daily_buckets if daily_buckets is None else daily_buckets, day)
+        mode_table = self._mode_table(bucket['duos'], bucket['squads'], parsed_data['game_mode'])
+        self._accumulate_players(bucket['overall'], mode_table, parsed_data['players'], parsed_data['match_time'])
+    
+    def _remove_from_buckets(self, log_entry):
+        """Remove a logged match from its daily aggregate bucket"""
+        day = self._match_day(log_entry)
+        bucket = self.daily_buckets.get(day)
+        if bucket is None:
+            return
+        
+        parsed_data = self._entry_to_parsed_data(log_entry)
+        mode_table = self._mode_table(bucket['duos'], bucket['squads'], parsed_data['game_mode'])
+        self._reverse_players(
+            bucket['overall'], mode_table, parsed_data['players'],
+            parsed_data['match_time'], parsed_data['game_mode']
+        )
+        
+        if not bucket['overall']:
+            del self.daily_buckets[day]
+    
+    @staticmethod
+    def _match_sort_key(log_key, log_entry):
+        """Posting list entry for a match - ordered by Discord message ID (post time)"""
+        try:
+            return (int(log_entry.get('message_id', 0)), log_key)
+        except (TypeError, ValueError):
+            return (0, log_key)
+    
+    def _entry_player_keys(self, log_entry):
+        """Canonical stats keys of the players in a log entry"""
+        keys = set()
+        for player in log_entry.get('players', []):
+            name = player if isinstance(player, str) else player.get('name', '')
+            if name.strip():
+                keys.add(self.name_resolver.lookup(name))
+        return keys
+    
+    def _index_match(self, log_key, log_entry, player_matches=None):
+        """Add a logged match to its players' posting lists"""
+        if player_matches is None:
+            player_matches = self.player_matches
+        sort_key = self._match_sort_key(log_key, log_entry)
+        for name_key in self._entry_player_keys(log_entry):
+            bisect.insort(player_matches.setdefault(name_key, []), sort_key)
+    
+    def _unindex_match(self, log_key, log_entry):
+        """Remove a logged match from its players' posting lists"""
+        sort_key = self._match_sort_key(log_key, log_entry)
+        for name_key in self._entry_player_keys(log_entry):
+            postings = self.player_matches.get(name_key)
+            if not postings:
+                continue
+            i = bisect.bisect_left(postings, sort_key)
+            if i < len(postings) and postings[i] == sort_key:
+                del postings[i]
+            if not postings:
+                del self.player_matches[name_key]
+    
+    def _rebuild_indexes(self):
+        """Rebuild the daily aggregate buckets and per-player posting lists from the screenshot log"""
+        daily_buckets = {}
+        player_matches = {}
+        for log_key, log_entry in self.screenshot_log.items():
+            self._add_to_buckets(log_entry, daily_buckets)
+            self._index_match(log_key, log_entry, player_matches)
+        self.daily_buckets = daily_buckets
+        self.player_matches = player_matches
+        self._bump_version()
+    
+    @staticmethod
+    def parse_window(window):
+        """
+        Parse a leaderboard time window option
+        
+        Args:
+            window: 'today', 'week', 'month' or a day count like '14d' (case-insensitive)
+            
+        Returns:
+            int: Number of days in the window, or None for all-time / unrecognized options
+            (a day count over MAX_WINDOW_DAYS raises ValueError)
+        """
+        if not window:
+            return None
+        
+        window = window.strip().lower()
+        if window in TIME_WINDOWS:
+            return TIME_WINDOWS[window]
+        
+        if window.endswith('d') and window[:-1].isdigit():
+            days = int(window[:-1])
+            if days > MAX_WINDOW_DAYS:
+                raise ValueError(f"Window too long: {days} days (max {MAX_WINDOW_DAYS}d)")
+            return days if days > 0 else None
+        
+        return None
+    
+    def get_window_stats(self, days, mode='overall'):
+        """
+        Sum the daily buckets covering the last N days (today included)
+        
+        Args:
+            days: Number of days in the window
+            mode: 'overall', 'duos' or 'squads'
+            
+        Returns:
+            dict: {name_key: record} aggregates for the window
+        """
+        today = date.today().toordinal()
+        first_day = today - days + 1
+        window_stats = {}
+        
+        # Only days with matches have a bucket, so walk those rather than every day in the window
+        for day in sorted(day for day in self.daily_buckets if first_day <= day <= today):
+            bucket = self.daily_buckets[day]
+            for name_key, record in bucket[mode].items():
+                total = window_stats.get(name_key)
+                if total is None:
+                    total = window_stats[name_key] = type(record)(record.display_name)
+                total.merge(record)
         
-        self.save_stats()
+        return window_stats
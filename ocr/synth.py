@@ -0,0 +1,297 @@
+"""
+Synthetic victory screen generator
+Renders fake Battle Royale victory screens with text placed in the zones of the
+mask (zones.png), varying names, scores, fonts, compression and resolution, and
+writes a ground-truth JSON next to each image in the format ocr.benchmark reads.
+
+Usage (from the project root):
+    python -m ocr.synth ocr/synth_corpus --count 1000 --seed 7
+    python -m ocr.benchmark ocr/synth_corpus
+"""
+
+import argparse
+import json
+import random
+import string
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from ocr.zone_schema import STAT_ROLES, build_zone_schema, load_zone_schema
+
+
+# Layout is rendered at the mask's native size, then scaled to the output resolution
+RESOLUTIONS = [(1280, 720), (1600, 900), (1920, 1080), (2560, 1440)]
+FORMATS = ('png', 'jpeg', 'webp')
+
+# TrueType fonts tried in order; whichever exist on this machine are used
+FONT_CANDIDATES = [
+    'arial.ttf', 'arialbd.ttf', 'segoeui.ttf', 'segoeuib.ttf', 'bahnschrift.ttf', 'consola.ttf',
+    'DejaVuSans.ttf', 'DejaVuSans-Bold.ttf', 'DejaVuSansCondensed-Bold.ttf',
+    'LiberationSans-Regular.ttf', 'LiberationSans-Bold.ttf',
+]
+
+NAME_SYLLABLES = ['nu', 'ke', 'dil', 'cheb', 'day', 'jim', 'my', 'him', 'self', 'ger', 'ia', 'tric',
+                  'gam', 'ing', 'god', 'zed', 'rox', 'vex', 'lo', 'ra', 'ki', 'mo', 'sha', 'dow', 'fox']
+
+TEXT_COLOR = (235, 235, 235)
+VICTORY_COLOR = (255, 206, 84)
+
+
+def find_fonts():
+    """TrueType fonts available for rendering (falls back to PIL's default font)"""
+    fonts = []
+    for name in FONT_CANDIDATES:
+        try:
+            ImageFont.truetype(name, 20)
+            fonts.append(name)
+        except OSError:
+            continue
+    return fonts or [None]
+
+
+def load_layout(mask_path='ocr/zones.png'):
+    """
+    Zone boxes of the mask grouped by role, from its zone schema (zones.json)
+
+    Returns:
+        dict: {'size': (w, h), 'header', 'time', 'victory': box,
+               'players': [{'name': box, 'stats': [score, kills, deaths, assists boxes]}]}
+    """
+    schema = load_zone_schema(mask_path)
+    if schema is None:
+        mask = cv2.imread(str(mask_path), cv2.IMREAD_GRAYSCALE)
+        if mask is None:
+            raise FileNotFoundError(f"Mask file not found: {mask_path}")
+        schema = build_zone_schema(mask)
+        if schema is None:
+            raise ValueError(f"Could not label the zones of {mask_path}")
+
+    layout = {'size': tuple(schema['mask_size']), 'players': []}
+    slots = {}
+    for zone in schema['zones']:
+        box = (zone['x'], zone['y'], zone['width'], zone['height'])
+        if zone['slot'] is None:
+            layout.setdefault(zone['role'], box)
+        else:
+            slots.setdefault(zone['slot'], {})[zone['role']] = box
+
+    for slot in sorted(slots):
+        roles = slots[slot]
+        layout['players'].append({
+            'name': roles['name'],
+            'stats': [roles[role] for role in STAT_ROLES if role in roles]
+        })
+    return layout
+
+
+def random_name(rng):
+    """Gamer-tag style player name"""
+    name = ''.join(rng.choice(NAME_SYLLABLES) for _ in range(rng.randint(1, 3)))
+    style = rng.random()
+    if style < 0.4:
+        name = name.capitalize()
+    elif style < 0.6:
+        name = ''.join(part.capitalize() for part in [name[:len(name) // 2], name[len(name) // 2:]])
+    if rng.random() < 0.3:
+        name += str(rng.randint(1, 999))
+    if rng.random() < 0.1:
+        name += rng.choice('_-') + rng.choice(string.ascii_lowercase) * rng.randint(1, 3)
+    return name[:16]
+
+
+def random_match(rng, game_mode=None):
+    """Ground truth for one synthetic victory screen"""
+    game_mode = game_mode or rng.choice(['duos', 'squads'])
+    minutes, seconds = rng.randint(5, 29), rng.randint(0, 59)
+    players = []
+    for _ in range(2 if game_mode == 'duos' else 4):
+        players.append({
+            'name': random_name(rng),
+            'score': rng.randint(1000, 30000),
+            'kills': rng.randint(0, 30),
+            'deaths': rng.choice([0, 0, 0, 1, 1, 2, 3]),
+            'assists': rng.randint(0, 20),
+        })
+    return {
+        'victory': True,
+        'game_mode': game_mode,
+        'match_time': round(minutes + seconds / 60.0, 2),
+        'time_text': f"{minutes}:{seconds:02d}",
+        'players': players,
+    }
+
+
+def _fit_font(draw, text, box, font_name, fill_ratio):
+    """Largest font (up to fill_ratio of the box height) whose text fits the box"""
+    _, _, w, h = box
+    size = max(6, int(h * fill_ratio))
+    while True:
+        if font_name is None:
+            try:
+                font = ImageFont.load_default(size=size)
+            except TypeError:
+                return ImageFont.load_default()  # Old Pillow: fixed-size bitmap font
+        else:
+            font = ImageFont.truetype(font_name, size)
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        if (right - left <= w and bottom - top <= h) or size <= 6:
+            return font
+        size -= 1
+
+
+def _draw_text(draw, text, box, font_name, color, rng, fill_ratio=0.85, align='center'):
+    """Draw text inside a zone box with a little positional jitter"""
+    if not text:
+        return
+    x, y, w, h = box
+    font = _fit_font(draw, text, box, font_name, fill_ratio)
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    text_w, text_h = right - left, bottom - top
+    jitter_x = rng.randint(-2, 2)
+    jitter_y = rng.randint(-1, 1)
+    if align == 'left':
+        tx = x + 2
+    else:
+        tx = x + (w - text_w) // 2
+    ty = y + (h - text_h) // 2
+    draw.text((tx - left + jitter_x, ty - top + jitter_y), text, font=font, fill=color)
+
+
+def _background(size, rng):
+    """Dark, noisy gradient standing in for the game's blurred backdrop"""
+    width, height = size
+    base = np.array([rng.randint(10, 45), rng.randint(10, 45), rng.randint(20, 60)], dtype=np.float32)
+    gradient = np.linspace(0.6, 1.4, height, dtype=np.float32)[:, None, None]
+    image = np.broadcast_to(base * gradient, (height, width, 3)).copy()
+    noise = np.random.default_rng(rng.randint(0, 2**31)).normal(0, 6, (height, width, 3))
+    image = np.clip(image + noise, 0, 255).astype(np.uint8)
+    return Image.fromarray(image, 'RGB')
+
+
+def render_match(layout, truth, rng, font_name):
+    """
+    Render a victory screen at the mask's native size
+
+    Returns:
+        PIL.Image: Rendered screen
+    """
+    image = _background(layout['size'], rng)
+    draw = ImageDraw.Draw(image)
+
+    # Card panels behind each player, like the real scoreboard
+    for player_zone in layout['players']:
+        nx, ny, nw, nh = player_zone['name']
+        stats = player_zone['stats']
+        right = max(b[0] + b[2] for b in stats)
+        bottom = max(b[1] + b[3] for b in stats)
+        shade = rng.randint(40, 70)
+        draw.rectangle((min(nx, stats[0][0]) - 12, ny - 20, max(nx + nw, right) + 12, bottom + 24),
+                       fill=(shade, shade, shade + 10))
+
+    _draw_text(draw, f"BATTLE ROYALE {truth['game_mode'].upper()}", layout['header'], font_name, TEXT_COLOR, rng, align='left')
+    _draw_text(draw, truth['time_text'], layout['time'], font_name, TEXT_COLOR, rng)
+    _draw_text(draw, 'VICTORY', layout['victory'], font_name, VICTORY_COLOR, rng, fill_ratio=0.9)
+
+    for player_zone, player in zip(layout['players'], truth['players']):
+        _draw_text(draw, player['name'], player_zone['name'], font_name, TEXT_COLOR, rng)
+        values = [f"{player['score']:,}", str(player['kills']), str(player['deaths']), str(player['assists'])]
+        for box, text in zip(player_zone['stats'], values):
+            _draw_text(draw, text, box, font_name, TEXT_COLOR, rng)
+
+    return image
+
+
+def save_variant(image, path_stem, rng, resolution, fmt):
+    """
+    Scale and compress a rendered screen like a Discord upload would
+
+    Returns:
+        tuple: (image path, encoding settings dict)
+    """
+    if image.size != resolution:
+        image = image.resize(resolution, Image.LANCZOS)
+    if rng.random() < 0.3:
+        image = image.filter(ImageFilter.GaussianBlur(radius=rng.uniform(0.3, 0.9)))
+
+    settings = {'resolution': list(resolution), 'format': fmt}
+    if fmt == 'png':
+        path = path_stem.with_suffix('.png')
+        image.save(path, format='PNG')
+    elif fmt == 'jpeg':
+        settings['quality'] = rng.randint(45, 95)
+        path = path_stem.with_suffix('.jpg')
+        image.save(path, format='JPEG', quality=settings['quality'])
+    else:
+        settings['quality'] = rng.randint(40, 95)
+        path = path_stem.with_suffix('.webp')
+        image.save(path, format='WEBP', quality=settings['quality'])
+    return path, settings
+
+
+def generate(output_dir, count, seed=0, mask_path='ocr/zones.png', formats=FORMATS, resolutions=RESOLUTIONS):
+    """
+    Generate a labeled synthetic corpus
+
+    Each image gets its own random stream (seed + index), so any single sample can
+    be regenerated on its own
+
+    Returns:
+        int: Number of images written
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    layout = load_layout(mask_path)
+    fonts = find_fonts()
+    print(f"✓ Layout: {len(layout['players'])} player cards, fonts: {', '.join(f or 'default' for f in fonts)}")
+
+    for index in range(count):
+        rng = random.Random(seed + index)
+        truth = random_match(rng)
+        font_name = rng.choice(fonts)
+        image = render_match(layout, truth, rng, font_name)
+
+        stem = output / f"synth_{seed + index:06d}"
+        image_path, settings = save_variant(image, stem, rng, rng.choice(resolutions), rng.choice(formats))
+
+        ground_truth = {key: value for key, value in truth.items() if key != 'time_text'}
+        ground_truth['generator'] = dict(settings, seed=seed + index, font=font_name or 'default')
+        with open(stem.with_suffix('.json'), 'w', encoding='utf-8') as f:
+            json.dump(ground_truth, f, indent=2)
+
+        if (index + 1) % 100 == 0:
+            print(f"  → {index + 1}/{count} images")
+
+    print(f"✅ Wrote {count} synthetic screenshots to {output}")
+    return count
+
+
+def main(argv=None):
+    """Command line entry point"""
+    arg_parser = argparse.ArgumentParser(prog='python -m ocr.synth', description='Generate synthetic labeled victory screens')
+    arg_parser.add_argument('output', help='Directory for images and ground-truth JSON')
+    arg_parser.add_argument('--count', type=int, default=100)
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--mask', default='ocr/zones.png')
+    arg_parser.add_argument('--formats', default=','.join(FORMATS), help='Comma-separated subset of png,jpeg,webp')
+    arg_parser.add_argument('--resolutions', help='Comma-separated WxH list (default: 720p to 1440p)')
+    args = arg_parser.parse_args(argv)
+
+    formats = [fmt.strip() for fmt in args.formats.split(',') if fmt.strip()]
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        arg_parser.error(f"unknown format(s): {', '.join(sorted(unknown))}")
+
+    resolutions = RESOLUTIONS
+    if args.resolutions:
+        resolutions = [tuple(int(v) for v in item.lower().split('x')) for item in args.resolutions.split(',')]
+
+    generate(args.output, args.count, args.seed, args.mask, formats, resolutions)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
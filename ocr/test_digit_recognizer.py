@@ -0,0 +1,106 @@
+"""
+Test the digit recognizer and the shipped digit_templates.npz on the reference
+scoreboard: its stat zones are read exactly, while glyphs unlike every template
+(letters, a digit with its templates removed, rescaled screenshots) get confidence 0
+so the parser re-reads them with EasyOCR
+(from the project root: python -m ocr.test_digit_recognizer, or python -m pytest ocr/test_digit_recognizer.py)
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+from ocr.digit_recognizer import DigitRecognizer
+from ocr.parser import DEFAULT_OCR_PARAMS
+from ocr.zone_schema import STAT_ROLES, load_zone_schema, scale_zones
+
+
+OCR_DIR = Path(__file__).parent
+SCOREBOARD = OCR_DIR / 'test_scoreboard.webp'
+EXPECTED = json.loads((OCR_DIR / 'test_scoreboard.json').read_text())
+MIN_CONFIDENCE = DEFAULT_OCR_PARAMS['digit_min_confidence']
+
+
+def recognizer():
+    loaded = DigitRecognizer.load(OCR_DIR / 'digit_templates.npz')
+    assert loaded is not None, "digit_templates.npz missing"
+    return loaded
+
+
+def zone_crops(gray, roles):
+    """(zone, crop) for the zones of the given roles, scaled to the image"""
+    schema = load_zone_schema(OCR_DIR / 'zones.png')
+    height, width = gray.shape
+    return [(zone, gray[zone['y']:zone['y'] + zone['height'], zone['x']:zone['x'] + zone['width']])
+            for zone in scale_zones(schema, width, height) if zone['role'] in roles]
+
+
+def scoreboard(width=1920, height=1080, quality=None):
+    gray = cv2.imread(str(SCOREBOARD), cv2.IMREAD_GRAYSCALE)
+    if (width, height) != gray.shape[::-1]:
+        gray = cv2.resize(gray, (width, height), interpolation=cv2.INTER_AREA)
+    if quality:
+        gray = cv2.imdecode(cv2.imencode('.jpg', gray, [cv2.IMWRITE_JPEG_QUALITY, quality])[1], cv2.IMREAD_GRAYSCALE)
+    return gray
+
+
+def expected_text(zone):
+    return str(EXPECTED['players'][zone['slot']][zone['role']])
+
+
+def test_reads_reference_stat_zones():
+    crops = zone_crops(scoreboard(), STAT_ROLES)
+    results = recognizer().recognize_batch([crop for _, crop in crops])
+    for (zone, _), (text, confidence) in zip(crops, results):
+        assert text.replace(',', '') == expected_text(zone)
+        assert confidence >= MIN_CONFIDENCE
+
+
+def test_rejects_letters():
+    crops = zone_crops(scoreboard(), ('name', 'header'))
+    results = recognizer().recognize_batch([crop for _, crop in crops])
+    assert all(confidence == 0.0 for _, confidence in results)
+
+
+def test_digit_without_templates_falls_back():
+    full = recognizer()
+    keep = full.labels != '8'
+    partial = DigitRecognizer(full.templates[keep], full.labels[keep])
+    crops = zone_crops(scoreboard(), STAT_ROLES)
+    results = partial.recognize_batch([crop for _, crop in crops])
+    for (zone, _), (text, confidence) in zip(crops, results):
+        if '8' in expected_text(zone):
+            assert confidence == 0.0, f"missing digit read as {text!r}"
+        else:
+            assert confidence >= MIN_CONFIDENCE
+
+
+@pytest.mark.parametrize('width, height', [(1280, 720), (1600, 900)])
+def test_no_confident_misreads_when_rescaled(width, height):
+    crops = zone_crops(scoreboard(width, height, quality=85), STAT_ROLES)
+    results = recognizer().recognize_batch([crop for _, crop in crops])
+    for (zone, _), (text, confidence) in zip(crops, results):
+        if confidence >= MIN_CONFIDENCE:
+            assert text.replace(',', '') == expected_text(zone)
+
+
+if __name__ == '__main__':
+    import sys
+    tests = [('reference', test_reads_reference_stat_zones),
+             ('letters', test_rejects_letters),
+             ('missing-digit', test_digit_without_templates_falls_back),
+             ('720p', lambda: test_no_confident_misreads_when_rescaled(1280, 720)),
+             ('900p', lambda: test_no_confident_misreads_when_rescaled(1600, 900))]
+    failures = 0
+    for name, test in tests:
+        try:
+            test()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {name}: {e}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,170 @@
+"""
+Test the whole-frame OCR fallback on scoreboards whose aspect ratio fits no layout
+(an ultrawide reframing of the reference scoreboard, also letterboxed): the layout's
+zones are placed on the frame, text outside them is dropped and boxes spanning
+several stat zones are split, so the players come out of the zone schema
+EasyOCR is replaced by a reader that "detects" known text at known positions
+(from the project root: python -m ocr.test_frame_zones, or python -m pytest ocr/test_frame_zones.py)
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+from ocr.parser import OCRParser
+
+
+OCR_DIR = Path(__file__).parent
+SCOREBOARD = OCR_DIR / 'test_scoreboard.webp'
+EXPECTED = json.loads((OCR_DIR / 'test_scoreboard.json').read_text())
+SIDE = 300  # Extra columns on each side of the 1920x1080 scoreboard (2520x1080, 21:9)
+BAR = 60    # Letterbox bar height
+
+
+def zone_text_items(schema):
+    """Ground-truth text of the reference scoreboard, one (text, zone) per zone"""
+    players = EXPECTED['players']
+    fixed = {'header': 'BATTLE ROYALE SQUADS', 'time': '21:37', 'victory': 'VICTORY'}
+    items = []
+    for zone in schema['zones']:
+        role, slot = zone['role'], zone.get('slot')
+        text = fixed.get(role) or str(players[slot][role])
+        items.append((text, zone))
+    return items
+
+
+class FakeReader:
+    """
+    Stand-in for easyocr.Reader: text boxes sit at fixed frame positions;
+    detect returns groups of them, recognize reads the ones inside each box
+    """
+
+    def __init__(self, words, groups, width):
+        """
+        Args:
+            words: (text, x_min, x_max, y_min, y_max) in frame pixels
+            groups: Lists of word indexes detected as one box
+            width: Frame width (detect gets a downscaled copy)
+        """
+        self.words = words
+        self.groups = groups
+        self.width = width
+
+    def detect(self, image, **kwargs):
+        factor = image.shape[1] / self.width
+        boxes = []
+        for group in self.groups:
+            x_min = min(self.words[i][1] for i in group) - 3
+            x_max = max(self.words[i][2] for i in group) + 3
+            y_min = min(self.words[i][3] for i in group) - 3
+            y_max = max(self.words[i][4] for i in group) + 3
+            boxes.append([int(x_min * factor), int(x_max * factor) + 1, int(y_min * factor), int(y_max * factor) + 1])
+        return [boxes], [[]]
+
+    def recognize(self, image, horizontal_list, free_list, **kwargs):
+        results = []
+        for x_min, x_max, y_min, y_max in horizontal_list:
+            inside = [word for word in self.words
+                      if x_min <= (word[1] + word[2]) / 2 <= x_max and y_min <= (word[3] + word[4]) / 2 <= y_max]
+            if inside:
+                text = ' '.join(word[0] for word in sorted(inside, key=lambda word: word[1]))
+                bbox = [[x_min, y_min], [x_max, y_min], [x_max, y_max], [x_min, y_max]]
+                results.append((bbox, text, 0.9))
+        return results
+
+
+def frame_reader(schema, width):
+    """Fake reader for the reframed scoreboard: zone text, merged stat boxes and UI distractors"""
+    words, groups = [], []
+    stat_groups = {}
+    for text, zone in zone_text_items(schema):
+        cx, cy = SIDE + zone['x'] + zone['width'] / 2, zone['y'] + zone['height'] / 2
+        half_w = min(zone['width'], 14 * len(text)) / 2
+        half_h = zone['height'] * 0.4
+        words.append((text, cx - half_w, cx + half_w, cy - half_h, cy + half_h))
+        if zone['role'] in ('kills', 'deaths', 'assists'):
+            # The detector merges a card's K/D/A numbers into one box
+            stat_groups.setdefault(zone['slot'], []).append(len(words) - 1)
+        else:
+            groups.append([len(words) - 1])
+    groups.extend(stat_groups.values())
+
+    # Text outside the zones: mode tabs beside the header, a team total,
+    # a column label and a title under each name
+    distractors = [('LOADOUT', SIDE + 700, SIDE + 820, 40, 62), ('CAREER', SIDE + 900, SIDE + 1000, 40, 62),
+                   ('9,648', SIDE + 1140, SIDE + 1200, 380, 404), ('KILLS', SIDE + 730, SIDE + 780, 434, 454)]
+    for zone in schema['zones']:
+        if zone['role'] == 'name':
+            x = SIDE + zone['x']
+            distractors.append(('Hellfighter', x + 40, x + 180, zone['y'] + 40, zone['y'] + 62))
+    for word in distractors:
+        words.append(word)
+        groups.append([len(words) - 1])
+    return FakeReader(words, groups, width)
+
+
+def ultrawide():
+    """The reference scoreboard widened to 21:9 by mirroring its edges"""
+    image = cv2.imread(str(SCOREBOARD), cv2.IMREAD_COLOR)
+    return cv2.copyMakeBorder(image, 0, 0, SIDE, SIDE, cv2.BORDER_REFLECT)
+
+
+def letterboxed_ultrawide():
+    """The 21:9 frame with black bars above and below"""
+    return cv2.copyMakeBorder(ultrawide(), BAR, BAR, 0, 0, cv2.BORDER_CONSTANT, value=(0, 0, 0))
+
+
+def parse(image, use_banner=True):
+    parser = OCRParser(debug_output=False, mask_path=str(OCR_DIR / 'zones.png'), load_reader=False, zone_cache_size=0)
+    if not use_banner:
+        parser.layouts.banner_template = None
+    parser.reader = frame_reader(parser.zone_schema, image.shape[1])
+    image_bytes = cv2.imencode('.png', image)[1].tobytes()
+    return parser, asyncio.run(parser.parse_screenshot(image_bytes))
+
+
+@pytest.mark.parametrize('make_image, use_banner', [
+    (ultrawide, True),
+    (ultrawide, False),
+    (letterboxed_ultrawide, True),
+], ids=['ultrawide', 'ultrawide-no-template', 'letterboxed-ultrawide'])
+def test_frame_players(make_image, use_banner):
+    parser, result = parse(make_image(), use_banner)
+    assert result is not None, "parse failed"
+    assert parser.last_layout is None  # Whole-frame path, not a stretched mask
+    assert result['game_mode'] == 'squads'
+    assert result['match_time'] == 21.62
+    players = [{key: player[key] for key in ('name', 'score', 'kills', 'deaths', 'assists')}
+               for player in result['players']]
+    assert players == EXPECTED['players']
+
+
+def test_frame_drops_text_outside_zones():
+    parser, result = parse(ultrawide())
+    assert result is not None, "parse failed"
+    recorded = ' '.join(zone['text'] for zone in parser.last_zone_texts)
+    for distractor in ('LOADOUT', 'CAREER', '9,648', 'KILLS', 'Hellfighter'):
+        assert distractor not in recorded
+    assert all(zone['role'] for zone in parser.last_zone_texts)
+
+
+if __name__ == '__main__':
+    import sys
+    tests = [('ultrawide', lambda: test_frame_players(ultrawide, True)),
+             ('ultrawide-no-template', lambda: test_frame_players(ultrawide, False)),
+             ('letterboxed-ultrawide', lambda: test_frame_players(letterboxed_ultrawide, True)),
+             ('drops-outside-text', test_frame_drops_text_outside_zones)]
+    failures = 0
+    for name, test in tests:
+        try:
+            test()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {name}: {e}")
+    sys.exit(1 if failures else 0)
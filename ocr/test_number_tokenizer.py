@@ -0,0 +1,133 @@
+"""
+Test the number tokenizer against the former regex pipeline
+Checks the golden cases, compares both on random OCR-like text, and times them
+(from the project root: python -m ocr.test_number_tokenizer, or python -m pytest ocr/test_number_tokenizer.py)
+"""
+
+import json
+import random
+import re
+import timeit
+from pathlib import Path
+
+from ocr.number_tokenizer import extract_numbers
+
+
+GOLDEN_FILE = Path(__file__).with_name('number_tokenizer_golden.json')
+
+
+def legacy_extract_numbers(text, time_values=None, is_score_zone=False):
+    """The regex pipeline OCRParser._extract_numbers_from_text used before the tokenizer (logging removed)"""
+    text_no_space_comma = re.sub(r'\s*,\s*', ',', text)
+    comma_numbers = re.findall(r'\d{1,2},\d{3}', text_no_space_comma)
+    if comma_numbers and is_score_zone:
+        score_candidates = [int(n.replace(',', '').replace(' ', '')) for n in comma_numbers]
+        scores = [s for s in score_candidates if 1000 <= s <= 50000]
+        if scores:
+            return scores
+
+    text_cleaned = text
+
+    space_pattern = re.search(r'(\d+)\s+(\d+)\s+(\d{3})', text_cleaned)
+    if space_pattern and is_score_zone:
+        first = space_pattern.group(1)
+        middle = space_pattern.group(2)
+        last = space_pattern.group(3)
+        combined_all = int(first + middle + last)
+        if 1000 <= combined_all <= 50000:
+            return [combined_all]
+        combined_no_middle = int(first + last)
+        if 1000 <= combined_no_middle <= 50000:
+            return [combined_no_middle]
+
+    text_cleaned = re.sub(r'(\d{2})\s+0\s+(\d{3})', r'\g<1>1\2', text_cleaned)
+    text_cleaned = re.sub(r'(\d),\s+(\d)', r'\1,\2', text_cleaned)
+
+    iteration_count = 0
+    while iteration_count < 10:
+        new_text = re.sub(r'(\d+)[,\s]+(\d+)', r'\1\2', text_cleaned)
+        if new_text == text_cleaned:
+            break
+        text_cleaned = new_text
+        iteration_count += 1
+
+    text_cleaned = re.sub(r'(\d{2})1(\d{3})(?!\d)', r'\1\2', text_cleaned)
+    text_cleaned = re.sub(r'\b2(\d{5})\b', r'\1', text_cleaned)
+
+    numbers = [int(n) for n in re.findall(r'\d+', text_cleaned)]
+
+    if time_values:
+        minutes_val, seconds_val = time_values
+        numbers = [n for n in numbers if n != minutes_val and n != seconds_val]
+
+    if is_score_zone:
+        numbers = [n for n in numbers if 1000 <= n <= 50000]
+
+    return numbers
+
+
+def random_ocr_text(rng):
+    """Short zone-like text built from digits, separators and common misreads"""
+    pieces = ['0', '1', '2', '9', '12', '190', '210', '99999', ' ', ' ', '  ', ',', ', ', ' ,',
+              '\t', 'O', 'l', 'S', '_', '.', ':', '-', 'é']
+    return ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 20)))
+
+
+def test_golden():
+    """Golden outputs recorded from the former pipeline"""
+    cases = json.loads(GOLDEN_FILE.read_text(encoding='utf-8'))
+    failures = 0
+    for case in cases:
+        time_values = tuple(case['time']) if case['time'] else None
+        result = extract_numbers(case['text'], time_values, case['is_score_zone'])
+        if result != case['expected']:
+            failures += 1
+            print(f"  ❌ {case['text']!r} time={time_values} score={case['is_score_zone']}: {result} != {case['expected']}")
+    print(f"{'✅' if not failures else '❌'} Golden cases: {len(cases) - failures}/{len(cases)} identical")
+    assert failures == 0, f"{failures} golden case(s) differ"
+
+
+def test_random(count=100000, seed=0):
+    """Random text gives the same numbers as the former pipeline"""
+    rng = random.Random(seed)
+    failures = 0
+    for _ in range(count):
+        text = random_ocr_text(rng)
+        time_values = rng.choice([None, (21, 8), (1, 0), (12, 5)])
+        is_score_zone = rng.random() < 0.5
+        expected = legacy_extract_numbers(text, time_values, is_score_zone)
+        result = extract_numbers(text, time_values, is_score_zone)
+        if result != expected:
+            failures += 1
+            if failures <= 10:
+                print(f"  ❌ {text!r} time={time_values} score={is_score_zone}: {result} != {expected}")
+    print(f"{'✅' if not failures else '❌'} Random cases: {count - failures}/{count} identical")
+    assert failures == 0, f"{failures} random case(s) differ from the former pipeline"
+
+
+def benchmark(number=20000):
+    """Micro-benchmark: microseconds per call on typical zone texts"""
+    texts = ['14425', '12', '', '11,665', '9, 990', '9 1 990', '11 0 190', '12 1 220', '210665', '11,665 10 0 4']
+    for name, function in [('legacy regex', legacy_extract_numbers), ('tokenizer', extract_numbers)]:
+        def run():
+            for text in texts:
+                function(text, (21, 8), True)
+                function(text, (21, 8), False)
+        seconds = min(timeit.repeat(run, number=number // len(texts), repeat=3))
+        print(f"  {name:<13} {seconds / (number // len(texts)) / (2 * len(texts)) * 1e6:6.2f} µs per call")
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("🧪 NUMBER TOKENIZER")
+    print("=" * 80)
+    ok = True
+    for test in (test_golden, test_random):
+        try:
+            test()
+        except AssertionError:
+            ok = False
+    print("\n⏱ Micro-benchmark:")
+    benchmark()
+    print("=" * 80)
+    raise SystemExit(0 if ok else 1)
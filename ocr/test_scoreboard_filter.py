@@ -0,0 +1,118 @@
+"""
+Test the scoreboard pre-filter on the reference scoreboard, reframed copies of it
+(letterboxed, ultrawide, downscaled JPEG) and non-scoreboards (noise, a text
+document, a smooth photo, a screen whose banner isn't VICTORY)
+(from the project root: python -m ocr.test_scoreboard_filter, or python -m pytest ocr/test_scoreboard_filter.py)
+"""
+
+from pathlib import Path
+
+import pytest
+
+cv2 = pytest.importorskip('cv2')
+np = pytest.importorskip('numpy')
+
+from ocr.layouts import LayoutRegistry
+from ocr.scoreboard_filter import ScoreboardFilter
+
+
+OCR_DIR = Path(__file__).parent
+SCOREBOARD = OCR_DIR / 'test_scoreboard.webp'
+
+
+def encode(image, extension='.png', quality=90):
+    """Image bytes as they would be downloaded"""
+    params = [cv2.IMWRITE_JPEG_QUALITY, quality] if extension == '.jpg' else []
+    return cv2.imencode(extension, image, params)[1].tobytes()
+
+
+def scoreboard():
+    return cv2.imread(str(SCOREBOARD), cv2.IMREAD_COLOR)
+
+
+def noise_image(rng):
+    return rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+
+
+def document_image(rng):
+    """Dark text lines on white, as in a screenshot of a document"""
+    words = 'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor'.split()
+    image = np.full((1080, 1920, 3), 250, np.uint8)
+    for y in range(60, 1060, 42):
+        cv2.putText(image, ' '.join(rng.choice(words, 12)), (40, y), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (20, 20, 20), 2, cv2.LINE_AA)
+    return image
+
+
+def photo_image(rng):
+    """Smooth, warm photo-like image: sky gradient, blurred shapes and sensor noise"""
+    yy, xx = np.mgrid[0:1080, 0:1920]
+    sky = np.dstack([80 + 100 * yy / 1080, 150 + 60 * xx / 1920, 200 - 50 * yy / 1080]).astype(np.float32)
+    shapes = np.zeros((1080, 1920, 3), np.float32)
+    for _ in range(40):
+        color = tuple(int(v) for v in rng.integers(0, 256, 3))
+        cv2.circle(shapes, (int(rng.integers(0, 1920)), int(rng.integers(0, 1080))), int(rng.integers(40, 250)), color, -1)
+    shapes = cv2.GaussianBlur(shapes, (0, 0), 25)
+    photo = 0.5 * sky + 0.5 * shapes + rng.normal(0, 4, sky.shape)
+    return np.clip(photo, 0, 255).astype(np.uint8)
+
+
+def other_banner_image():
+    """The scoreboard with its VICTORY banner painted over by other text"""
+    image = scoreboard()
+    image[140:215, 790:1130] = image[140:215, 780:790].mean(axis=(0, 1))
+    cv2.putText(image, 'ELIMINATED', (800, 200), cv2.FONT_HERSHEY_DUPLEX, 1.6, (230, 230, 230), 3)
+    return image
+
+
+@pytest.fixture(scope='module')
+def scoreboard_filter():
+    layouts = LayoutRegistry.load(str(OCR_DIR / 'zones.png'))
+    assert layouts.banner_template is not None, "victory_template.png is missing"
+    return ScoreboardFilter(layouts)
+
+
+def test_accepts_scoreboards(scoreboard_filter):
+    """The reference scoreboard as downloaded, as a 720p JPEG, letterboxed and ultrawide"""
+    image = scoreboard()
+    variants = {
+        'original': SCOREBOARD.read_bytes(),
+        '720p jpeg': encode(cv2.resize(image, (1280, 720), interpolation=cv2.INTER_AREA), '.jpg', 70),
+        'letterboxed 16:10': encode(cv2.copyMakeBorder(image, 60, 60, 0, 0, cv2.BORDER_CONSTANT, value=(0, 0, 0))),
+        'pillarboxed 21:9': encode(cv2.copyMakeBorder(image, 0, 0, 300, 300, cv2.BORDER_CONSTANT, value=(0, 0, 0))),
+        'ultrawide 21:9': encode(cv2.copyMakeBorder(image, 0, 0, 300, 300, cv2.BORDER_REFLECT)),
+    }
+    for name, image_bytes in variants.items():
+        is_scoreboard, reason = scoreboard_filter.check(image_bytes)
+        print(f"  {'✅' if is_scoreboard else '❌'} {name}: {reason}")
+        assert is_scoreboard, f"{name} rejected: {reason}"
+
+
+def test_rejects_other_images(scoreboard_filter):
+    """Busy and smooth non-scoreboards, and a scoreboard-like screen without the VICTORY banner"""
+    rng = np.random.default_rng(7)
+    variants = {
+        'noise': encode(noise_image(rng)),
+        'document': encode(document_image(rng)),
+        'photo': encode(photo_image(rng), '.jpg'),
+        'other banner': encode(other_banner_image()),
+    }
+    for name, image_bytes in variants.items():
+        is_scoreboard, reason = scoreboard_filter.check(image_bytes)
+        print(f"  {'❌' if is_scoreboard else '✅'} {name}: {reason}")
+        assert not is_scoreboard, f"{name} accepted: {reason}"
+
+
+if __name__ == '__main__':
+    print("=" * 80)
+    print("🧪 SCOREBOARD FILTER")
+    print("=" * 80)
+    layouts = LayoutRegistry.load(str(OCR_DIR / 'zones.png'))
+    ok = True
+    for test in (test_accepts_scoreboards, test_rejects_other_images):
+        try:
+            test(ScoreboardFilter(layouts))
+        except AssertionError as e:
+            print(f"❌ {e}")
+            ok = False
+    print("=" * 80)
+    raise SystemExit(0 if ok else 1)
@@ -0,0 +1,61 @@
+"""
+Test that the tuner writes its presets into config.ini without touching the rest
+of the hand-edited file (comments, key order, formatting)
+(from the project root: python -m pytest ocr/test_tuner.py)
+"""
+
+import configparser
+
+from ocr.tuner import write_presets
+
+
+DEFAULTS = {'mag_ratio': 1.5, 'canvas_size': 4096, 'low_text': 0.2}
+
+CONFIG = """# Bot settings - keep this file private
+[Discord]
+bot_token = TOKEN   ; from the developer portal
+
+[RecZone]
+# balanced is fast enough for a small server
+ocr_preset = balanced
+
+[OCRPreset:fast]
+# Tuned on the synthetic corpus
+mag_ratio = 1.0
+canvas_size = 1280
+
+[Commands]
+command_prefix = .
+"""
+
+
+def trial(**params):
+    return {'params': dict(DEFAULTS, **params)}
+
+
+def test_write_presets_keeps_comments(tmp_path):
+    config_path = tmp_path / 'config.ini'
+    config_path.write_text(CONFIG, encoding='utf-8')
+
+    presets = {'fast': trial(mag_ratio=1.0, low_text=0.3), 'accurate': trial(canvas_size=2560)}
+    assert write_presets(str(config_path), presets, DEFAULTS)
+    text = config_path.read_text(encoding='utf-8')
+
+    # Everything outside the preset sections is unchanged
+    assert text.startswith(CONFIG.split('[OCRPreset:fast]')[0])
+    assert '# Tuned on the synthetic corpus\n' in text
+    assert '[Commands]\ncommand_prefix = .\n' in text
+
+    config = configparser.ConfigParser()
+    config.read_string(text)
+    assert dict(config.items('OCRPreset:fast')) == {'mag_ratio': '1.0', 'low_text': '0.3'}
+    assert dict(config.items('OCRPreset:accurate')) == {'canvas_size': '2560'}
+    assert config.get('Discord', 'bot_token') == 'TOKEN   ; from the developer portal'
+
+
+def test_write_presets_keeps_crlf(tmp_path):
+    config_path = tmp_path / 'config.ini'
+    config_path.write_bytes(b'[RecZone]\r\nocr_preset = fast\r\n')
+
+    assert write_presets(str(config_path), {'fast': trial(mag_ratio=2.0)}, DEFAULTS)
+    assert config_path.read_bytes() == b'[RecZone]\r\nocr_preset = fast\r\n\r\n[OCRPreset:fast]\r\nmag_ratio = 2.0\r\n'
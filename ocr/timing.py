@@ -0,0 +1,143 @@
+"""
+Stage timing for the OCR pipeline
+StageTimer records monotonic nanosecond timings per stage and per zone for one
+parse; TimingHistograms keeps running log-scale histograms of every stage across
+parses so regressions show up without re-running the benchmark.
+"""
+
+import math
+import threading
+import time
+
+
+# Histogram buckets grow by 2^(1/4) (~19%) per step, so a percentile read from the
+# buckets is within ~19% of the true value; bucket 0 holds everything up to 1 µs
+BUCKETS_PER_DOUBLING = 4
+MIN_NS = 1000
+
+
+class StageTimer:
+    """Monotonic per-stage and per-zone timer for one parse_screenshot call"""
+
+    def __init__(self):
+        self.start = time.perf_counter_ns()
+        self.stage_start = self.start
+        self.stages = {}  # Stage -> nanoseconds (summed when a stage repeats)
+        self.zones = []   # [{'zone_index', stage: ns, ...}] in OCR order
+
+    def mark(self, stage):
+        """Charge the time since the previous mark to a stage"""
+        now = time.perf_counter_ns()
+        self.stages[stage] = self.stages.get(stage, 0) + now - self.stage_start
+        self.stage_start = now
+
+    def zone(self, zone_index):
+        """
+        Start timing one zone; later zone_mark calls are charged to it
+
+        Returns:
+            dict: The zone's timing record
+        """
+        record = {'zone_index': zone_index}
+        self.zones.append(record)
+        self.stage_start = time.perf_counter_ns()
+        return record
+
+    def zone_mark(self, stage):
+        """Charge the time since the previous mark to a stage of the current zone (and the stage total)"""
+        now = time.perf_counter_ns()
+        elapsed = now - self.stage_start
+        record = self.zones[-1]
+        record[stage] = record.get(stage, 0) + elapsed
+        self.stages[stage] = self.stages.get(stage, 0) + elapsed
+        self.stage_start = now
+
+    def finish(self):
+        """Record the total and return the stage dict"""
+        self.stages['total'] = time.perf_counter_ns() - self.start
+        return self.stages
+
+    def as_dict(self):
+        """Timings in the form returned alongside parsed data"""
+        return {'stages_ns': dict(self.stages), 'zones_ns': [dict(z) for z in self.zones]}
+
+    def summary(self):
+        """One-line stage breakdown in milliseconds"""
+        parts = [f"{stage} {ns / 1e6:.1f}" for stage, ns in self.stages.items() if stage != 'total']
+        total = self.stages.get('total')
+        if total is not None:
+            parts.append(f"total {total / 1e6:.1f}")
+        return ' | '.join(parts) + ' ms'
+
+
+class TimingHistograms:
+    """Running log-scale latency histograms per stage (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}  # Stage -> {'count', 'sum', 'min', 'max', 'buckets': {index: count}}
+
+    @staticmethod
+    def _bucket(ns):
+        if ns <= MIN_NS:
+            return 0
+        return int(math.log2(ns / MIN_NS) * BUCKETS_PER_DOUBLING) + 1
+
+    @staticmethod
+    def _bucket_upper(index):
+        return MIN_NS * 2 ** (index / BUCKETS_PER_DOUBLING)
+
+    def record(self, stages):
+        """
+        Add one parse's stage timings
+
+        Args:
+            stages: Stage -> nanoseconds
+        """
+        with self._lock:
+            for stage, ns in stages.items():
+                entry = self._stages.get(stage)
+                if entry is None:
+                    entry = self._stages[stage] = {'count': 0, 'sum': 0, 'min': ns, 'max': ns, 'buckets': {}}
+                entry['count'] += 1
+                entry['sum'] += ns
+                entry['min'] = min(entry['min'], ns)
+                entry['max'] = max(entry['max'], ns)
+                bucket = self._bucket(ns)
+                entry['buckets'][bucket] = entry['buckets'].get(bucket, 0) + 1
+
+    def _percentile(self, entry, q):
+        rank = max(1, math.ceil(q / 100.0 * entry['count']))
+        seen = 0
+        for index in sorted(entry['buckets']):
+            seen += entry['buckets'][index]
+            if seen >= rank:
+                # The bucket's upper bound, but never beyond the largest value seen
+                return min(self._bucket_upper(index), entry['max'])
+        return entry['max']
+
+    def snapshot(self):
+        """
+        Summaries of every stage in milliseconds
+
+        Returns:
+            dict: Stage -> {'count', 'mean', 'min', 'p50', 'p90', 'p99', 'max'}
+        """
+        with self._lock:
+            report = {}
+            for stage, entry in self._stages.items():
+                report[stage] = {
+                    'count': entry['count'],
+                    'mean': entry['sum'] / entry['count'] / 1e6,
+                    'min': entry['min'] / 1e6,
+                    'p50': self._percentile(entry, 50) / 1e6,
+                    'p90': self._percentile(entry, 90) / 1e6,
+                    'p99': self._percentile(entry, 99) / 1e6,
+                    'max': entry['max'] / 1e6,
+                }
+            return report
+
+    def reset(self):
+        """Forget all recorded timings"""
+        with self._lock:
+            self._stages = {}
@@ -0,0 +1,276 @@
+"""
+OCR parameter tuner
+Searches EasyOCR and zone preprocessing parameters on a labeled corpus (the same
+layout ocr.benchmark uses), reports the accuracy/latency Pareto front, and can
+write fast/balanced/accurate presets into config.ini as [OCRPreset:<name>]
+sections. Select one with `ocr_preset = <name>` under [RecZone].
+
+Usage (from the project root):
+    python -m ocr.tuner ocr/synth_corpus --trials 40 --limit 50 --write-config config.ini
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import re
+import sys
+from datetime import datetime
+
+from ocr.benchmark import load_corpus, run_benchmark
+
+
+# Candidate values per parameter; every trial samples one value for each
+SEARCH_SPACE = {
+    'target_zone_height': [32, 48, 64, 96],
+    'clahe_clip': [1.0, 2.0, 3.0],
+    'clahe_tile': [4, 8],
+    'text_threshold': [0.4, 0.5, 0.6, 0.7],
+    'low_text': [0.2, 0.3, 0.4],
+    'link_threshold': [0.2, 0.3, 0.4],
+    'canvas_size': [1280, 2560, 4096],
+    'mag_ratio': [1.0, 1.5, 2.0],
+    'contrast_ths': [0.05, 0.1, 0.3],
+    'adjust_contrast': [0.5, 0.8],
+    'min_confidence': [0.2, 0.3, 0.4],
+    'digit_min_confidence': [0.2, 0.35, 0.5],
+}
+
+# Accuracy a preset may give up relative to the most accurate trial
+PRESET_TOLERANCE = {'accurate': 0.0, 'balanced': 0.01, 'fast': 0.05}
+
+
+def sample_params(rng, defaults):
+    """One random point of the search space (unlisted parameters keep their defaults)"""
+    params = dict(defaults)
+    for key, values in SEARCH_SPACE.items():
+        params[key] = rng.choice(values)
+    return params
+
+
+def pareto_front(trials):
+    """
+    Trials that no other trial beats on both accuracy and latency
+
+    Returns:
+        list: Front trials sorted by latency (fastest first)
+    """
+    front = []
+    for trial in trials:
+        dominated = any(
+            other['accuracy'] >= trial['accuracy'] and other['latency_ms'] <= trial['latency_ms']
+            and (other['accuracy'] > trial['accuracy'] or other['latency_ms'] < trial['latency_ms'])
+            for other in trials
+        )
+        if not dominated:
+            front.append(trial)
+    return sorted(front, key=lambda t: t['latency_ms'])
+
+
+def choose_presets(front):
+    """
+    Pick the fastest front trial within each preset's accuracy tolerance
+
+    Returns:
+        dict: Preset name -> trial
+    """
+    if not front:
+        return {}
+    best = max(t['accuracy'] for t in front)
+    presets = {}
+    for name, tolerance in PRESET_TOLERANCE.items():
+        eligible = [t for t in front if t['accuracy'] >= best - tolerance - 1e-9]
+        presets[name] = min(eligible, key=lambda t: t['latency_ms'])
+    return presets
+
+
+SECTION_HEADER = re.compile(r'^\s*\[([^\]]+)\]')
+OPTION_LINE = re.compile(r'^\s*([^#;\s\[][^=:]*?)\s*[=:]')
+
+
+def update_config_sections(lines, sections, newline='\n'):
+    """
+    Set the keys of INI sections in place, line by line
+    Other sections, comments and formatting are left untouched; within a section,
+    existing keys are rewritten where they stand, keys that are no longer set are
+    removed and new ones are added after the section's last key
+
+    Args:
+        lines: Config file lines (with line endings)
+        sections: Section name -> {key: value} it should hold
+        newline: Line ending for added lines
+
+    Returns:
+        list: Updated lines
+    """
+    lines = list(lines)
+    for section, values in sections.items():
+        values = {key.lower(): str(value) for key, value in values.items()}
+        headers = [i for i, line in enumerate(lines) if SECTION_HEADER.match(line)]
+        start = next((i for i in headers if SECTION_HEADER.match(lines[i]).group(1).strip() == section), None)
+
+        if start is None:
+            # New section at the end of the file, after a blank line
+            if lines and not lines[-1].endswith(('\n', '\r')):
+                lines[-1] += newline
+            if lines and lines[-1].strip():
+                lines.append(newline)
+            lines.append(f'[{section}]{newline}')
+            lines.extend(f'{key} = {value}{newline}' for key, value in values.items())
+            continue
+
+        end = next((i for i in headers if i > start), len(lines))
+        body = []
+        written = set()
+        for line in lines[start + 1:end]:
+            match = OPTION_LINE.match(line)
+            key = match.group(1).strip().lower() if match else None
+            if key is None:
+                body.append(line)
+            elif key in values and key not in written:
+                body.append(f'{key} = {values[key]}{newline}')
+                written.add(key)
+            # Keys the preset no longer sets (and duplicates) are dropped
+
+        # New keys go after the last key, before trailing blank lines and comments
+        insert_at = max((i + 1 for i, line in enumerate(body) if OPTION_LINE.match(line)), default=0)
+        added = [f'{key} = {value}{newline}' for key, value in values.items() if key not in written]
+        body[insert_at:insert_at] = added
+        lines[start + 1:end] = body
+    return lines
+
+
+def write_presets(config_path, presets, defaults):
+    """
+    Store presets as [OCRPreset:<name>] sections (only values that differ from the defaults)
+    Only those sections are edited, so hand-written comments and formatting in the
+    rest of the config survive
+
+    Returns:
+        bool: True if written successfully
+    """
+    try:
+        lines = []
+        if os.path.exists(config_path):
+            with open(config_path, 'r', encoding='utf-8', newline='') as f:
+                lines = f.readlines()
+        newline = '\r\n' if lines and lines[0].endswith('\r\n') else '\n'
+
+        sections = {
+            f'OCRPreset:{name}': {key: value for key, value in trial['params'].items() if value != defaults.get(key)}
+            for name, trial in presets.items()
+        }
+        lines = update_config_sections(lines, sections, newline)
+
+        temp_path = config_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(lines)
+        os.replace(temp_path, config_path)
+        return True
+    except Exception as e:
+        print(f"Error writing presets to {config_path}: {e}")
+        return False
+
+
+async def run_trials(parser, samples, param_sets, warmup=1):
+    """
+    Benchmark each parameter set with one shared parser (the EasyOCR model loads once)
+
+    Returns:
+        list: Trial dicts with params, accuracy, latency_ms (p50 total) and p95_ms
+    """
+    trials = []
+    for number, params in enumerate(param_sets, 1):
+        parser.ocr_params = params
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = await run_benchmark(parser, samples, warmup=warmup)
+        total = report['latency_ms'].get('total', {})
+        trial = {
+            'trial': number,
+            'params': params,
+            'accuracy': report['field_accuracy'] or 0.0,
+            'latency_ms': total.get('p50', 0.0),
+            'p95_ms': total.get('p95', 0.0),
+        }
+        trials.append(trial)
+        print(f"  Trial {number}/{len(param_sets)}: accuracy {trial['accuracy']:.1%}, "
+              f"p50 {trial['latency_ms']:.1f} ms, p95 {trial['p95_ms']:.1f} ms")
+        # Only the first trial needs a model warm-up
+        warmup = 0
+    return trials
+
+
+def main(argv=None):
+    """Command line entry point"""
+    arg_parser = argparse.ArgumentParser(prog='python -m ocr.tuner', description='Search OCR parameters on a labeled corpus')
+    arg_parser.add_argument('corpus', help='Directory of screenshots with ground-truth JSON')
+    arg_parser.add_argument('--trials', type=int, default=30, help='Random parameter sets to try (plus the defaults)')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--limit', type=int, help='Only use the first N samples')
+    arg_parser.add_argument('--mask', default='ocr/zones.png', help='Zone mask passed to OCRParser')
+    arg_parser.add_argument('--output', default='ocr_tuning_report.json', help='Where to write the JSON report')
+    arg_parser.add_argument('--write-config', metavar='CONFIG', help='Write fast/balanced/accurate presets into this config.ini')
+    args = arg_parser.parse_args(argv)
+
+    samples = load_corpus(args.corpus)
+    if args.limit:
+        samples = samples[:args.limit]
+    if not samples:
+        print(f"❌ No labeled screenshots found in {args.corpus}")
+        return 1
+
+    from ocr.parser import DEFAULT_OCR_PARAMS, OCRParser
+    parser = OCRParser(debug_output=False, mask_path=args.mask, zone_cache_size=0)
+
+    rng = random.Random(args.seed)
+    param_sets = [dict(DEFAULT_OCR_PARAMS)]
+    seen = {json.dumps(param_sets[0], sort_keys=True)}
+    attempts = 0
+    while len(param_sets) < args.trials + 1 and attempts < args.trials * 20:
+        attempts += 1
+        params = sample_params(rng, DEFAULT_OCR_PARAMS)
+        key = json.dumps(params, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            param_sets.append(params)
+
+    print(f"🎛 Tuning on {len(samples)} screenshot(s): {len(param_sets)} parameter sets (trial 1 = current defaults)")
+    trials = asyncio.run(run_trials(parser, samples, param_sets))
+
+    front = pareto_front(trials)
+    presets = choose_presets(front)
+
+    print("\n" + "=" * 60)
+    print("Pareto front (fastest first):")
+    for trial in front:
+        print(f"  Trial {trial['trial']:>3}: accuracy {trial['accuracy']:.1%}, p50 {trial['latency_ms']:.1f} ms")
+    print("\nPresets:")
+    for name, trial in presets.items():
+        print(f"  {name:<9} trial {trial['trial']} ({trial['accuracy']:.1%}, p50 {trial['latency_ms']:.1f} ms)")
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'corpus': args.corpus,
+        'images': len(samples),
+        'seed': args.seed,
+        'trials': trials,
+        'pareto_front': [t['trial'] for t in front],
+        'presets': {name: trial['trial'] for name, trial in presets.items()},
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Report saved: {args.output}")
+
+    if args.write_config:
+        if write_presets(args.write_config, presets, DEFAULT_OCR_PARAMS):
+            print(f"✅ Presets written to {args.write_config} - set 'ocr_preset' under [RecZone] to use one")
+        else:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Zone schema for the OCR mask
+Labels every white region of zones.png with its role (header, time, victory, name,
+score, kills, deaths, assists, playtime) and player slot, and stores the result in
+a JSON sidecar next to the mask (zones.png -> zones.json). The parser reads each
+zone's role from the schema instead of guessing it from positions at parse time.
+
+The schema is generated once from the mask geometry and can be edited by hand
+(e.g. to mark a zone as playtime). Regenerate after changing the mask:
+    python -m ocr.zone_schema ocr/zones.png
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import cv2
+
+
+SCHEMA_VERSION = 1
+STAT_ROLES = ('score', 'kills', 'deaths', 'assists', 'playtime')
+ROLES = ('header', 'time', 'victory', 'name') + STAT_ROLES + ('other',)
+
+
+def schema_path_for(mask_path):
+    """Sidecar path of a mask (zones.png -> zones.json)"""
+    return Path(mask_path).with_suffix('.json')
+
+
+def build_zone_schema(mask):
+    """
+    Label the zones of a mask from its geometry
+
+    Stat zones are below 70% of the height and split into players at horizontal
+    gaps; the name row sits above them; of the remaining top zones the largest is
+    the VICTORY banner, the leftmost the mode header and the rightmost the match time
+
+    Args:
+        mask: Grayscale mask (white regions = zones)
+
+    Returns:
+        dict: Schema with 'version', 'mask_size' and 'zones', or None if the layout isn't recognised
+    """
+    height, width = mask.shape[:2]
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    boxes = [cv2.boundingRect(c) for c in contours]
+    return label_zone_boxes(boxes, width, height)
+
+
+def label_zone_boxes(boxes, width, height):
+    """
+    Assign roles and player slots to zone bounding boxes (see build_zone_schema)
+
+    Args:
+        boxes: (x, y, w, h) tuples in mask pixels
+        width: Mask width
+        height: Mask height
+
+    Returns:
+        dict: Schema, or None if the layout isn't recognised
+    """
+    boxes = [tuple(b) for b in boxes if b[2] > 10 and b[3] > 10]
+
+    stat_boxes = sorted((b for b in boxes if b[1] > height * 0.7), key=lambda b: b[0])
+    upper = [b for b in boxes if b[1] <= height * 0.7]
+    if not stat_boxes or len(upper) < 4:
+        print(f"⚠ Unexpected mask layout: {len(upper)} upper zones, {len(stat_boxes)} stat zones")
+        return None
+
+    name_y = max(b[1] for b in upper)
+    name_boxes = sorted((b for b in upper if abs(b[1] - name_y) < height * 0.05), key=lambda b: b[0])
+    top = [b for b in upper if b not in name_boxes]
+
+    # > 150px (at 1080p) between neighbouring stat zones starts a new player
+    gap = 150 * height / 1080
+    groups = []
+    for box in stat_boxes:
+        if groups and box[0] - groups[-1][-1][0] <= gap:
+            groups[-1].append(box)
+        else:
+            groups.append([box])
+
+    if len(groups) != len(name_boxes) or any(len(g) > len(STAT_ROLES) for g in groups) or len(top) < 3:
+        print(f"⚠ Unexpected mask layout: {len(top)} top zones, {len(name_boxes)} names, {len(groups)} stat groups")
+        return None
+
+    zones = []
+
+    def add(box, role, slot=None):
+        x, y, w, h = box
+        zones.append({'role': role, 'slot': slot, 'x': x, 'y': y, 'width': w, 'height': h})
+
+    victory = max(top, key=lambda b: b[2] * b[3])
+    rest = sorted((b for b in top if b != victory), key=lambda b: b[0])
+    add(rest[0], 'header')
+    add(rest[-1], 'time')
+    add(victory, 'victory')
+    for box in rest[1:-1]:
+        add(box, 'other')
+
+    for slot, (name_box, group) in enumerate(zip(name_boxes, groups)):
+        add(name_box, 'name', slot)
+        for role, box in zip(STAT_ROLES, group):
+            add(box, role, slot)
+
+    zones.sort(key=lambda z: (z['y'], z['x']))
+    zones = [dict(index=index, **zone) for index, zone in enumerate(zones)]
+
+    return {'version': SCHEMA_VERSION, 'mask_size': [width, height], 'zones': zones}
+
+
+def load_zone_schema(mask_path):
+    """
+    Load the schema sidecar of a mask
+
+    Returns:
+        dict: Schema, or None if there is no (valid) sidecar
+    """
+    path = schema_path_for(mask_path)
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+        unknown = {z['role'] for z in schema['zones']} - set(ROLES)
+        if unknown:
+            print(f"⚠ Unknown zone role(s) in {path}: {', '.join(sorted(unknown))}")
+            return None
+        return schema
+    except Exception as e:
+        print(f"Error loading zone schema {path}: {e}")
+        return None
+
+
+def save_zone_schema(schema, path):
+    """Write a schema as indented JSON (one zone per line for easy hand edits)"""
+    lines = [json.dumps(zone, separators=(', ', ': ')) for zone in schema['zones']]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n')
+        f.write(f'  "version": {schema["version"]},\n')
+        f.write(f'  "mask_size": {json.dumps(schema["mask_size"])},\n')
+        f.write('  "zones": [\n    ' + ',\n    '.join(lines) + '\n  ]\n}\n')
+
+
+def scale_zones(schema, width, height):
+    """
+    Zone boxes of a schema scaled to an image size
+
+    Returns:
+        list: Zone dicts (index, role, slot, x, y, width, height, area) in schema order
+    """
+    mask_w, mask_h = schema['mask_size']
+    sx, sy = width / mask_w, height / mask_h
+    zones = []
+    for zone in schema['zones']:
+        x, y = round(zone['x'] * sx), round(zone['y'] * sy)
+        w, h = max(1, round(zone['width'] * sx)), max(1, round(zone['height'] * sy))
+        zones.append({
+            'index': zone['index'],
+            'role': zone['role'],
+            'slot': zone.get('slot'),
+            'x': x,
+            'y': y,
+            'width': w,
+            'height': h,
+            'area': w * h
+        })
+    return zones
+
+
+def place_zones(schema, scale, offset_x=0, offset_y=0):
+    """
+    Zone boxes of a schema placed with one uniform scale and an offset, for frames
+    whose aspect ratio differs from the mask's (the game scales its UI with the
+    height, so stretching the mask would move the zones)
+
+    Args:
+        schema: Zone schema
+        scale: Image pixels per mask pixel
+        offset_x: Image x of the mask's left edge
+        offset_y: Image y of the mask's top edge
+
+    Returns:
+        list: Zone dicts as from scale_zones (coordinates may fall outside the image)
+    """
+    zones = []
+    for zone in schema['zones']:
+        w, h = max(1, round(zone['width'] * scale)), max(1, round(zone['height'] * scale))
+        zones.append({
+            'index': zone['index'],
+            'role': zone['role'],
+            'slot': zone.get('slot'),
+            'x': round(offset_x + zone['x'] * scale),
+            'y': round(offset_y + zone['y'] * scale),
+            'width': w,
+            'height': h,
+            'area': w * h
+        })
+    return zones
+
+
+def main(argv=None):
+    """Generate the schema sidecar for a mask"""
+    argv = sys.argv[1:] if argv is None else argv
+    mask_path = argv[0] if argv else 'ocr/zones.png'
+
+    mask = cv2.imread(str(mask_path), cv2.IMREAD_GRAYSCALE)
+    if mask is None:
+        print(f"❌ Mask file not found: {mask_path}")
+        return 1
+
+    schema = build_zone_schema(mask)
+    if schema is None:
+        print("❌ Could not label the mask zones - write the schema by hand")
+        return 1
+
+    path = schema_path_for(mask_path)
+    save_zone_schema(schema, path)
+    for zone in schema['zones']:
+        slot = '' if zone['slot'] is None else f" (player {zone['slot'] + 1})"
+        print(f"  Zone {zone['index']:>2}: {zone['role']:<8}{slot} at ({zone['x']}, {zone['y']}) {zone['width']}x{zone['height']}")
+    print(f"✅ Zone schema saved: {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())